@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class CancelToken(QObject):
+    """ Cancellation token of a settled text, it can be checked from another thread """
+
+    cancelled = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._isCancelled = False
+
+    def isCancelled(self):
+        return self._isCancelled
+
+    def cancel(self):
+        if self._isCancelled:
+            return
+
+        self._isCancelled = True
+        self.cancelled.emit()
+
+
+class TextDebouncer(QObject):
+    """ Coalesces the text changes of an input
+
+    `settled` is emitted after the text stops changing for `delay` milliseconds, or
+    at most `maxWait` milliseconds after the first change. The token of previous
+    emission is cancelled when the text changes again.
+    """
+
+    settled = Signal(str, object)   # text, CancelToken
+
+    def __init__(self, delay=300, maxWait=1000, parent=None):
+        """
+        Parameters
+        ----------
+        delay: int
+            the milliseconds without changes before the text is settled
+
+        maxWait: int
+            the maximum milliseconds a changing text is delayed, no limit if it is not positive
+
+        parent: QObject
+            parent object
+        """
+        super().__init__(parent=parent)
+        self._text = None       # 待发出的文本
+        self._settledText = None
+        self._token = None
+
+        self._delayTimer = QTimer(self)
+        self._delayTimer.setSingleShot(True)
+        self._delayTimer.timeout.connect(self.flush)
+
+        self._maxWaitTimer = QTimer(self)
+        self._maxWaitTimer.setSingleShot(True)
+        self._maxWaitTimer.timeout.connect(self.flush)
+
+        self.setDelay(delay, maxWait)
+
+    def delay(self):
+        return self._delayTimer.interval()
+
+    def maxWait(self):
+        return self._maxWait
+
+    def setDelay(self, delay: int, maxWait: int = None):
+        """ set the delay and maximum wait in milliseconds, `maxWait` is kept if it is `None` """
+        self._delayTimer.setInterval(max(0, delay))
+        if maxWait is not None:
+            self._maxWait = maxWait
+            self._maxWaitTimer.setInterval(max(0, maxWait))
+
+    def isPending(self):
+        return self._text is not None
+
+    def push(self, text: str):
+        """ a new text, the settled text is emitted after the delay """
+        if self._token is not None and text != self._settledText:
+            self._token.cancel()
+            self._token = None
+
+        self._text = text
+        self._delayTimer.start()
+        if self._maxWait > 0 and not self._maxWaitTimer.isActive():
+            self._maxWaitTimer.start()
+
+    def flush(self):
+        """ emit the pending text now """
+        self._delayTimer.stop()
+        self._maxWaitTimer.stop()
+        if self._text is None:
+            return
+
+        text, self._text = self._text, None
+        if self._token is not None:
+            # the text is changed back to the settled one, its work goes on
+            if text == self._settledText:
+                return
+
+            self._token.cancel()
+
+        # the token is owned by consumers, so it is not a child of debouncer
+        self._settledText = text
+        self._token = CancelToken()
+        self.settled.emit(text, self._token)
+
+    def cancel(self):
+        """ drop the pending text and cancel the token of last settled text """
+        self._delayTimer.stop()
+        self._maxWaitTimer.stop()
+        self._text = None
+        self._settledText = None
+        if self._token is not None:
+            self._token.cancel()
+            self._token = None
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Iterable, List
+
+from PySide6.QtCore import QObject, QTimer, QCoreApplication
+
+
+class MRUStore(QObject):
+    """ Most recently used list, e.g. the recent files
+
+    If `path` is given, a change is saved to it as a json list after `saveDelay`
+    milliseconds, the file is replaced atomically.
+    """
+
+    def __init__(self, maxCount=10, path: str = None, saveDelay=1000, parent=None):
+        super().__init__(parent=parent)
+        self.maxCount = maxCount
+        self.path = path
+        self._entries = OrderedDict()   # entry -> None, the most recent one is the last
+
+        self._saveTimer = QTimer(self)
+        self._saveTimer.setSingleShot(True)
+        self._saveTimer.setInterval(saveDelay)
+        self._saveTimer.timeout.connect(self.save)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, entry):
+        return entry in self._entries
+
+    def items(self) -> List[str]:
+        """ Returns the entries, the most recent one first """
+        return list(reversed(self._entries))
+
+    def first(self):
+        """ Returns the most recent entry, `None` if there is no entry """
+        return next(reversed(self._entries), None)
+
+    def touch(self, entry: str) -> List[str]:
+        """ move or add the entry to the front, returns the evicted entries """
+        if entry in self._entries:
+            self._entries.move_to_end(entry)
+        else:
+            self._entries[entry] = None
+
+        self._scheduleSave()
+        return self._evict()
+
+    def remove(self, entry: str):
+        if entry in self._entries:
+            del self._entries[entry]
+            self._scheduleSave()
+
+    def clear(self):
+        self._entries.clear()
+        self._scheduleSave()
+
+    def setItems(self, entries: Iterable[str]):
+        """ replace the entries, the most recent one first, returns the evicted entries """
+        self._entries = OrderedDict((entry, None) for entry in reversed(list(entries)))
+        self._scheduleSave()
+        return self._evict()
+
+    def setMaxCount(self, maxCount: int) -> List[str]:
+        """ set the maximum number of entries, returns the evicted entries """
+        self.maxCount = max(0, maxCount)
+        evicted = self._evict()
+        if evicted:
+            self._scheduleSave()
+
+        return evicted
+
+    def setSaveDelay(self, delay: int):
+        self._saveTimer.setInterval(max(0, delay))
+
+    def isSavePending(self):
+        return self._saveTimer.isActive()
+
+    def load(self):
+        """ load the entries from file, a missing or broken file gives an empty list """
+        self._saveTimer.stop()
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                entries = json.load(f)
+        except (TypeError, OSError, ValueError):
+            entries = []
+
+        if not isinstance(entries, list):
+            entries = []
+
+        self._entries = OrderedDict((str(e), None) for e in reversed(entries))
+        self._evict()
+
+    def save(self):
+        """ write the entries to file now """
+        self._saveTimer.stop()
+        if not self.path:
+            return
+
+        folder = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(folder, exist_ok=True)
+
+        # write a temporary file in the same folder, then replace the file by it
+        fd, tmpPath = tempfile.mkstemp(prefix=".mru-", suffix=".tmp", dir=folder)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.items(), f, ensure_ascii=False)
+
+            os.replace(tmpPath, self.path)
+        except BaseException:
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+            raise
+
+    def flush(self):
+        """ write the pending change now """
+        if self._saveTimer.isActive():
+            self.save()
+
+    def _scheduleSave(self):
+        # the timer is not restarted, so a long burst of changes is saved periodically
+        if self.path and not self._saveTimer.isActive():
+            self._saveTimer.start()
+
+    def _evict(self):
+        evicted = []
+        while len(self._entries) > self.maxCount:
+            evicted.append(self._entries.popitem(last=False)[0])
+
+        return evicted
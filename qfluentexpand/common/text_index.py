@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable, Iterator, List
+
+
+class TextIndex:
+    """ Hash and sorted prefix index over the texts of a list
+
+    `find()` takes O(1) and a prefix lookup O(log n + k). Inserting or removing a
+    middle row takes O(n) like the list it mirrors, the hash is rebuilt lazily.
+    """
+
+    def __init__(self, texts: Iterable[str] = ()):
+        self._texts = []        # type: List[str]
+        self._rows = {}         # text -> ascending rows
+        self._keys = []         # sorted case folded texts
+        self._keyRows = []      # rows of `_keys`
+        self._isDirty = False
+        self._isSorted = True
+        self.reset(texts)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def reset(self, texts: Iterable[str] = ()):
+        """ rebuild the index from texts """
+        self._texts = [str(text) for text in texts]
+        self._isDirty = True
+        self._isSorted = False
+
+    def clear(self):
+        self._texts.clear()
+        self._rows.clear()
+        self._keys.clear()
+        self._keyRows.clear()
+        self._isDirty = False
+        self._isSorted = True
+
+    def append(self, text: str):
+        self.insert(len(self._texts), text)
+
+    def extend(self, texts: Iterable[str]):
+        """ append texts, the hash is updated in one pass """
+        for text in texts:
+            text = str(text)
+            if not self._isDirty:
+                self._rows.setdefault(text, []).append(len(self._texts))
+
+            self._texts.append(text)
+
+        self._isSorted = False
+
+    def insert(self, row: int, text: str):
+        """ insert text at the given row, O(n) unless it is the last row """
+        text = str(text)
+        row = max(0, min(row, len(self._texts)))
+        self._texts.insert(row, text)
+        if self._isSorted:
+            if row != len(self._texts) - 1:
+                self._keyRows = [r + 1 if r >= row else r for r in self._keyRows]
+
+            self._insertKey(text, row)
+
+        if row != len(self._texts) - 1:
+            self._isDirty = True
+        elif not self._isDirty:
+            self._rows.setdefault(text, []).append(row)
+
+    def remove(self, row: int):
+        """ remove the text at the given row, O(n) unless it is the last row """
+        if not 0 <= row < len(self._texts):
+            return
+
+        text = self._texts.pop(row)
+        if self._isSorted:
+            self._removeKey(text, row)
+            if row != len(self._texts):
+                self._keyRows = [r - 1 if r > row else r for r in self._keyRows]
+
+        if row != len(self._texts):
+            self._isDirty = True
+        elif not self._isDirty:
+            self._removeRow(text, row)
+
+    def setText(self, row: int, text: str):
+        """ replace the text at the given row """
+        if not 0 <= row < len(self._texts):
+            return
+
+        text = str(text)
+        old = self._texts[row]
+        self._texts[row] = text
+        if old == text:
+            return
+
+        if self._isSorted:
+            self._removeKey(old, row)
+            self._insertKey(text, row)
+
+        if not self._isDirty:
+            self._removeRow(old, row)
+            insort(self._rows.setdefault(text, []), row)
+
+    def find(self, text: str) -> int:
+        """ Returns the first row whose text is `text`, otherwise returns -1 """
+        self._ensureHash()
+        rows = self._rows.get(text)
+        return rows[0] if rows else -1
+
+    def prefixRows(self, prefix: str, limit: int = -1) -> List[int]:
+        """ Returns the rows whose text starts with `prefix` case insensitively, ordered by text,
+        `limit` is the maximum number of rows, `-1` means no limit
+        """
+        rows = []
+        for row in self.iterPrefixRows(prefix):
+            if len(rows) == limit:
+                break
+
+            rows.append(row)
+
+        return rows
+
+    def iterPrefixRows(self, prefix: str) -> Iterator[int]:
+        """ Iterate over the rows of `prefixRows()` lazily """
+        self._ensureSorted()
+        key = prefix.casefold()
+        keys, keyRows = self._keys, self._keyRows
+        for i in range(bisect_left(keys, key), len(keys)):
+            if not keys[i].startswith(key):
+                return
+
+            yield keyRows[i]
+
+    def prefixTexts(self, prefix: str, limit: int = -1) -> List[str]:
+        """ Returns the texts which start with `prefix`, case insensitive """
+        return [self._texts[i] for i in self.prefixRows(prefix, limit)]
+
+    def _removeRow(self, text: str, row: int):
+        rows = self._rows[text]
+        rows.remove(row)
+        if not rows:
+            del self._rows[text]
+
+    def _insertKey(self, text: str, row: int):
+        """ insert the key of row into the sorted list, the equal keys are ordered by row """
+        key = text.casefold()
+        i = bisect_left(self._keys, key)
+        end = bisect_right(self._keys, key, i)
+        while i < end and self._keyRows[i] < row:
+            i += 1
+
+        self._keys.insert(i, key)
+        self._keyRows.insert(i, row)
+
+    def _removeKey(self, text: str, row: int):
+        key = text.casefold()
+        i = bisect_left(self._keys, key)
+        while self._keyRows[i] != row:
+            i += 1
+
+        del self._keys[i]
+        del self._keyRows[i]
+
+    def _ensureHash(self):
+        if not self._isDirty:
+            return
+
+        self._rows = {}
+        for row, text in enumerate(self._texts):
+            self._rows.setdefault(text, []).append(row)
+
+        self._isDirty = False
+
+    def _ensureSorted(self):
+        if self._isSorted:
+            return
+
+        pairs = sorted((text.casefold(), row) for row, text in enumerate(self._texts))
+        self._keys = [key for key, _ in pairs]
+        self._keyRows = [row for _, row in pairs]
+        self._isSorted = True
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QFontMetrics, QGuiApplication
+
+
+class TextMetricsCache:
+    """ Bounded LRU cache of text widths and elided texts
+
+    The cache is cleared when the application font or the screen dpi changes.
+    """
+
+    def __init__(self, maxSize=4096):
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()   # key -> width or elided text
+        self._metrics = {}              # QFont -> QFontMetrics
+        self._isWatching = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def setMaxSize(self, maxSize: int):
+        """ set the maximum number of cached entries, the least recently used ones are dropped """
+        self.maxSize = max(0, maxSize)
+        while len(self._entries) > self.maxSize:
+            self._entries.popitem(last=False)
+
+    def stats(self):
+        """ Returns the counters of cache, e.g. `{'hits': 10, 'misses': 2, 'size': 2}` """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+    def resetStats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """ drop the cached metrics, e.g. the font or dpi is changed """
+        self._entries.clear()
+        self._metrics.clear()
+
+    def fontMetrics(self, font: QFont) -> QFontMetrics:
+        """ Returns the shared font metrics of font """
+        fm = self._metrics.get(font)
+        if fm is None:
+            self._watchApplication()
+            fm = self._metrics[QFont(font)] = QFontMetrics(font)
+
+        return fm
+
+    def width(self, font: QFont, text: str) -> int:
+        """ Returns the width of the bounding rect of text """
+        key = (0, font, text)
+        return self._get(key, lambda: self.fontMetrics(font).boundingRect(text).width())
+
+    def horizontalAdvance(self, font: QFont, text: str) -> int:
+        """ Returns the horizontal advance of text """
+        key = (1, font, text)
+        return self._get(key, lambda: self.fontMetrics(font).horizontalAdvance(text))
+
+    def elidedText(self, font: QFont, text: str, width: int, mode=Qt.TextElideMode.ElideRight) -> str:
+        """ Returns the text elided to fit in width """
+        width = int(width)
+        key = (2, font, text, width, mode)
+        return self._get(key, lambda: self.fontMetrics(font).elidedText(text, mode, width))
+
+    def _get(self, key, measure):
+        try:
+            value = self._entries[key]
+        except KeyError:
+            # the font is copied, so the key is not changed by the caller
+            self.misses += 1
+            value = measure()
+            self._entries[(key[0], QFont(key[1])) + key[2:]] = value
+            if len(self._entries) > self.maxSize:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+
+        return value
+
+    def _watchApplication(self):
+        if self._isWatching:
+            return
+
+        app = QGuiApplication.instance()
+        if app is None:
+            return
+
+        self._isWatching = True
+        app.fontChanged.connect(self.clear)
+        app.screenAdded.connect(self._watchScreen)
+        app.screenRemoved.connect(self.clear)
+        app.primaryScreenChanged.connect(self.clear)
+        for screen in app.screens():
+            self._watchScreen(screen)
+
+    def _watchScreen(self, screen):
+        screen.logicalDotsPerInchChanged.connect(self.clear)
+        screen.physicalDotsPerInchChanged.connect(self.clear)
+        self.clear()
+
+
+textMetrics = TextMetricsCache()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import asyncio
+import threading
+
+from PySide6.QtCore import QObject, QCoreApplication, QThreadPool, Signal
+
+
+def runningLoop():
+    """ Returns the running event loop of current thread, `None` if no loop is running """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class CancelFlag:
+    """ Cancellation flag of a work, it is checked by the worker thread """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def isCancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        self._event.set()
+
+
+class WorkerRelay(QObject):
+    """ Posts the values of a worker thread to GUI thread
+
+    The relay belongs to the application instead of the receiver, so a worker can
+    post to it after the receiver is deleted. Call `close()` when the work is done.
+    """
+
+    posted = Signal(object)
+
+    def __init__(self):
+        super().__init__(QCoreApplication.instance())
+
+    def post(self, value):
+        self.posted.emit(value)
+
+    def close(self):
+        """ delete the relay in GUI thread, the values posted before are still delivered """
+        self.deleteLater()
+
+
+class _CoroutineJob:
+    """ A coroutine run by `CoroutineRunner`, the worker only touches the job """
+
+    def __init__(self, coro):
+        self.coro = coro
+        self.relay = WorkerRelay()
+        self._lock = threading.Lock()
+        self._loop = None
+        self._task = None
+        self._isCancelled = False
+
+    def startTask(self, loop):
+        """ run the coroutine on a running loop of GUI thread """
+        with self._lock:
+            self._loop = loop
+            self._task = loop.create_task(self.coro)
+            self._task.add_done_callback(self._onTaskDone)
+
+    def runInThread(self):
+        """ run the coroutine on a new loop of the worker thread """
+        with self._lock:
+            if self._isCancelled:
+                self.coro.close()
+                self.relay.close()
+                return
+
+            self._loop = asyncio.new_event_loop()
+            self._task = self._loop.create_task(self.coro)
+
+        try:
+            result = self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            self.relay.close()
+            return
+        except Exception as e:
+            self._finish(False, str(e))
+            return
+        finally:
+            with self._lock:
+                self._loop.close()
+
+        # the objects created by the worker belong to GUI thread before they are used
+        thread = self.relay.thread()
+        for value in result if isinstance(result, (list, tuple)) else (result,):
+            if isinstance(value, QObject):
+                value.moveToThread(thread)
+
+        self._finish(True, result)
+
+    def cancel(self):
+        with self._lock:
+            self._isCancelled = True
+            if self._task is None or self._loop.is_closed():
+                return
+
+            try:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+            except RuntimeError:
+                pass    # the loop is closed, the task is done
+
+    def _onTaskDone(self, task: asyncio.Task):
+        if task.cancelled():
+            self.relay.close()
+        elif task.exception() is not None:
+            self._finish(False, str(task.exception()))
+        else:
+            self._finish(True, task.result())
+
+    def _finish(self, isOk: bool, value):
+        self.relay.post((self, isOk, value))
+        self.relay.close()
+
+
+class CoroutineRunner(QObject):
+    """ Runs a coroutine on the running event loop, or on a new loop in a worker thread
+
+    `finished` and `failed` are emitted in GUI thread, the result of a cancelled
+    run is dropped.
+    """
+
+    finished = Signal(object)   # result
+    failed = Signal(str)        # error
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._job = None
+
+    def isRunning(self):
+        return self._job is not None
+
+    def run(self, coro):
+        """ run the coroutine, the one in progress is cancelled """
+        self.cancel()
+        job = self._job = _CoroutineJob(coro)
+        job.relay.posted.connect(self._onJobPosted)
+
+        loop = runningLoop()
+        if loop is not None:
+            job.startTask(loop)
+        else:
+            QThreadPool.globalInstance().start(job.runInThread)
+
+    def cancel(self):
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
+
+    def _onJobPosted(self, value):
+        job, isOk, result = value
+        if job is not self._job:
+            return
+
+        self._job = None
+        if isOk:
+            self.finished.emit(result)
+        else:
+            self.failed.emit(result)
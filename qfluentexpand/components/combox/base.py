@@ -7,6 +7,7 @@ email: nbxlc@hotmail.com
 
 
 import sys
+from enum import Enum
 from typing import Union, List, Iterable
 
 from PySide6.QtCore import Qt, Signal, QRectF, QPoint, QObject, QEvent, QTimer
@@ -16,14 +17,25 @@ from PySide6.QtWidgets import (
 )
 
 from qfluentwidgets import MenuAnimationType, IndicatorMenuItemDelegate
+from qfluentwidgets.components.widgets.menu import MenuAnimationManager
 from qfluentwidgets.common.icon import FluentIconBase, isDarkTheme
 from qfluentwidgets.common.icon import FluentIcon as FIF, Icon
 from qfluentwidgets.common.overload import singledispatchmethod
+from qfluentwidgets.common.screen import getCurrentScreenGeometry
 
 from qfluentexpand.components.menu.menu import RoundMenu
+from qfluentexpand.components.combox.view import ComboListView, ComboGridView
 
 
 
+class DropDownMode(Enum):
+    """ Drop down mode of combo box """
+
+    WIDGET = 0      # one widget per item
+    VIEW = 1        # model/view, rows are painted by delegate
+    GRID = 2        # model/view, items are painted in the cells of a grid
+
+
 class Action(QWidgetAction):
 
     @singledispatchmethod
@@ -74,6 +86,89 @@ class ComboBoxMenu(RoundMenu):
         self.setItemHeight(33)
 
     def exec(self, pos, ani=True, aniType=MenuAnimationType.DROP_DOWN):
+        self._beginPopupTiming()
         self.view.adjustSize(pos, aniType)
         self.adjustSize()
-        return super().exec(pos, ani, aniType)
\ No newline at end of file
+        return super().exec(pos, ani, aniType)
+
+
+class ComboBoxViewMenu(ComboBoxMenu):
+    """ Combo box menu which shows the items with a virtualized list view """
+
+    isPoolable = False  # the list view is an item of menu
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._maxVisibleRows = -1
+        self.headerWidget = None
+        self.listView = self._createListView()
+        self.addWidget(self.listView, selectable=False)
+        self._listItem = self.view.item(0)
+
+    def _createListView(self):
+        return ComboListView(self)
+
+    def setHeaderWidget(self, widget):
+        """ show a widget above the list view, e.g. the filter box """
+        self.headerWidget = widget
+        widget.setFixedWidth(self.listView.width())
+        self.insertWidget(0, widget, selectable=False)
+
+    def setModel(self, model):
+        self.listView.setModel(model)
+
+    def model(self):
+        return self.listView.model()
+
+    def setMaxVisibleItems(self, num: int):
+        self._maxVisibleRows = num
+        self.adjustViewSize()
+
+    def setViewWidth(self, width: int):
+        self.listView.setFixedWidth(width)
+        if self.headerWidget:
+            self.headerWidget.setFixedWidth(width)
+            self.view.item(0).setSizeHint(self.headerWidget.size())
+
+        self.adjustViewSize()
+
+    def adjustViewSize(self, maxHeight: int = None):
+        """ adjust the size of list view, the cost is independent of the number of rows """
+        rows = self.model().rowCount() if self.model() else 0
+        if self._maxVisibleRows > 0:
+            rows = min(rows, self._maxVisibleRows)
+
+        if maxHeight is None:
+            maxHeight = getCurrentScreenGeometry().height() - 100
+
+        h = self.listView.heightForRows(rows)
+        h = min(h, max(maxHeight, self.listView.itemHeight()))
+
+        self.listView.setFixedHeight(h)
+        self._listItem.setSizeHint(self.listView.size())
+        self.view.adjustSize()
+        self.adjustSize()
+
+    def exec(self, pos, ani=True, aniType=MenuAnimationType.DROP_DOWN):
+        self._beginPopupTiming()
+        m = self.view.viewportMargins()
+        _, h = MenuAnimationManager.make(self.view, aniType).availableViewSize(pos)
+        if self.headerWidget:
+            h -= self.headerWidget.height()
+
+        self.adjustViewSize(h - m.top() - m.bottom() - 3)
+        return super().exec(pos, ani, aniType)
+
+
+class ComboBoxGridMenu(ComboBoxViewMenu):
+    """ Combo box menu which shows the items with a virtualized grid view """
+
+    def _createListView(self):
+        return ComboGridView(self)
+
+    def columns(self):
+        return self.model().columns() if self.model() else 1
+
+    def exec(self, pos, ani=True, aniType=MenuAnimationType.DROP_DOWN):
+        # PySide resolves `exec` of a deeper subclass to `QMenu.exec`, so it is redefined
+        return super().exec(pos, ani, aniType)
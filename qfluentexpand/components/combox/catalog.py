@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import copy
+from collections.abc import MutableSequence
+from typing import Callable, Iterable
+
+from qfluentwidgets.components.widgets.combo_box import ComboItem
+
+from qfluentexpand.common.text_index import TextIndex
+from qfluentexpand.components.combox.item import CompactComboItem
+
+
+class ItemCatalog:
+    """ Immutable item catalog shared by combo boxes """
+
+    def __init__(self, values: Iterable = (), factory: Callable = None):
+        """
+        Parameters
+        ----------
+        values: Iterable
+            the texts or items of catalog, it can be a generator
+
+        factory: Callable
+            create the item from a value, a `CompactComboItem` is created from a text by default
+        """
+        factory = factory or (
+            lambda value: value if isinstance(value, (ComboItem, CompactComboItem)) else CompactComboItem(value))
+        self._items = [factory(value) for value in values]
+        self._ids = None        # id of items
+        self._rows = None       # id(item) -> row
+        self._foldedTexts = None
+        self._textIndex = None
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def texts(self):
+        return [item.text for item in self._items]
+
+    def containsItem(self, item) -> bool:
+        """ Returns whether the item object belongs to catalog, O(1) """
+        if self._ids is None:
+            self._ids = {id(item) for item in self._items}
+
+        return id(item) in self._ids
+
+    def rowMap(self) -> dict:
+        """ Returns the shared `id(item) -> row` map, it must not be changed """
+        if self._rows is None:
+            self._rows = {id(item): i for i, item in enumerate(self._items)}
+
+        return self._rows
+
+    def foldedTexts(self) -> list:
+        """ Returns the shared case folded texts, it must not be changed """
+        if self._foldedTexts is None:
+            self._foldedTexts = [str(item.text).casefold() for item in self._items]
+
+        return self._foldedTexts
+
+    def textIndex(self) -> TextIndex:
+        """ Returns the shared text index, it must not be changed """
+        if self._textIndex is None:
+            self._textIndex = TextIndex(self.texts())
+
+        return self._textIndex
+
+
+class ItemList(MutableSequence):
+    """ Item list of combo box, it is copied from the catalog on the first change """
+
+    def __init__(self, catalog: ItemCatalog = None):
+        self.setCatalog(catalog)
+
+    def catalog(self):
+        """ Returns the catalog whose items are referenced, `None` if there is no catalog """
+        return self._catalog
+
+    def setCatalog(self, catalog: ItemCatalog):
+        """ reference the items of catalog, the current items are dropped """
+        self._catalog = catalog
+        self._items = catalog._items if catalog is not None else []
+        self._isShared = catalog is not None
+
+    def isShared(self):
+        """ Returns whether the list itself is still shared with the catalog """
+        return self._isShared
+
+    def detach(self):
+        """ copy the shared list, the items are still shared """
+        if self._isShared:
+            self._items = list(self._items)
+            self._isShared = False
+
+    def ownItem(self, index: int):
+        """ copy the item at `index` if it belongs to catalog, returns the items before and after """
+        old = self._items[index]
+        if self._catalog is None or not self._catalog.containsItem(old):
+            return old, old
+
+        self.detach()
+        new = copy.copy(old)
+        self._items[index] = new
+        return old, new
+
+    def rowMap(self) -> dict:
+        """ Returns the `id(item) -> row` map, it is shared with catalog while the list is shared """
+        if self._isShared:
+            return self._catalog.rowMap()
+
+        return {id(item): i for i, item in enumerate(self._items)}
+
+    def foldedTexts(self) -> list:
+        """ Returns the case folded texts, they are shared with catalog while the list is shared """
+        if self._isShared:
+            return self._catalog.foldedTexts()
+
+        return [str(item.text).casefold() for item in self._items]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __repr__(self):
+        return "ItemList({!r})".format(self._items)
+
+    def index(self, item, *args):
+        return self._items.index(item, *args)
+
+    def __setitem__(self, index, item):
+        self.detach()
+        self._items[index] = item
+
+    def __delitem__(self, index):
+        self.detach()
+        del self._items[index]
+
+    def insert(self, index: int, item):
+        self.detach()
+        self._items.insert(index, item)
+
+    def append(self, item):
+        self.detach()
+        self._items.append(item)
+
+    def extend(self, items: Iterable):
+        self.detach()
+        self._items.extend(items)
+
+    def pop(self, index: int = -1):
+        self.detach()
+        return self._items.pop(index)
+
+    def clear(self):
+        """ drop the items, the catalog is not referenced anymore """
+        self.setCatalog(None)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from PySide6.QtCore import Qt, Signal, QRectF, QSize
+from PySide6.QtGui import QPainter, QColor
+from PySide6.QtWidgets import QWidget, QHBoxLayout
+
+from qfluentwidgets.common.icon import isDarkTheme
+from qfluentwidgets.common.font import getFont
+
+from qfluentexpand.common.text_metrics import textMetrics
+
+
+class EditorCell(QWidget):
+    """ Editor cell of drop down row, it paints the text until an editor is hosted by `setEditor()` """
+
+    activated = Signal()
+
+    def __init__(self, text="", placeholderText="", parent=None):
+        super().__init__(parent=parent)
+        self._text = text or ""
+        self._placeholderText = placeholderText
+        self._isReadOnly = False
+        self._editor = None
+
+        self.hBoxLayout = QHBoxLayout(self)
+        self.hBoxLayout.setContentsMargins(0, 0, 0, 0)
+
+        self.setFont(getFont(14))
+        self.setMinimumHeight(33)
+        self.setCursor(Qt.CursorShape.IBeamCursor)
+
+    def text(self):
+        return self._text
+
+    def setText(self, text: str):
+        self._text = text or ""
+        self.update()
+
+    def placeholderText(self):
+        return self._placeholderText
+
+    def setPlaceholderText(self, text: str):
+        self._placeholderText = text
+        self.update()
+
+    def isReadOnly(self):
+        return self._isReadOnly
+
+    def setReadOnly(self, isReadOnly: bool):
+        self._isReadOnly = isReadOnly
+        if self._editor is not None:
+            self._editor.setReadOnly(isReadOnly)
+
+    def editor(self):
+        return self._editor
+
+    def setEditor(self, editor: QWidget):
+        """ host the editor, it replaces the painted text until `takeEditor()` """
+        self._editor = editor
+        editor.setParent(self)
+        self.hBoxLayout.addWidget(editor)
+        editor.show()
+        self.update()
+
+    def takeEditor(self):
+        """ take the hosted editor back, returns `None` if there is no editor """
+        editor = self._editor
+        if editor is None:
+            return None
+
+        self._editor = None
+        self.hBoxLayout.removeWidget(editor)
+        editor.hide()
+        self.update()
+        return editor
+
+    def sizeHint(self):
+        return QSize(100, 33)
+
+    def mousePressEvent(self, e):
+        if e.button() == Qt.MouseButton.LeftButton and self._editor is None:
+            self.activated.emit()
+            return
+
+        super().mousePressEvent(e)
+
+    def paintEvent(self, e):
+        if self._editor is not None:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.TextAntialiasing)
+        if not self.isEnabled():
+            painter.setOpacity(0.36)
+
+        isDark = isDarkTheme()
+        rect = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(QColor(255, 255, 255, 13) if isDark else QColor(0, 0, 0, 19))
+        painter.setBrush(QColor(255, 255, 255, 15) if isDark else QColor(255, 255, 255, 179))
+        painter.drawRoundedRect(rect, 5, 5)
+
+        if self._text:
+            text, color = self._text, QColor(255, 255, 255) if isDark else QColor(0, 0, 0)
+        else:
+            text, color = self._placeholderText, QColor(255, 255, 255, 128) if isDark else QColor(0, 0, 0, 96)
+
+        textRect = self.rect().adjusted(11, 0, -11, 0)
+        text = textMetrics.elidedText(self.font(), text, textRect.width())
+        painter.setPen(color)
+        painter.drawText(textRect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from bisect import insort
+from typing import Callable, Iterable, Tuple
+
+from PySide6.QtCore import Qt, Signal, QRectF, QSize
+from PySide6.QtGui import QPainter, QColor
+from PySide6.QtWidgets import QWidget, QSizePolicy
+
+from qfluentwidgets.common.icon import isDarkTheme
+from qfluentwidgets.common.icon import FluentIcon as FIF
+from qfluentwidgets.common.font import getFont
+
+from qfluentexpand.common.text_metrics import textMetrics
+
+
+class ChipStrip(QWidget):
+    """ Painted strip of chips, the chips which don't fit are collapsed into a `+N` chip """
+
+    chipCloseClicked = Signal(object)   # key of chip
+    overflowClicked = Signal()
+
+    def __init__(self, sortKey: Callable = None, parent=None):
+        """
+        Parameters
+        ----------
+        sortKey: Callable
+            the chips are ordered by `sortKey(key)`, in insertion order if it is `None`
+
+        parent: QWidget
+            parent widget
+        """
+        super().__init__(parent=parent)
+        self._chips = {}        # key -> [text, width]
+        self._order = []        # ordered keys, `None` if it should be sorted
+        self._sortKey = sortKey
+        self._layout = None     # ([(key, rect, closeRect)], overflowRect)
+        self._hoverKey = None
+
+        self.chipHeight = 24
+        self.spacing = 4
+        self.maxChipWidth = 140
+
+        self.setFont(getFont(12))
+        self.setMouseTracking(True)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+
+    def __len__(self):
+        return len(self._chips)
+
+    def hasChip(self, key):
+        return key in self._chips
+
+    def chipText(self, key):
+        return self._chips[key][0] if key in self._chips else None
+
+    def addChip(self, key, text: str):
+        self.addChips([(key, text)])
+
+    def addChips(self, chips: Iterable[Tuple[object, str]]):
+        """ add chips, the strip is laid out once """
+        chips = [(k, t) for k, t in chips if k not in self._chips]
+        if not chips:
+            return
+
+        for key, text in chips:
+            self._chips[key] = [str(text), -1]
+
+        # sort once for a large batch, otherwise insert in place
+        if self._order is None or len(chips) > 8:
+            self._order = None
+        elif self._sortKey is None:
+            self._order.extend(k for k, _ in chips)
+        else:
+            for key, _ in chips:
+                insort(self._order, key, key=self._sortKey)
+
+        self._invalidateLayout()
+
+    def setChipText(self, key, text: str):
+        if key not in self._chips:
+            return
+
+        self._chips[key] = [str(text), -1]
+        self._invalidateLayout()
+
+    def replaceKey(self, old, new):
+        """ move the chip of `old` key to `new` key, the order of chips is kept """
+        if old not in self._chips or old is new:
+            return
+
+        self._chips[new] = self._chips.pop(old)
+        if self._order is not None:
+            self._order[self._order.index(old)] = new
+
+        if self._hoverKey is old:
+            self._hoverKey = new
+
+        self._layout = None
+
+    def removeChip(self, key):
+        self.removeChips([key])
+
+    def removeChips(self, keys: Iterable):
+        """ remove chips, the strip is laid out once """
+        keys = [k for k in keys if k in self._chips]
+        if not keys:
+            return
+
+        for key in keys:
+            del self._chips[key]
+
+        if self._order is not None:
+            if len(keys) == 1:
+                self._order.remove(keys[0])
+            else:
+                self._order = [k for k in self._order if k in self._chips]
+
+        if self._hoverKey in keys:
+            self._hoverKey = None
+
+        self._invalidateLayout()
+
+    def clear(self):
+        self._chips.clear()
+        self._order = []
+        self._hoverKey = None
+        self._invalidateLayout()
+
+    def visibleCount(self):
+        """ Returns the number of chips which are not collapsed """
+        return len(self._ensureLayout()[0])
+
+    def overflowCount(self):
+        return len(self._chips) - self.visibleCount()
+
+    def keyAt(self, pos):
+        """ Returns the key of chip at `pos`, otherwise returns `None` """
+        for key, rect, _ in self._ensureLayout()[0]:
+            if rect.contains(pos):
+                return key
+
+        return None
+
+    def sizeHint(self):
+        return QSize(0, self.chipHeight)
+
+    def _invalidateLayout(self):
+        self._layout = None
+        # an empty strip lets the line edit under it receive the mouse events
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, not self._chips)
+        self.update()
+
+    def _orderedKeys(self):
+        if self._order is None:
+            self._order = sorted(self._chips, key=self._sortKey) if self._sortKey else list(self._chips)
+
+        return self._order
+
+    def _chipWidth(self, chip):
+        if chip[1] < 0:
+            textWidth = min(textMetrics.horizontalAdvance(self.font(), chip[0]), self.maxChipWidth - 34)
+            chip[1] = textWidth + 34   # 10 + text + 8 + close icon 10 + 6
+
+        return chip[1]
+
+    def _overflowWidth(self, count: int):
+        return textMetrics.horizontalAdvance(self.font(), "+{}".format(count)) + 16
+
+    def _ensureLayout(self):
+        if self._layout is not None:
+            return self._layout
+
+        chips = []
+        order = self._orderedKeys()
+        y = (self.height() - self.chipHeight) / 2
+        x, width = 0, self.width()
+
+        # only the chips which fit in the strip are laid out
+        for i, key in enumerate(order):
+            w = self._chipWidth(self._chips[key])
+            rest = len(order) - i - 1
+            reserved = self._overflowWidth(rest) + self.spacing if rest else 0
+            if x + w + reserved > width:
+                break
+
+            rect = QRectF(x, y, w, self.chipHeight)
+            closeRect = QRectF(x + w - 16, y + (self.chipHeight - 10) / 2, 10, 10)
+            chips.append((key, rect, closeRect))
+            x += w + self.spacing
+
+        overflow = len(order) - len(chips)
+        overflowRect = QRectF(x, y, self._overflowWidth(overflow), self.chipHeight) if overflow else None
+        self._layout = (chips, overflowRect)
+        return self._layout
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._layout = None
+
+    def mouseMoveEvent(self, e):
+        key = None
+        for k, _, closeRect in self._ensureLayout()[0]:
+            if closeRect.adjusted(-3, -3, 3, 3).contains(e.position()):
+                key = k
+                break
+
+        if key is not self._hoverKey:
+            self._hoverKey = key
+            self.update()
+
+        super().mouseMoveEvent(e)
+
+    def leaveEvent(self, e):
+        super().leaveEvent(e)
+        self._hoverKey = None
+        self.update()
+
+    def mouseReleaseEvent(self, e):
+        chips, overflowRect = self._ensureLayout()
+        pos = e.position()
+        if e.button() == Qt.MouseButton.LeftButton:
+            for key, _, closeRect in chips:
+                if closeRect.adjusted(-3, -3, 3, 3).contains(pos):
+                    self.chipCloseClicked.emit(key)
+                    return
+
+            if overflowRect and overflowRect.contains(pos):
+                self.overflowClicked.emit()
+                return
+
+        e.ignore()
+
+    def mousePressEvent(self, e):
+        if self.keyAt(e.position()) is None and not self._isOverflowAt(e.position()):
+            e.ignore()
+
+    def _isOverflowAt(self, pos):
+        overflowRect = self._ensureLayout()[1]
+        return bool(overflowRect and overflowRect.contains(pos))
+
+    def paintEvent(self, e):
+        chips, overflowRect = self._ensureLayout()
+        if not chips and not overflowRect:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.TextAntialiasing)
+        isDark = isDarkTheme()
+        background = QColor(255, 255, 255, 18) if isDark else QColor(0, 0, 0, 15)
+        textColor = Qt.GlobalColor.white if isDark else Qt.GlobalColor.black
+        font = self.font()
+
+        for key, rect, closeRect in chips:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(background)
+            painter.drawRoundedRect(rect, 4, 4)
+
+            if key is self._hoverKey:
+                painter.setBrush(background)
+                painter.drawEllipse(closeRect.adjusted(-3, -3, 3, 3))
+
+            text = self._chips[key][0]
+            textRect = rect.adjusted(10, 0, -24, 0)
+            text = textMetrics.elidedText(font, text, textRect.width())
+            painter.setPen(textColor)
+            painter.drawText(textRect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+
+            FIF.CLOSE.render(painter, closeRect)
+
+        if overflowRect:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(background)
+            painter.drawRoundedRect(overflowRect, 4, 4)
+            painter.setPen(textColor)
+            painter.drawText(overflowRect, Qt.AlignmentFlag.AlignCenter, "+{}".format(len(self._chips) - len(chips)))
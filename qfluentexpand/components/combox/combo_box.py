@@ -8,37 +8,228 @@ email: nbxlc@hotmail.com
 
 import sys
 from typing import Union, List, Iterable
-import copy
 
-from PySide6.QtCore import Qt, Signal, QRectF, QPoint, QObject, QEvent
+from PySide6.QtCore import Qt, Signal, QRectF, QPoint, QObject, QEvent, QStringListModel
 from PySide6.QtGui import QPainter, QCursor, QIcon, QAction, QFont
 from PySide6.QtWidgets import (
-    QWidget, QWidgetAction, QVBoxLayout, QHBoxLayout,
+    QWidget, QWidgetAction, QVBoxLayout, QHBoxLayout, QCompleter,
 
 )
 
-from qfluentwidgets import CheckBox, MenuAnimationType, PushButton, BodyLabel
+from qfluentwidgets import CheckBox, MenuAnimationType, BodyLabel, SearchLineEdit
 from qfluentwidgets.components.widgets.line_edit import LineEdit, LineEditButton, CompleterMenu
 from qfluentwidgets.common.animation import TranslateYAnimation
 from qfluentwidgets.common.font import setFont
 from qfluentwidgets.common.icon import isDarkTheme, FluentIconBase
 from qfluentwidgets.common.icon import FluentIcon as FIF
 from qfluentwidgets.common.style_sheet import FluentStyleSheet
-from qfluentwidgets.components.widgets.combo_box import ComboBoxBase, ComboItem
-
-from qfluentexpand.components.combox.base import ComboBoxMenu
+from qfluentwidgets.components.widgets.combo_box import ComboBoxBase, ComboBox, ComboItem
+
+from qfluentexpand.components.combox.base import ComboBoxMenu, ComboBoxViewMenu, ComboBoxGridMenu, DropDownMode
+from qfluentexpand.components.combox.view import ComboItemModel, ComboFilterModel, ComboGridModel
+from qfluentexpand.components.combox.selection import ItemSelection
+from qfluentexpand.components.combox.provider import ItemProvider
+from qfluentexpand.components.combox.filter import ItemFilter
+from qfluentexpand.components.combox.chip import ChipStrip
+from qfluentexpand.components.combox.cell import EditorCell
+from qfluentexpand.components.combox.catalog import ItemCatalog, ItemList
+from qfluentexpand.components.combox.item import CompactComboItem
+from qfluentexpand.components.combox.prewarm import MenuPrewarmer
+from qfluentexpand.components.menu.latency import PopupMonitor
+from qfluentexpand.components.menu.pool import MenuPool
 from qfluentexpand.components.line.editor import Line
+from qfluentexpand.common.text_index import TextIndex
+from qfluentexpand.common.debounce import TextDebouncer
+
+
+class ComboBoxCatalogMixin:
+    """ Shared item catalog mixin of combo box, the items are stored in an `ItemList` """
+
+    def _setUpUi(self):
+        super()._setUpUi()
+        self.items = ItemList()
+
+    def itemCatalog(self):
+        """ Returns the shared catalog, `None` if the items are not shared """
+        return self.items.catalog()
+
+    def setItemCatalog(self, catalog: ItemCatalog):
+        """ replace all items with the items of catalog, they are shared instead of copied """
+        self.clear()
+        self.items.setCatalog(catalog)
+
+    def setItemText(self, index: int, text: str):
+        self._ownItem(index)
+        ComboBoxBase.setItemText(self, index, text)
+
+    def setItemData(self, index: int, value):
+        self._ownItem(index)
+        ComboBoxBase.setItemData(self, index, value)
+
+    def setItemIcon(self, index: int, icon: Union[str, QIcon, FluentIconBase]):
+        self._ownItem(index)
+        ComboBoxBase.setItemIcon(self, index, icon)
+
+    def _ownItem(self, index: int):
+        """ Returns the item at `index` owned by this combo box, call it before changing the fields """
+        if not 0 <= index < len(self.items):
+            return None
+
+        old, new = self.items.ownItem(index)
+        if new is not old:
+            self._onItemReplaced(old, new)
+
+        return new
+
+    def _onItemReplaced(self, old, new):
+        """ move the state keyed by the old item to its copy """
+        pass
+
+
+class ComboBoxFilterMixin:
+    """ Type to filter mixin of combo box, the items are matched by `itemFilter` off the GUI thread """
+
+    def _setUpUi(self):
+        super()._setUpUi()
+        self.filterEdit = None
+        self.itemFilter = ItemFilter(self.items, parent=self)
+        self._isFilterEnabled = False
+        self._matchedMenuRows = set()
+
+        self.itemFilter.started.connect(self._onFilterStarted)
+        self.itemFilter.rowsMatched.connect(self._onFilterRowsMatched)
+        self.itemFilter.finished.connect(self._onFilterFinished)
+        self.itemFilter.cleared.connect(self._onFilterCleared)
+
+    def isFilterEnabled(self):
+        return self._isFilterEnabled
+
+    def setFilterEnabled(self, enabled: bool):
+        """ set whether to show the filter box in drop down menu """
+        self._isFilterEnabled = enabled
+
+    def _filterMenu(self):
+        """ Returns the drop down menu whose rows are filtered """
+        return self.dropMenu
+
+    def _menuRowOffset(self):
+        return 1 if self.filterEdit is not None else 0
+
+    def _filterMenuRow(self, index: int):
+        """ Returns the menu row which shows the item at `index` """
+        return index // max(self.rowSize, 1) + self._menuRowOffset()
+
+    def _addFilterBox(self, menu):
+        """ add the filter box to the top of menu if filter is enabled """
+        widget = self._createFilterBox(menu)
+        if widget is not None:
+            menu.addWidget(widget, selectable=False)
+
+    def _createFilterBox(self, menu):
+        """ create the filter box, returns `None` if filter is disabled """
+        if not self._isFilterEnabled:
+            self.filterEdit = None
+            return None
+
+        widget = QWidget(menu)
+        hBoxLayout = QHBoxLayout(widget)
+        hBoxLayout.setContentsMargins(4, 2, 4, 2)
 
+        self.filterEdit = SearchLineEdit(widget)
+        self.filterEdit.setPlaceholderText("搜索")
+        self.filterEdit.textChanged.connect(self.itemFilter.setFilterText)
+        hBoxLayout.addWidget(self.filterEdit)
 
-class EditableComboBox(LineEdit, ComboBoxBase):
+        widget.resize(max(menu.width(), self.width()), 40)
+        return widget
+
+    def _resetFilter(self):
+        if self.filterEdit is not None:
+            self.filterEdit.clear()
+
+        self.itemFilter.setFilterText("")
+
+    def _onFilterStarted(self):
+        self._matchedMenuRows = set()
+
+    def _onFilterRowsMatched(self, indexes: list):
+        menu = self._filterMenu()
+        if menu is None:
+            return
+
+        view = menu.view
+        for index in indexes:
+            row = self._filterMenuRow(index)
+            self._matchedMenuRows.add(row)
+            if view.isRowHidden(row):
+                view.setRowHidden(row, False)
+
+    def _onFilterFinished(self, indexes: list):
+        menu = self._filterMenu()
+        if menu is None:
+            return
+
+        view = menu.view
+        for row in range(self._menuRowOffset(), view.count()):
+            hidden = row not in self._matchedMenuRows
+            if view.isRowHidden(row) != hidden:
+                view.setRowHidden(row, hidden)
+
+    def _onFilterCleared(self):
+        menu = self._filterMenu()
+        if menu is None:
+            return
+
+        view = menu.view
+        for row in range(view.count()):
+            if view.isRowHidden(row):
+                view.setRowHidden(row, False)
+
+
+class ComboBoxSettleMixin:
+    """ Settled text mixin of combo box, `textSettled(text, token)` is emitted once per pause in typing """
+
+    def _setUpUi(self):
+        super()._setUpUi()
+        self.textDebouncer = None
+        self._settleDelay = (300, 1000)
+
+    def setTextSettleDelay(self, delay: int, maxWait: int = 1000):
+        """ set the milliseconds of typing pause and the maximum wait of `textSettled`, see `TextDebouncer` """
+        self._settleDelay = (delay, maxWait)
+        if self.textDebouncer is not None:
+            self.textDebouncer.setDelay(delay, maxWait)
+
+    def flushSettledText(self):
+        """ emit the pending `textSettled` now, e.g. the return key is pressed """
+        if self.textDebouncer is not None:
+            self.textDebouncer.flush()
+
+    def cancelSettledText(self):
+        """ drop the pending `textSettled` and cancel the token of last one """
+        if self.textDebouncer is not None:
+            self.textDebouncer.cancel()
+
+    def _settleText(self, text: str):
+        if self.textDebouncer is None:
+            self.textDebouncer = TextDebouncer(*self._settleDelay, parent=self)
+            self.textDebouncer.settled.connect(self.textSettled)
+
+        self.textDebouncer.push(text)
+
+
+class EditableComboBox(LineEdit, ComboBoxFilterMixin, ComboBoxSettleMixin, ComboBoxCatalogMixin, ComboBoxBase):
     """ Editable combo box with delete button"""
 
     currentIndexChanged = Signal(int)
     currentTextChanged = Signal(str)
+    textSettled = Signal(str, object)   # text, CancelToken
     activated = Signal(int)
     textActivated = Signal(str)
     itemDeleted = Signal(int)
     textItemDeleted = Signal(str)
+    itemsReset = Signal()
+    itemsInserted = Signal(int, int)    # first, last
 
     def __init__(self, parent=None):
         super().__init__(parent=parent)
@@ -62,6 +253,10 @@ class EditableComboBox(LineEdit, ComboBoxBase):
         self.rowSize = 1
         self.menu = None
 
+    def _setUpUi(self):
+        super()._setUpUi()
+        self._textIndex = TextIndex()   # 文本索引, 与 items 同步
+
     def setClearButtonEnabled(self, enable: bool):
         self._isClearButtonEnabled = enable
         self.setTextMargins(0, 0, 50*enable, 0)
@@ -90,7 +285,108 @@ class EditableComboBox(LineEdit, ComboBoxBase):
             self._currentIndex = index
             self.setText(self.items[index].text)
 
+    def addItem(self, text, icon: Union[str, QIcon, FluentIconBase] = None, userData=None):
+        self._ownTextIndex().append(text)
+        self.items.append(CompactComboItem(text, icon, userData))
+        if len(self.items) == 1:
+            self.setCurrentIndex(0)
+
+    def addItems(self, texts: Iterable[str]):
+        self.extendItems(texts)
+
+    def setItems(self, texts: Iterable[str]):
+        """ replace all items, `itemsReset` is emitted once
+
+        Parameters
+        ----------
+        texts: Iterable[str | ComboItem]
+            the texts or items, it can be a generator
+        """
+        items = [self._createItem(text) for text in texts]
+        self.clear()
+        self.items.extend(items)
+        self._textIndex.reset(item.text for item in items)
+        if items:
+            self.setCurrentIndex(0)
+
+        self.itemsReset.emit()
+
+    def extendItems(self, texts: Iterable[str]):
+        """ append items, `itemsInserted` is emitted once
+
+        Parameters
+        ----------
+        texts: Iterable[str | ComboItem]
+            the texts or items, it can be a generator
+        """
+        items = [self._createItem(text) for text in texts]
+        if not items:
+            return
+
+        start = len(self.items)
+        self._ownTextIndex().extend(item.text for item in items)
+        self.items.extend(items)
+        if start == 0:
+            self.setCurrentIndex(0)
+
+        self.itemsInserted.emit(start, len(self.items) - 1)
+
+    def _createItem(self, text):
+        return text if isinstance(text, (ComboItem, CompactComboItem)) else CompactComboItem(text)
+
+    def setItemCatalog(self, catalog: ItemCatalog):
+        """ replace all items with the shared items of catalog, `itemsReset` is emitted once """
+        super().setItemCatalog(catalog)
+        if catalog is not None:
+            self._textIndex = catalog.textIndex()
+            if len(catalog):
+                self.setCurrentIndex(0)
+
+        self.itemsReset.emit()
+
+    def _ownTextIndex(self):
+        """ Returns the text index to change, the shared index is copied first """
+        if self.items.catalog() is not None and self._textIndex is self.items.catalog().textIndex():
+            self._textIndex = TextIndex(item.text for item in self.items)
+
+        return self._textIndex
+
+    def insertItem(self, index: int, text: str, icon: Union[str, QIcon, FluentIconBase] = None, userData=None):
+        self.insertItems(index, [CompactComboItem(text, icon, userData)])
+
+    def insertItems(self, index: int, texts: Iterable[str]):
+        index = max(0, min(index, self.count()))
+        items = [self._createItem(text) for text in texts]
+        textIndex = self._ownTextIndex()
+        for i, item in enumerate(items):
+            textIndex.insert(index + i, item.text)
+            self.items.insert(index + i, item)
+
+        if items and index <= self.currentIndex():
+            self.setCurrentIndex(self.currentIndex() + len(items))
+
+    def removeItem(self, index: int):
+        self._ownTextIndex().remove(index)
+        ComboBoxBase.removeItem(self, index)
+
+    def setItemText(self, index: int, text: str):
+        self._ownTextIndex().setText(index, text)
+        ComboBoxCatalogMixin.setItemText(self, index, text)
+
+    def findText(self, text: str):
+        """ Returns the index of the item containing the given text, O(1) """
+        return self._textIndex.find(text)
+
+    def findPrefix(self, prefix: str, limit: int = -1) -> List[int]:
+        """ Returns the indexes of the items whose text starts with `prefix`, see `TextIndex.prefixRows()` """
+        return self._textIndex.prefixRows(prefix, limit)
+
     def clear(self):
+        if self.items.catalog() is not None:
+            self._textIndex = TextIndex()
+        else:
+            self._textIndex.clear()
+
         ComboBoxBase.clear(self)
 
     def setPlaceholderText(self, text: str):
@@ -98,6 +394,7 @@ class EditableComboBox(LineEdit, ComboBoxBase):
         super().setPlaceholderText(text)
 
     def _onReturnPressed(self):
+        self.flushSettledText()
         if not self.text():
             return
 
@@ -125,22 +422,31 @@ class EditableComboBox(LineEdit, ComboBoxBase):
     def _onComboTextChanged(self, text: str):
         self._currentIndex = -1
         self.currentTextChanged.emit(text)
+        self._settleText(text)
 
-        for i, item in enumerate(self.items):
-            if item.text == text:
-                self._currentIndex = i
-                self.currentIndexChanged.emit(i)
-                return
+        index = self.findText(text)
+        if index >= 0:
+            self._currentIndex = index
+            self.currentIndexChanged.emit(index)
 
     def _onDropMenuClosed(self):
+        self._resetFilter()
+        if self.dropMenu is not None:
+            self.dropMenu.closedSignal.disconnect(self._onDropMenuClosed)
+            MenuPool.instance().release(self.dropMenu)
+
         self.dropMenu = None
+        self.filterEdit = None
 
     def _onClearButtonClicked(self):
         LineEdit.clear(self)
         self._currentIndex = -1
 
     def _createComboMenu(self):
-        return ComboBoxMenu(self)
+        # the menu is recycled after it is closed
+        menu = MenuPool.instance().acquire(ComboBoxMenu, self)
+        self._addFilterBox(menu)
+        return menu
 
     def setRowSize(self, size: int):
         if size > 0 and size <= len(self.items):
@@ -151,34 +457,41 @@ class EditableComboBox(LineEdit, ComboBoxBase):
         if not self.items:
             return
 
+        timing = PopupMonitor.instance().begin(type(self).__name__)
         menu = self._createComboMenu()
+        self.itemFilter.invalidate()
         self.widgets.clear()
-        for i, item in enumerate(self.items):
-            if i % self.rowSize == 0:
-                tmpWidget = QWidget(menu)
-                hBoxLayout = QHBoxLayout(tmpWidget)
-                hBoxLayout.setSpacing(1)
-                hBoxLayout.setContentsMargins(1, 1, 1, 1)
-
-            label = BodyLabel(menu)
-            label.setObjectName("Label_C_" + str(i))
-            hBoxLayout.addWidget(label)
-
-            if self.isClearButtonEnabled():
-                clearBtn = LineEditButton(FIF.CLOSE)
-                clearBtn.setFixedSize(29, 25)
-                clearBtn.setObjectName("ClearButton_C_" + str(i))
-                clearBtn.setStyleSheet("background-color: transparent; border: none; padding: 0; margin: 0;")
-                clearBtn.clicked.connect(lambda checked, index=i: self._onItemDelClicked(checked, index))
-                hBoxLayout.addWidget(clearBtn)
-
-            if item.text:
-                label.setText(item.text)
-
-            tmpWidget.resize(menu.width(), 45)
-            menu.addWidget(tmpWidget, onClick=lambda checked, index=i: self._onItemClicked(checked, index))
-
-            self.widgets.append(tmpWidget)
+        with menu.updating():
+            for i, item in enumerate(self.items):
+                if i % self.rowSize == 0:
+                    tmpWidget = QWidget(menu)
+                    hBoxLayout = QHBoxLayout(tmpWidget)
+                    hBoxLayout.setSpacing(1)
+                    hBoxLayout.setContentsMargins(1, 1, 1, 1)
+
+                label = BodyLabel(menu)
+                label.setObjectName("Label_C_" + str(i))
+                hBoxLayout.addWidget(label)
+
+                if self.isClearButtonEnabled():
+                    clearBtn = LineEditButton(FIF.CLOSE)
+                    clearBtn.setFixedSize(29, 25)
+                    clearBtn.setObjectName("ClearButton_C_" + str(i))
+                    clearBtn.setStyleSheet("background-color: transparent; border: none; padding: 0; margin: 0;")
+                    clearBtn.clicked.connect(lambda checked, index=i: self._onItemDelClicked(checked, index))
+                    hBoxLayout.addWidget(clearBtn)
+
+                if item.text:
+                    label.setText(item.text)
+
+                tmpWidget.resize(menu.width(), 45)
+                menu.addWidget(tmpWidget, onClick=lambda checked, index=i: self._onItemClicked(checked, index))
+
+                self.widgets.append(tmpWidget)
+
+        if timing:
+            timing.mark('build')
+            menu._popupTiming = timing
 
         if menu.view.width() < self.width():
             menu.view.setMinimumWidth(self.width())
@@ -202,6 +515,8 @@ class EditableComboBox(LineEdit, ComboBoxBase):
             menu.view.adjustSize(pu, MenuAnimationType.PULL_UP)
             menu.exec(pu, aniType=MenuAnimationType.PULL_UP)
 
+        if self.filterEdit is not None:
+            self.filterEdit.setFocus()
 
         self.adjustSize()
 
@@ -210,6 +525,7 @@ class EditableComboBox(LineEdit, ComboBoxBase):
 
         self.dropMenu.removeWidget(self.widgets[index])
         self.removeItem(index)
+        self.itemFilter.invalidate()
 
         self.itemDeleted.emit(index)
         self.textItemDeleted.emit(text)
@@ -218,11 +534,521 @@ class EditableComboBox(LineEdit, ComboBoxBase):
         self.setCurrentIndex(index)
 
 
-class MSComboBox(Line, ComboBoxBase):
+class CatalogComboBox(ComboBoxCatalogMixin, ComboBox):
+    """ Combo box whose items can be shared with an `ItemCatalog` """
+
+    def setItemCatalog(self, catalog: ItemCatalog):
+        """ replace all items with the shared items of catalog """
+        super().setItemCatalog(catalog)
+        if len(self.items):
+            self.setCurrentIndex(0)
+
+
+class ComboBoxCompleter(QCompleter):
+    """ Completer of editable combo box, the candidates are looked up from its prefix index """
+
+    def __init__(self, comboBox: EditableComboBox, maxResults: int = 100):
+        """
+        Parameters
+        ----------
+        comboBox: EditableComboBox
+            the combo box whose items are completed
+
+        maxResults: int
+            the maximum number of candidates, `-1` means no limit
+        """
+        super().__init__(comboBox)
+        self.comboBox = comboBox
+        self.maxResults = maxResults
+        self._model = QStringListModel(self)
+
+        self.setModel(self._model)
+        self.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+
+    def setCompletionPrefix(self, prefix: str):
+        indexes = self.comboBox.findPrefix(prefix, self.maxResults)
+        self._model.setStringList([self.comboBox.itemText(i) for i in indexes])
+        super().setCompletionPrefix(prefix)
+
+
+class MSComboBoxBase(ComboBoxFilterMixin, ComboBoxSettleMixin, ComboBoxCatalogMixin, ComboBoxBase):
+    """ Multi selection combo box base, the drop down menu is kept and patched by the changes """
+
+    def _setUpUi(self):
+        super()._setUpUi()
+        self.comboMenu = None   # 缓存的下拉菜单
+        self.dropDownMode = DropDownMode.WIDGET
+        self.gridCellWidth = 120
+        self.selection = ItemSelection(self.items, self)
+        self.itemModel = ComboItemModel(self.items, self.selection, self)
+        self.filterModel = ComboFilterModel(self.itemModel, self)
+        self.selection.selectionChanged.connect(self._onSelectionChanged)
+        self.itemModel.rowsInserted.connect(self.itemFilter.invalidate)
+        self.itemModel.rowsRemoved.connect(self.itemFilter.invalidate)
+        self.itemModel.modelReset.connect(self.itemFilter.invalidate)
+        self.itemModel.rowsInserted.connect(self._restartPrewarm)
+        self.itemModel.rowsRemoved.connect(self._restartPrewarm)
+        self.itemModel.modelReset.connect(self._restartPrewarm)
+        self.itemProvider = None
+        self._isPopupPending = False
+        self._isPrewarmEnabled = False
+        self._prewarmMenu = None    # 预热中的下拉菜单
+
+    @property
+    def selectedItems(self) -> List[int]:
+        """ the selected indexes in selection order """
+        return self.selection.rows()
+
+    def selectedIndexes(self) -> List[int]:
+        return self.selection.rows()
+
+    def isItemSelected(self, index: int) -> bool:
+        return self.selection.isSelected(index)
+
+    def setSelectedIndexes(self, indexes: Iterable[int]):
+        """ replace the selection with indexes """
+        self.selection.setSelectedRows(indexes)
+
+    def selectAllItems(self):
+        self.selection.selectAll()
+
+    def selectRange(self, first: int, last: int, selected=True):
+        """ select or deselect the items in `[first, last]` """
+        self.selection.selectRange(first, last, selected)
+
+    def invertSelection(self):
+        self.selection.invertSelection()
+
+    def _createComboMenu(self):
+        menu = MenuPool.instance().acquire(ComboBoxMenu, self)
+        self._addFilterBox(menu)
+        return menu
+
+    def _isViewMode(self):
+        """ whether the drop down menu is a model/view one, it has no widget per item """
+        return self.dropDownMode in (DropDownMode.VIEW, DropDownMode.GRID)
+
+    def setFilterEnabled(self, enabled: bool):
+        if enabled == self.isFilterEnabled():
+            return
+
+        super().setFilterEnabled(enabled)
+        self._invalidateComboMenu()
+
+    def _filterMenu(self):
+        return self.comboMenu
+
+    def _onFilterStarted(self):
+        if self._isViewMode():
+            self.filterModel.beginFilter()
+        else:
+            super()._onFilterStarted()
+
+    def _onFilterRowsMatched(self, indexes: list):
+        if self._isViewMode():
+            self.filterModel.appendRows(indexes)
+        else:
+            super()._onFilterRowsMatched(indexes)
+
+    def _onFilterFinished(self, indexes: list):
+        if not self._isViewMode():
+            super()._onFilterFinished(indexes)
+
+    def _onFilterCleared(self):
+        if self._isViewMode():
+            self.filterModel.clearFilter()
+        else:
+            super()._onFilterCleared()
+
+    def setItems(self, items: Iterable):
+        """ replace all items, `itemsReset` is emitted once
+
+        Parameters
+        ----------
+        items: Iterable
+            the items, it can be a generator, see `_createItem` for the accepted values
+        """
+        items = [self._createItem(item) for item in items]
+        self.clear()
+        self.items.extend(items)
+        self.itemModel.resetItems()
+        self.itemsReset.emit()
+
+    def extendItems(self, items: Iterable):
+        """ append items, `itemsInserted` is emitted once
+
+        Parameters
+        ----------
+        items: Iterable
+            the items, it can be a generator, see `_createItem` for the accepted values
+        """
+        items = [self._createItem(item) for item in items]
+        if not items:
+            return
+
+        start = len(self.items)
+        self.itemModel.appendItems(items)
+        self._appendComboMenuRows(start)
+        self.itemsInserted.emit(start, len(self.items) - 1)
+
+    def _createItem(self, value):
+        """ create the item from a value of `setItems` or `extendItems` """
+        return value if isinstance(value, (ComboItem, CompactComboItem)) else CompactComboItem(value)
+
+    def setItemCatalog(self, catalog: ItemCatalog):
+        """ replace all items with the shared items of catalog, `itemsReset` is emitted once """
+        super().setItemCatalog(catalog)
+        self.itemModel.resetItems()
+        self.itemsReset.emit()
+
+    def setItemText(self, index: int, text: str):
+        if not 0 <= index < len(self.items):
+            return
+
+        super().setItemText(index, text)
+        self.chipStrip.setChipText(self.items[index], text)
+        self.itemFilter.invalidate()
+        self._invalidateComboMenu()
+
+    def _onItemReplaced(self, old, new):
+        self.selection.replaceItem(old, new)
+        self.chipStrip.replaceKey(old, new)
+
+    def setItemProvider(self, provider: ItemProvider):
+        """ set the item provider, the current items are cleared
+
+        The pages are fetched while the drop down menu is shown and scrolled.
+
+        Parameters
+        ----------
+        provider: ItemProvider
+            the item provider, `None` to remove the current provider
+        """
+        if self.itemProvider is not None:
+            self.itemProvider.cancel()
+            self.itemProvider.pageFetched.disconnect(self._onPageFetched)
+
+        self.clear()
+        self.itemProvider = provider
+        if provider is not None:
+            provider.setParent(self)
+            provider.pageFetched.connect(self._onPageFetched)
+
+    def _onPageFetched(self, page: list):
+        self.extendItems(page)
+
+        if self._isPopupPending:
+            self._isPopupPending = False
+            self._showComboMenu()
+        else:
+            self._fetchVisibleItems()
+
+    def _fetchVisibleItems(self):
+        """ fetch the next page if the end of fetched items is close to the visible rows """
+        provider = self.itemProvider
+        if provider is None or not provider.canFetchMore() or self.comboMenu is None:
+            return
+
+        if self._isViewMode():
+            view = self.comboMenu.listView
+            # the column count of a list model is private in Qt
+            columns = view.model().columnCount() if isinstance(view.model(), ComboGridModel) else 1
+            distance = provider.prefetchDistance // max(columns, 1)
+        else:
+            view, distance = self.comboMenu.view, provider.prefetchDistance // max(self.rowSize, 1)
+
+        if not view.isVisible():
+            return
+
+        row = view.indexAt(QPoint(1, view.viewport().height() - 1)).row()
+        if row < 0 or row >= view.model().rowCount() - 1 - distance:
+            provider.fetchMore()
+
+    def _cancelItemFetch(self):
+        self._isPopupPending = False
+        if self.itemProvider is not None:
+            self.itemProvider.cancel()
+
+    def _takeItemWidgets(self, index: int):
+        """ unregister the widgets of item at `index` """
+        del self.widgets[index]
+
+    def _onItemSelected(self, index: int, checked: bool):
+        """ update the widgets of item after its selection is changed """
+        pass
+
+    def _setItemChecked(self, index: int, checked: bool):
+        self.selection.select(index, checked)
+
+    def _onSelectionChanged(self, selected: list, deselected: list):
+        if self._prewarmMenu is not None:
+            self._restartPrewarm()
+
+        for index in deselected:
+            self._syncItemCheckBox(index, False)
+            self._onItemSelected(index, False)
+
+        for index in selected:
+            self._syncItemCheckBox(index, True)
+            self._onItemSelected(index, True)
+
+        self._updateChips(selected, deselected)
+        self._updateSelectionState()
+        self.selectedItemsChanged.emit(selected, deselected)
+
+    def _syncItemCheckBox(self, index: int, checked: bool):
+        if self.comboMenu is None or self._isViewMode():
+            return
+
+        checkbox = self._itemCheckBox(index)
+        if checkbox.isChecked() != checked:
+            checkbox.blockSignals(True)
+            checkbox.setChecked(checked)
+            checkbox.blockSignals(False)
+
+    def _insertItem(self, index: int, item):
+        index = max(0, min(index, len(self.items)))
+        self.itemModel.insertItem(index, item)
+        self._insertComboMenuRow(index)
+
+    def _removeItem(self, index: int):
+        self._removeComboMenuRow(index)
+        return self.itemModel.removeItem(index)
+
+    def _createChipStrip(self):
+        """ create the strip of selected items, the chips are keyed by item """
+        self.chipStrip = ChipStrip(self.selection.row, self)
+        self.chipStrip.chipCloseClicked.connect(self._onChipCloseClicked)
+        self.chipStrip.overflowClicked.connect(self._showComboMenu)
+        self.hBoxLayout.insertWidget(0, self.chipStrip, 1)
+
+    def _updateChips(self, selected: list, deselected: list):
+        if not self.isReadOnly():
+            return
+
+        self.chipStrip.removeChips(self.items[i] for i in deselected)
+        self.chipStrip.addChips((self.items[i], self.items[i].text) for i in selected)
+
+    def _onChipCloseClicked(self, item):
+        self._setItemChecked(self.selection.row(item), False)
+
+    def _insertComboMenuRow(self, index: int):
+        if self.comboMenu is None or self._isViewMode():
+            return
+
+        if self.rowSize != 1:
+            return self._invalidateComboMenu()
+
+        row = index + self._menuRowOffset()
+        self.comboMenu.insertWidget(row, self._createItemRow(self.comboMenu, index))
+
+    def _appendComboMenuRows(self, start: int):
+        if self.comboMenu is None or self._isViewMode():
+            return
+
+        if self.rowSize != 1:
+            return self._invalidateComboMenu()
+
+        with self.comboMenu.updating():
+            for i in range(start, len(self.items)):
+                self.comboMenu.addWidget(self._createItemRow(self.comboMenu, i))
+
+    def _removeComboMenuRow(self, index: int):
+        if self.comboMenu is None or self._isViewMode():
+            return
+
+        if self.rowSize != 1:
+            return self._invalidateComboMenu()
+
+        view = self.comboMenu.view
+        row = view.itemWidget(view.item(index + self._menuRowOffset()))
+        self.comboMenu.removeWidget(row)
+        self._takeItemWidgets(index)
+        row.deleteLater()
+
+    def isPrewarmEnabled(self):
+        return self._isPrewarmEnabled
+
+    def setPrewarmEnabled(self, enabled: bool):
+        """ set whether to build the drop down menu in idle time after the combo box is shown,
+        see `MenuPrewarmer`
+        """
+        self._isPrewarmEnabled = enabled
+        if enabled:
+            self._schedulePrewarm()
+        else:
+            self._cancelPrewarm()
+
+    def _schedulePrewarm(self):
+        if self._isPrewarmEnabled and self.comboMenu is None and self.items and self.isVisible():
+            MenuPrewarmer.instance().schedule(self)
+
+    def _cancelPrewarm(self):
+        MenuPrewarmer.instance().cancel(self)
+        if self._prewarmMenu is not None:
+            MenuPool.instance().release(self._prewarmMenu)
+            self._prewarmMenu = None
+            self.filterEdit = None
+            self.widgets.clear()
+
+    def _restartPrewarm(self):
+        """ the partially built menu is outdated after the items or selection are changed """
+        if self._prewarmMenu is not None:
+            self._cancelPrewarm()
+
+        self._schedulePrewarm()
+
+    def _prewarmComboMenu(self):
+        """ generator which builds the drop down menu step by step, it is driven by `MenuPrewarmer` """
+        if self.comboMenu is not None or not self.items:
+            return
+
+        if self._isViewMode() or self.rowSize != 1:
+            self._setComboMenu(self._buildComboMenu())
+            return
+
+        # the menu, its style sheet and shadow are created in the first step
+        menu = self._prewarmMenu = self._createComboMenu()
+        self.widgets.clear()
+        yield
+
+        # a step adds a row, so the prewarmer can keep in its budget, the menu is sized once at the end
+        menu.beginUpdate()
+        try:
+            for i in range(len(self.items)):
+                menu.addWidget(self._createItemRow(menu, i))
+                yield
+        finally:
+            # the generator is closed if the prewarm is cancelled
+            menu.endUpdate()
+
+        self._prewarmMenu = None
+        self._setComboMenu(menu)
+
+    def _invalidateComboMenu(self):
+        """ discard the cached drop down menu, it will be rebuilt at next popup """
+        self._cancelPrewarm()
+        if self.comboMenu is not None:
+            self._closeComboMenu()
+            self._unsetComboMenu(self.comboMenu)
+            MenuPool.instance().release(self.comboMenu)
+            self.comboMenu = None
+            self.filterEdit = None
+            self.widgets.clear()
+
+        self._schedulePrewarm()
+
+    def _createComboViewMenu(self):
+        if self.dropDownMode == DropDownMode.GRID:
+            menu = ComboBoxGridMenu(self)
+            columns, width = self._gridLayout()
+            menu.setModel(ComboGridModel(self.filterModel, columns, menu))
+            menu.setViewWidth(width)
+        else:
+            menu = ComboBoxViewMenu(self)
+            menu.setModel(self.filterModel)
+            menu.setViewWidth(self.width())
+
+        filterBox = self._createFilterBox(menu)
+        if filterBox is not None:
+            menu.setHeaderWidget(filterBox)
+
+        return menu
+
+    def _gridLayout(self):
+        """ Returns the column count and width of grid, the column count is the row size,
+        or as many cells of `gridCellWidth` as fit in the width of combo box """
+        if self.rowSize > 1:
+            columns = self.rowSize
+        else:
+            columns = max(1, self.width() // self.gridCellWidth)
+
+        return columns, max(self.width(), columns * self.gridCellWidth)
+
+    # 生成下拉菜单显示，并绑定事件
+    def _showComboMenu(self):
+        if not self.items and self.itemProvider is not None and self.itemProvider.canFetchMore():
+            # an asynchronous provider pops up the menu after the first page arrives
+            self._isPopupPending = True
+            self.itemProvider.fetchMore()
+            return
+
+        if not self.items:
+            return
+
+        timing = PopupMonitor.instance().begin(type(self).__name__)
+        if self.comboMenu is None:
+            # finish the menu being warmed up rather than building a new one
+            MenuPrewarmer.instance().finish(self)
+
+        if self.comboMenu is None:
+            self._cancelPrewarm()
+            self._setComboMenu(self._buildComboMenu())
+
+        if timing:
+            timing.mark('build')
+            self.comboMenu._popupTiming = timing
+
+        self._execComboMenu(self.comboMenu)
+        self._fetchVisibleItems()
+
+        if self.filterEdit is not None:
+            self.filterEdit.setFocus()
+        elif self.dropDownMode == DropDownMode.GRID:
+            self.comboMenu.listView.setFocus()
+
+    def _setComboMenu(self, menu):
+        """ cache the built drop down menu """
+        self.comboMenu = menu
+        menu.closedSignal.connect(self._onDropMenuClosed)
+        menu.closedSignal.connect(self._cancelItemFetch)
+        menu.closedSignal.connect(self._resetFilter)
+
+        view = menu.listView if self._isViewMode() else menu.view
+        view.verticalScrollBar().valueChanged.connect(self._fetchVisibleItems)
+
+    def _unsetComboMenu(self, menu):
+        """ disconnect the slots connected by `_setComboMenu()`, the menu may be recycled """
+        menu.closedSignal.disconnect(self._onDropMenuClosed)
+        menu.closedSignal.disconnect(self._cancelItemFetch)
+        menu.closedSignal.disconnect(self._resetFilter)
+
+        view = menu.listView if isinstance(menu, ComboBoxViewMenu) else menu.view
+        view.verticalScrollBar().valueChanged.disconnect(self._fetchVisibleItems)
+
+    def _execComboMenu(self, menu):
+        if menu.view.width() < self.width():
+            menu.view.setMinimumWidth(self.width())
+            menu.adjustSize()
+
+        menu.setMaxVisibleItems(self.maxVisibleItems())
+        self.dropMenu = menu
+
+        x = -menu.width() // 2 + menu.layout().contentsMargins().left() + self.width() // 2
+        pd = self.mapToGlobal(QPoint(x, self.height()))
+        hd = menu.view.heightForAnimation(pd, MenuAnimationType.DROP_DOWN)
+
+        pu = self.mapToGlobal(QPoint(x, 0))
+        hu = menu.view.heightForAnimation(pu, MenuAnimationType.PULL_UP)
+
+        if hd >= hu:
+            menu.view.adjustSize(pd, MenuAnimationType.DROP_DOWN)
+            menu.exec(pd, aniType=MenuAnimationType.DROP_DOWN)
+        else:
+            menu.view.adjustSize(pu, MenuAnimationType.PULL_UP)
+            menu.exec(pu, aniType=MenuAnimationType.PULL_UP)
+
+
+class MSComboBox(Line, MSComboBoxBase):
     """ Multi Selection combo box """
 
     currentIndexChanged = Signal(int)
     currentTextChanged = Signal(str)
+    textSettled = Signal(str, object)   # text, CancelToken
+    selectedItemsChanged = Signal(list, list)   # selected indexes, deselected indexes
+    itemsReset = Signal()
+    itemsInserted = Signal(int, int)    # first, last
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -241,10 +1067,8 @@ class MSComboBox(Line, ComboBoxBase):
         self.clearButton.clicked.disconnect()
         self.clearButton.clicked.connect(self._toggleDrop)
 
-        self.items = []
         #
-        self.selectedItems = []     # 被选择的index
-        self.selectedWidgets = []   # del button
+        self._createChipStrip()
         self.widgets = []   # 下拉列表
 
         self.rowSize = 1
@@ -252,9 +1076,42 @@ class MSComboBox(Line, ComboBoxBase):
     def setCompleterMenu(self, menu):
         super().setCompleterMenu(menu)
 
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._schedulePrewarm()
+
     def setRowSize(self, size: int):
-        if size > 0 and size <= len(self.items):
+        """ set the number of items per row, it is the column count of grid in `DropDownMode.GRID` """
+        if size > 0 and size != self.rowSize:
             self.rowSize = size
+            self._invalidateComboMenu()
+
+    def setGridCellWidth(self, width: int):
+        """ set the minimum cell width of grid, the column count is derived from it if the row size is 1 """
+        if width > 0 and width != self.gridCellWidth:
+            self.gridCellWidth = width
+            self._invalidateComboMenu()
+
+    def setDropDownMode(self, mode: DropDownMode):
+        """ set the drop down mode
+
+        Parameters
+        ----------
+        mode: DropDownMode
+            * `DropDownMode.WIDGET`: one check box widget per item, supports `setRowSize`
+            * `DropDownMode.VIEW`: check states are stored in `itemModel` and only the
+              visible rows are painted
+            * `DropDownMode.GRID`: same as `VIEW`, but the items are painted in fixed
+              size cells, the column count is the row size or derived from the width
+        """
+        if mode == self.dropDownMode:
+            return
+
+        self._invalidateComboMenu()
+        self.dropDownMode = mode
+
+    def _itemCheckBox(self, index: int):
+        return self.widgets[index]
 
     def currentText(self):
         return self.text()
@@ -266,9 +1123,7 @@ class MSComboBox(Line, ComboBoxBase):
         return tmp
 
     def clearSelected(self):
-        tmp = copy.copy(self.selectedItems)
-        for i in tmp:
-            self.widgets[i].setChecked(False)
+        self.selection.clear()
 
         if not self.isReadOnly():
             super().clear()
@@ -278,21 +1133,21 @@ class MSComboBox(Line, ComboBoxBase):
         self.clearSelected()
 
     def _showDrop(self, text):
-        if len(self.selectedItems) > 0 or self.text():
+        if len(self.selection) > 0 or self.text():
             self.clearButton.show()
-        elif len(self.selectedItems) == 0 and not self.text():
+        elif len(self.selection) == 0 and not self.text():
             self.clearButton.hide()
 
     def focusInEvent(self, e):
         super().focusInEvent(e)
-        if self.text() or len(self.selectedItems) > 0:
+        if self.text() or len(self.selection) > 0:
             self.clearButton.show()
         else:
             self.clearButton.hide()
 
     def focusOutEvent(self, e):
         super().focusOutEvent(e)
-        if self.text() or len(self.selectedItems) > 0:
+        if self.text() or len(self.selection) > 0:
             self.clearButton.show()
         else:
             self.clearButton.hide()
@@ -315,41 +1170,36 @@ class MSComboBox(Line, ComboBoxBase):
         return super().eventFilter(obj, e)
 
     def addItem(self, text, icon: Union[str, QIcon, FluentIconBase] = None, userData=None):
-        item = ComboItem(text, icon, userData)
-        self.items.append(item)
+        self.insertItem(len(self.items), text, icon, userData)
 
     def addItems(self, texts: Iterable[str]):
-        self.clear()
-        for text in texts:
-            self.addItem(text)
+        self.setItems(texts)
 
     def insertItem(self, index: int, text: str, icon: Union[str, QIcon, FluentIconBase] = None, userData=None):
-        item = ComboItem(text, icon, userData)
-        self.items.insert(index, item)
+        item = CompactComboItem(text, icon, userData)
+        self._insertItem(index, item)
 
     def removeItem(self, index: int):
-        pass
+        if not 0 <= index < len(self.items):
+            return
+
+        self._setItemChecked(index, False)
+        self._removeItem(index)
 
     def itemData(self, index):
-        text = None
-        try:
-            text = self.widgets[index][1].currentText()
-        except Exception as e:
-            print(e)
-        return text
+        return ComboBoxBase.itemData(self, index)
 
     def itemDatas(self):
         return [self.itemData(index) for index in self.selectedItems]
 
     def clear(self):
         """ Clears the combobox, removing all items. """
+        self.selection.clear()
 
-        tmp = copy.copy(self.selectedItems)
-        for i in tmp:
-            self.widgets[i].setChecked(False)
-
+        self._invalidateComboMenu()
         self.items.clear()
         self.widgets.clear()
+        self.itemModel.resetItems()
         if not self.isReadOnly():
             super().clear()
             super().setPlaceholderText(self._placeholderText)
@@ -377,120 +1227,78 @@ class MSComboBox(Line, ComboBoxBase):
         self.dropMenu.close()
         self.dropMenu = None
 
-    # 生成下拉菜单显示，并绑定事件
-    def _showComboMenu(self):
-        if not self.items:
-            return
+    def _buildComboMenu(self):
+        if self._isViewMode():
+            return self._createComboViewMenu()
 
         menu = self._createComboMenu()
         self.widgets.clear()
-        for i, item in enumerate(self.items):
-            if i % self.rowSize == 0:
-                tmpWidget = QWidget(menu)
-                hBoxLayout = QHBoxLayout(tmpWidget)
-                hBoxLayout.setSpacing(1)
-                hBoxLayout.setContentsMargins(1, 1, 1, 1)
-                menu.addWidget(tmpWidget)
+        with menu.updating():
+            for i, item in enumerate(self.items):
+                if i % self.rowSize == 0:
+                    tmpWidget = QWidget(menu)
+                    hBoxLayout = QHBoxLayout(tmpWidget)
+                    hBoxLayout.setSpacing(1)
+                    hBoxLayout.setContentsMargins(1, 1, 1, 1)
+                    menu.addWidget(tmpWidget)
 
-            checkbox = CheckBox()
-            # checkbox.setMaximumSize(29, 20)
-            checkbox.setMaximumHeight(20)
-            checkbox.setObjectName("Checkbox_C_" + str(i))
+                checkbox = self._createCheckBox(i, item)
+                hBoxLayout.addWidget(checkbox)
 
-            if i in self.selectedItems:
-                checkbox.setChecked(True)
-            else:
-                checkbox.setChecked(False)
+                tmpWidget.resize(menu.width(), 45)
 
-            if item.text:
-                checkbox.setText(item.text)
+                self.widgets.append(checkbox)
 
-            checkbox.stateChanged.connect(lambda state, index=i: self._onItemChecked(state, index))
-            hBoxLayout.addWidget(checkbox)
+        return menu
 
-            tmpWidget.resize(menu.width(), 45)
+    def _createItemRow(self, menu, index: int):
+        tmpWidget = QWidget(menu)
+        hBoxLayout = QHBoxLayout(tmpWidget)
+        hBoxLayout.setSpacing(1)
+        hBoxLayout.setContentsMargins(1, 1, 1, 1)
 
-            self.widgets.append(checkbox)
+        checkbox = self._createCheckBox(index, self.items[index])
+        hBoxLayout.addWidget(checkbox)
 
-        if menu.view.width() < self.width():
-            menu.view.setMinimumWidth(self.width())
-            menu.adjustSize()
+        self.widgets.insert(index, checkbox)
+        return tmpWidget
 
-        menu.setMaxVisibleItems(self.maxVisibleItems())
-        menu.closedSignal.connect(self._onDropMenuClosed)
-        self.dropMenu = menu
+    def _createCheckBox(self, index, item):
+        checkbox = CheckBox()
+        # checkbox.setMaximumSize(29, 20)
+        checkbox.setMaximumHeight(20)
+        checkbox.setObjectName("Checkbox_C_" + str(index))
 
-        x = -menu.width() // 2 + menu.layout().contentsMargins().left() + self.width() // 2
-        pd = self.mapToGlobal(QPoint(x, self.height()))
-        hd = menu.view.heightForAnimation(pd, MenuAnimationType.DROP_DOWN)
+        checkbox.setChecked(self.selection.isSelected(index))
 
-        pu = self.mapToGlobal(QPoint(x, 0))
-        hu = menu.view.heightForAnimation(pu, MenuAnimationType.PULL_UP)
+        if item.text:
+            checkbox.setText(item.text)
 
-        if hd >= hu:
-            menu.view.adjustSize(pd, MenuAnimationType.DROP_DOWN)
-            menu.exec(pd, aniType=MenuAnimationType.DROP_DOWN)
-        else:
-            menu.view.adjustSize(pu, MenuAnimationType.PULL_UP)
-            menu.exec(pu, aniType=MenuAnimationType.PULL_UP)
+        # look up the index when the state changes, since items may be inserted or removed later
+        checkbox.stateChanged.connect(lambda state, item=item: self._onItemChecked(state, self.selection.row(item)))
+        return checkbox
 
     def _onItemTextChanged(self, text, index):
         self.items[index].userData = text
 
     def _onItemChecked(self, checked, index):
-        checked = self.widgets[index].isChecked()
-        if checked:
-            self.selectedItems.append(index)
-            if self.isReadOnly():
-                self._addDeleteButton(index, self.items[int(index)].text)
-                if len(self.selectedItems) == 1:
-                    super().setPlaceholderText('')
-        else:
-            self.selectedItems.remove(index)
-            if self.isReadOnly():
-                delButton = self.findChild(PushButton, "DeleteButton_C_" + str(index))
-                if delButton:
-                    self._removeDelButton(delButton)
-                if len(self.selectedItems) == 0:
-                    super().setPlaceholderText(self._placeholderText)
-
-        if len(self.selectedItems) > 0 or self.text():
+        self._setItemChecked(index, self.widgets[index].isChecked())
+
+    def _updateSelectionState(self):
+        if self.isReadOnly():
+            super().setPlaceholderText('' if len(self.selection) else self._placeholderText)
+
+        if len(self.selection) > 0 or self.text():
             self.clearButton.show()
-        elif len(self.selectedItems) == 0 and not self.text():
+        else:
             self.clearButton.hide()
 
-    def _addDeleteButton(self, index, text):
-        delButton = PushButton(FIF.CLOSE, text)
-        delButton.setObjectName("DeleteButton_C_" + str(index))
-        delButton.clicked.connect(lambda check, index=index, text=text: self._onDeleteButtonClicked(index, text))
-
-        insert_position = 0
-        for i, widget in enumerate(self.selectedWidgets):
-            current_index = int(widget.objectName().split('_')[-1])
-            if current_index > index:
-                break
-            insert_position = i + 1
-
-        self.hBoxLayout.insertWidget(insert_position, delButton, 0, Qt.AlignmentFlag.AlignLeft)
-        self.selectedWidgets.insert(insert_position, delButton)
-
-    def _removeDelButton(self, widget):
-        self.selectedWidgets.remove(widget)
-        self.hBoxLayout.removeWidget(widget)
-        widget.deleteLater()
-
-    def _onDeleteButtonClicked(self, index, text):
-        self.widgets[int(index)].setEnabled(False)
-
-        delButton = self.findChild(PushButton, "DeleteButton_C_" + str(index))
-        if delButton:
-            self._removeDelButton(delButton)
-            self.selectedItems.remove(index)
-        if len(self.selectedWidgets) == 0:
-            super().setPlaceholderText(self._placeholderText)
-
     def _onReturnPressed(self):
-        if self.isReadOnly() or not self.text():
+        if self.isReadOnly():
+            return
+
+        self.flushSettledText()
+        if not self.text():
             return
 
         index = self.findText(self.text())
@@ -506,13 +1314,18 @@ class MSComboBox(Line, ComboBoxBase):
             return
 
         self.currentTextChanged.emit(text)
+        self._settleText(text)
 
 
-class MSEComboBox(Line, ComboBoxBase):
+class MSEComboBox(Line, MSComboBoxBase):
     """ Multi Selection Editable combo box """
 
     currentIndexChanged = Signal(int)
     currentTextChanged = Signal(str)
+    textSettled = Signal(str, object)   # text, CancelToken
+    selectedItemsChanged = Signal(list, list)   # selected indexes, deselected indexes
+    itemsReset = Signal()
+    itemsInserted = Signal(int, int)    # first, last
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -531,19 +1344,28 @@ class MSEComboBox(Line, ComboBoxBase):
         self.clearButton.clicked.disconnect()
         self.clearButton.clicked.connect(self._toggleDrop)
 
-        self.items = []
         #
-        self.selectedItems = []
-        self.selectedWidgets = []
+        self._createChipStrip()
         self.widgets = []
 
+        # the editor of rows is created on demand and recycled
+        self._cellEditor = None
+        self._editingCell = None
+        self._editingItem = None
+
         self.rowSize = 1
 
     def setCompleterMenu(self, menu):
         super().setCompleterMenu(menu)
 
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._schedulePrewarm()
+
     def setRowSize(self, size):
-        self.rowSize = size
+        if size != self.rowSize:
+            self.rowSize = size
+            self._invalidateComboMenu()
 
     def currentText(self):
         return self.text()
@@ -566,28 +1388,24 @@ class MSEComboBox(Line, ComboBoxBase):
         return super().eventFilter(obj, e)
 
     def addItem(self, text, icon: Union[str, QIcon, FluentIconBase] = None, userData=None):
-        item = ComboItem(text, icon, userData)
-        self.items.append(item)
+        self.insertItem(len(self.items), text, icon, userData)
 
     def addItems(self, texts: Iterable[str]):
-        self.clear()
-        for text in texts:
-            self.addItem(text)
+        self.setItems(texts)
 
     def insertItem(self, index: int, text: str, icon: Union[str, QIcon, FluentIconBase] = None, userData=None):
-        item = ComboItem(text, icon, userData)
-        self.items.insert(index, item)
+        item = CompactComboItem(text, icon, userData)
+        self._insertItem(index, item)
 
     def removeItem(self, index: int):
-        pass
+        if not 0 <= index < len(self.items):
+            return
+
+        self._setItemChecked(index, False)
+        self._removeItem(index)
 
     def itemData(self, index):
-        text = None
-        try:
-            text = self.widgets[index][1].currentText()
-        except Exception as e:
-            print(e)
-        return text
+        return ComboBoxBase.itemData(self, index)
 
     def itemDatas(self):
         return [self.itemData(index) for index in self.selectedItems]
@@ -596,29 +1414,27 @@ class MSEComboBox(Line, ComboBoxBase):
         self.clearSelected()
 
     def _showDrop(self, text):
-        if len(self.selectedItems) > 0 or self.text():
+        if len(self.selection) > 0 or self.text():
             self.clearButton.show()
-        elif len(self.selectedItems) == 0 and not self.text():
+        elif len(self.selection) == 0 and not self.text():
             self.clearButton.hide()
 
     def focusInEvent(self, e):
         super().focusInEvent(e)
-        if self.text() or len(self.selectedItems) > 0:
+        if self.text() or len(self.selection) > 0:
             self.clearButton.show()
         else:
             self.clearButton.hide()
 
     def focusOutEvent(self, e):
         super().focusOutEvent(e)
-        if self.text() or len(self.selectedItems) > 0:
+        if self.text() or len(self.selection) > 0:
             self.clearButton.show()
         else:
             self.clearButton.hide()
 
     def clearSelected(self):
-        tmp = copy.copy(self.selectedItems)
-        for i in tmp:
-            self.widgets[i][0].setChecked(False)
+        self.selection.clear()
 
         if not self.isReadOnly():
             super().clear()
@@ -626,13 +1442,12 @@ class MSEComboBox(Line, ComboBoxBase):
 
     def clear(self):
         """ Clears the combobox, removing all items. """
+        self.selection.clear()
 
-        tmp = copy.copy(self.selectedItems)
-        for i in tmp:
-            self.widgets[i][0].setChecked(False)
-
+        self._invalidateComboMenu()
         self.items.clear()
         self.widgets.clear()
+        self.itemModel.resetItems()
         if not self.isReadOnly():
             super().clear()
             super().setPlaceholderText(self._placeholderText)
@@ -646,6 +1461,7 @@ class MSEComboBox(Line, ComboBoxBase):
 
     # 下拉按钮关闭事件
     def _onDropMenuClosed(self):
+        self._releaseCellEditor()
         if sys.platform != "win32":
             self.dropMenu = None
         else:
@@ -660,137 +1476,148 @@ class MSEComboBox(Line, ComboBoxBase):
         self.dropMenu.close()
         self.dropMenu = None
 
-    # 生成下拉菜单显示，并绑定事件
-    def _showComboMenu(self):
-        if not self.items:
-            return
-
+    def _buildComboMenu(self):
         menu = self._createComboMenu()
         self.widgets.clear()
 
-        for i, item in enumerate(self.items):
-            tmpWidget = QWidget(menu)
-
-            if i % self.rowSize == 0:
-                hBoxLayout = QHBoxLayout(tmpWidget)
-                hBoxLayout.setSpacing(1)
-                hBoxLayout.setContentsMargins(1, 1, 1, 1)
-
-            checkbox = CheckBox()
-            checkbox.setMaximumSize(29, 20)
-            checkbox.setObjectName("Checkbox_C_" + str(i))
-            lineEdit = LineEdit(menu)
-            lineEdit.resize(100, 20)
-            lineEdit.setPlaceholderText("{}: 请输入".format(item.text))
-            lineEdit.setObjectName("LineEdit_L_" + str(i))
-
-            if i in self.selectedItems:
-                checkbox.setChecked(True)
-                lineEdit.setEnabled(True)
-            else:
-                checkbox.setChecked(False)
-                lineEdit.setEnabled(False)
-
-            if item.userData:
-                lineEdit.setText(item.userData)
-
-            checkbox.stateChanged.connect(lambda state, index=i: self._onItemChecked(state, index))
-            lineEdit.textChanged.connect(lambda text, index=i: self._onItemTextChanged(text, index))
-            hBoxLayout.addWidget(checkbox)
-            hBoxLayout.addWidget(lineEdit)
-
-            tmpWidget.resize(menu.width(), 45)
+        with menu.updating():
+            for i, item in enumerate(self.items):
+                if i % self.rowSize == 0:
+                    tmpWidget = QWidget(menu)
+                    hBoxLayout = QHBoxLayout(tmpWidget)
+                    hBoxLayout.setSpacing(1)
+                    hBoxLayout.setContentsMargins(1, 1, 1, 1)
+
+                for widget in self._createItemWidgets(menu, i, item):
+                    hBoxLayout.addWidget(widget)
+
+                if (i + 1) % self.rowSize == 0 or i == len(self.items) - 1:
+                    tmpWidget.resize(menu.width(), 45)
+                    menu.addWidget(tmpWidget)
+
+        return menu
+
+    def _createItemRow(self, menu, index: int):
+        tmpWidget = QWidget(menu)
+        hBoxLayout = QHBoxLayout(tmpWidget)
+        hBoxLayout.setSpacing(1)
+        hBoxLayout.setContentsMargins(1, 1, 1, 1)
+
+        for widget in self._createItemWidgets(menu, index, self.items[index]):
+            hBoxLayout.addWidget(widget)
+
+        tmpWidget.resize(menu.width(), 45)
+        return tmpWidget
+
+    def _createItemWidgets(self, menu, index, item):
+        """ create the check box and editor cell of item and register them """
+        checkbox = CheckBox()
+        checkbox.setMaximumSize(29, 20)
+        checkbox.setObjectName("Checkbox_C_" + str(index))
+        cell = self._createEditorCell(menu, index, item)
+
+        isSelected = self.selection.isSelected(index)
+        checkbox.setChecked(isSelected)
+        cell.setEnabled(isSelected)
+
+        # look up the index when called, since items may be inserted or removed later
+        checkbox.stateChanged.connect(lambda state, item=item: self._onItemChecked(state, self.selection.row(item)))
+
+        self.widgets.insert(index, [checkbox, cell])
+        return checkbox, cell
+
+    def _createEditorCell(self, menu, index, item):
+        """ create the cell which paints the text of item, the editor is created when it is activated """
+        cell = EditorCell(item.userData, "{}: 请输入".format(item.text), menu)
+        cell.setObjectName("EditorCell_L_" + str(index))
+        cell.setReadOnly(getattr(item, "readOnly", False))
+        cell.activated.connect(lambda cell=cell, item=item: self._editCell(cell, item))
+        return cell
+
+    def _createCellEditor(self):
+        """ create the editor which is recycled by all rows """
+        editor = LineEdit(self.comboMenu)
+        editor.textChanged.connect(self._onCellEditorTextChanged)
+        return editor
+
+    def _setUpCellEditor(self, editor, item):
+        """ load the text of item into the editor """
+        editor.setPlaceholderText("{}: 请输入".format(item.text))
+        editor.setText(item.userData or "")
+
+    def _editCell(self, cell: EditorCell, item):
+        """ move the editor into the activated cell """
+        self._releaseCellEditor()
+
+        # the text of item is written by the editor, so a shared item is copied first
+        item = self._ownItem(self.selection.row(item))
+        if self._cellEditor is None:
+            self._cellEditor = self._createCellEditor()
+
+        # the editor is detached while it is loaded, so the item is not written back
+        editor = self._cellEditor
+        self._setUpCellEditor(editor, item)
+        editor.setReadOnly(cell.isReadOnly())
+        cell.setEditor(editor)
+        self._editingCell, self._editingItem = cell, item
+        editor.setFocus()
+
+    def _releaseCellEditor(self):
+        """ take the editor back from the cell being edited, the cell paints the text again """
+        if self._editingCell is None:
+            return
 
-            menu.addWidget(tmpWidget)
+        self._editingCell.takeEditor()
+        self._cellEditor.setParent(self.comboMenu)
+        self._editingCell = self._editingItem = None
 
-            tmpList = []
-            tmpList.append(checkbox)
-            tmpList.append(lineEdit)
-            self.widgets.append(tmpList)
+    def _onCellEditorTextChanged(self, text: str):
+        if self._editingItem is None:
+            return
 
-        if menu.view.width() < self.width():
-            menu.view.setMinimumWidth(self.width())
-            menu.adjustSize()
+        self._editingItem.userData = text
+        self._editingCell.setText(text)
 
-        menu.setMaxVisibleItems(self.maxVisibleItems())
-        menu.closedSignal.connect(self._onDropMenuClosed)
-        self.dropMenu = menu
+    def _takeItemWidgets(self, index: int):
+        if self.items[index] is self._editingItem:
+            self._releaseCellEditor()
 
-        x = -menu.width()//2 + menu.layout().contentsMargins().left() + self.width()//2
-        pd = self.mapToGlobal(QPoint(x, self.height()))
-        hd = menu.view.heightForAnimation(pd, MenuAnimationType.DROP_DOWN)
+        super()._takeItemWidgets(index)
 
-        pu = self.mapToGlobal(QPoint(x, 0))
-        hu = menu.view.heightForAnimation(pu, MenuAnimationType.PULL_UP)
+    def _invalidateComboMenu(self):
+        # the menu is recycled, so the editor is deleted with the rows
+        self._releaseCellEditor()
+        if self._cellEditor is not None:
+            self._cellEditor.deleteLater()
+            self._cellEditor = None
 
-        if hd >= hu:
-            menu.view.adjustSize(pd, MenuAnimationType.DROP_DOWN)
-            menu.exec(pd, aniType=MenuAnimationType.DROP_DOWN)
-        else:
-            menu.view.adjustSize(pu, MenuAnimationType.PULL_UP)
-            menu.exec(pu, aniType=MenuAnimationType.PULL_UP)
+        super()._invalidateComboMenu()
 
-    def _onItemTextChanged(self, text, index):
-        self.items[index].userData = text
+    def _itemCheckBox(self, index: int):
+        return self.widgets[index][0]
 
     def _onItemChecked(self, checked, index):
-        checked = self.widgets[index][0].isChecked()
-        if checked:
-            self.widgets[int(index)][1].setEnabled(True)
-
-            self.selectedItems.append(index)
-            if self.isReadOnly():
-                self._addDeleteButton(index, self.items[int(index)].text)
-                if len(self.selectedItems) == 1:
-                    super().setPlaceholderText('')
-        else:
-            self.widgets[int(index)][1].setEnabled(False)
+        self._setItemChecked(index, self._itemCheckBox(index).isChecked())
+
+    def _onItemSelected(self, index, checked):
+        if self.comboMenu is not None:
+            self.widgets[int(index)][1].setEnabled(checked)
 
-            self.selectedItems.remove(index)
-            if self.isReadOnly():
-                delButton = self.findChild(PushButton, "DeleteButton_C_" + str(index))
-                if delButton:
-                    self._removeDelButton(delButton)
-                if len(self.selectedItems) == 0:
-                    super().setPlaceholderText(self._placeholderText)
+    def _updateSelectionState(self):
+        if self.isReadOnly():
+            super().setPlaceholderText('' if len(self.selection) else self._placeholderText)
 
-        if len(self.selectedItems) > 0 or self.text():
+        if len(self.selection) > 0 or self.text():
             self.clearButton.show()
-        elif len(self.selectedItems) == 0 and not self.text():
+        else:
             self.clearButton.hide()
 
-    def _addDeleteButton(self, index, text):
-        delButton = PushButton(FIF.CLOSE, text)
-        delButton.setObjectName("DeleteButton_C_" + str(index))
-        delButton.clicked.connect(lambda check, index=index, text=text: self._onDeleteButtonClicked(index, text))
-
-        insert_position = 0
-        for i, widget in enumerate(self.selectedWidgets):
-            current_index = int(widget.objectName().split('_')[-1])
-            if current_index > index:
-                break
-            insert_position = i + 1
-
-        self.hBoxLayout.insertWidget(insert_position, delButton, 0, Qt.AlignmentFlag.AlignLeft)
-        self.selectedWidgets.insert(insert_position, delButton)
-
-    def _removeDelButton(self, widget):
-        self.selectedWidgets.remove(widget)
-        self.hBoxLayout.removeWidget(widget)
-        widget.deleteLater()
-
-    def _onDeleteButtonClicked(self, index, text):
-        self.widgets[int(index)][1].setEnabled(False)
-
-        delButton = self.findChild(PushButton, "DeleteButton_C_" + str(index))
-        if delButton:
-            self._removeDelButton(delButton)
-            self.selectedItems.remove(index)
-        if len(self.selectedWidgets) == 0:
-            super().setPlaceholderText(self._placeholderText)
-
     def _onReturnPressed(self):
-        if self.isReadOnly() or not self.text():
+        if self.isReadOnly():
+            return
+
+        self.flushSettledText()
+        if not self.text():
             return
 
         index = self.findText(self.text())
@@ -806,6 +1633,7 @@ class MSEComboBox(Line, ComboBoxBase):
             return
 
         self.currentTextChanged.emit(text)
+        self._settleText(text)
 
 
 class MSECComboBox(MSEComboBox):
@@ -813,6 +1641,7 @@ class MSECComboBox(MSEComboBox):
 
     currentIndexChanged = Signal(int)
     currentTextChanged = Signal(str)
+    textSettled = Signal(str, object)   # text, CancelToken
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -821,174 +1650,135 @@ class MSECComboBox(MSEComboBox):
 
         self.widgets = {}
 
+    @property
+    def selectedItems(self) -> List[str]:
+        """ the texts of selected items in selection order """
+        return [item.text for item in self.selection.selectedItems()]
+
     def addItem(self, text: str, datas: list, icon: Union[str, QIcon, FluentIconBase] = None, userData=None):
-        item = ComBoxItem(text, datas, icon, userData)
-        self.items.append(item)
+        self.insertItem(len(self.items), text, datas, icon, userData)
 
-    def addItems(self, datas: Iterable[dict]):
-        self.clear()
-        for key, value in datas.items():
-            self.addItem(key, value)
+    def addItems(self, datas: dict):
+        self.setItems(datas)
+
+    def setItems(self, datas: Union[dict, Iterable]):
+        """ replace all items, `itemsReset` is emitted once
+
+        Parameters
+        ----------
+        datas: dict | Iterable
+            `{text: datas}` or an iterable of `(text, datas)` pairs, it can be a generator
+        """
+        super().setItems(datas.items() if isinstance(datas, dict) else datas)
+
+    def extendItems(self, datas: Union[dict, Iterable]):
+        """ append items, `itemsInserted` is emitted once """
+        super().extendItems(datas.items() if isinstance(datas, dict) else datas)
+
+    def _createItem(self, value):
+        if isinstance(value, CompactComboItem):
+            return value
+
+        text, datas = value
+        return ComBoxItem(text, datas)
 
     def insertItem(self, index: int, text: str, datas: list, icon: Union[str, QIcon, FluentIconBase] = None, userData=None):
         item = ComBoxItem(text, datas, icon, userData)
-        self.items.insert(index, item)
+        self._insertItem(index, item)
 
     def removeItem(self, index: int):
-        pass
+        if not 0 <= index < len(self.items):
+            return
+
+        self._setItemChecked(index, False)
+        self._removeItem(index)
 
     def itemData(self, key):
-        text = None
-        try:
-            text = self.widgets[key][1].currentText()
-        except Exception as e:
-            print(e)
-        return text
+        for item in self.items:
+            if item.text == key:
+                return item.userData
+
+        return None
 
     def itemDatas(self):
-        return {key: self.itemData(key) for key in self.selectedItems}
+        return {item.text: item.userData for item in self.selection.selectedItems()}
 
     def setItemReadOnly(self, key, enabled: bool):
-        for item in self.items:
+        for i, item in enumerate(self.items):
             if item.text == key:
-                item.readOnly = enabled
+                self._ownItem(i).readOnly = enabled
 
-    # 生成下拉菜单显示，并绑定事件
-    def _showComboMenu(self):
-        if not self.items:
-            return
+        if key in self.widgets:
+            self.widgets[key][1].setReadOnly(enabled)
 
+    def _buildComboMenu(self):
         menu = self._createComboMenu()
         self.widgets.clear()
-        for i, item in enumerate(self.items):
-            tmpWidget = QWidget(menu)
-
-            hBoxLayout = QHBoxLayout(tmpWidget)
-            hBoxLayout.setSpacing(1)
-            hBoxLayout.setContentsMargins(1, 1, 1, 1)
-
-            checkbox = CheckBox()
-            checkbox.setMaximumSize(29, 20)
-            checkbox.setObjectName("Checkbox_C_" + str(i))
-
-            combobox = EditableComboBox(menu)
-            combobox.resize(100, 20)
-            combobox.setPlaceholderText("{}: 请输入".format(item.text))
-            combobox.addItems(item.datas)
-            combobox.setCurrentIndex(-1)
-            combobox.setObjectName("ComboBox_L_" + str(i))
+        with menu.updating():
+            for i, item in enumerate(self.items):
+                menu.addWidget(self._createItemRow(menu, i))
 
-            if item.text in self.selectedItems:
-                checkbox.setChecked(True)
-                combobox.setEnabled(True)
-            else:
-                checkbox.setChecked(False)
-                combobox.setEnabled(False)
+        return menu
 
-            if item.userData:
-                combobox.setText(item.userData)
-            if item.readOnly:
-                combobox.setReadOnly(True)
+    def _createItemWidgets(self, menu, index, item):
+        checkbox = CheckBox()
+        checkbox.setMaximumSize(29, 20)
+        checkbox.setObjectName("Checkbox_C_" + str(index))
+        cell = self._createEditorCell(menu, index, item)
 
-            checkbox.stateChanged.connect(lambda state, index=i, key=item.text: self._onItemChecked(state, index, key))
-            combobox.textChanged.connect(lambda text, index=i, key=item.text: self._onItemTextChanged(text, index, key))
-            hBoxLayout.addWidget(checkbox)
-            hBoxLayout.addWidget(combobox)
+        isSelected = self.selection.isSelected(index)
+        checkbox.setChecked(isSelected)
+        cell.setEnabled(isSelected)
 
-            tmpWidget.resize(menu.width(), 45)
+        # look up the index when called, since items may be inserted or removed later
+        checkbox.stateChanged.connect(
+            lambda state, item=item: self._onItemChecked(state, self.selection.row(item), item.text))
 
-            menu.addWidget(tmpWidget)
+        self.widgets[item.text] = [checkbox, cell]
+        return checkbox, cell
 
-            tmpList = []
-            tmpList.append(checkbox)
-            tmpList.append(combobox)
-            self.widgets[item.text] = tmpList
+    def _createCellEditor(self):
+        editor = EditableComboBox(self.comboMenu)
+        editor.textChanged.connect(self._onCellEditorTextChanged)
+        return editor
 
-        if menu.view.width() < self.width():
-            menu.view.setMinimumWidth(self.width())
-            menu.adjustSize()
+    def _setUpCellEditor(self, editor, item):
+        editor.setPlaceholderText("{}: 请输入".format(item.text))
+        editor.setItems(item.datas)
+        editor.setCurrentIndex(-1)
+        editor.setText(item.userData or "")
 
-        menu.setMaxVisibleItems(self.maxVisibleItems())
-        menu.closedSignal.connect(self._onDropMenuClosed)
-        self.dropMenu = menu
-
-        x = -menu.width() // 2 + menu.layout().contentsMargins().left() + self.width() // 2
-        pd = self.mapToGlobal(QPoint(x, self.height()))
-        hd = menu.view.heightForAnimation(pd, MenuAnimationType.DROP_DOWN)
+    def _itemCheckBox(self, index: int):
+        return self.widgets[self.items[index].text][0]
 
-        pu = self.mapToGlobal(QPoint(x, 0))
-        hu = menu.view.heightForAnimation(pu, MenuAnimationType.PULL_UP)
+    def _takeItemWidgets(self, index: int):
+        if self.items[index] is self._editingItem:
+            self._releaseCellEditor()
 
-        if hd >= hu:
-            menu.view.adjustSize(pd, MenuAnimationType.DROP_DOWN)
-            menu.exec(pd, aniType=MenuAnimationType.DROP_DOWN)
-        else:
-            menu.view.adjustSize(pu, MenuAnimationType.PULL_UP)
-            menu.exec(pu, aniType=MenuAnimationType.PULL_UP)
+        self.widgets.pop(self.items[index].text, None)
 
-    def _onItemTextChanged(self, text, index, key):
-        self.items[index].userData = text
+    def clear(self):
+        """ Clears the combobox, removing all items. """
+        self.clearSelected()
+        self._invalidateComboMenu()
+        self.items.clear()
+        self.widgets.clear()
+        self.itemModel.resetItems()
 
     def _onItemChecked(self, checked, index, key):
-        checked = self.widgets[key][0].isChecked()
+        self._setItemChecked(index, self.widgets[key][0].isChecked())
 
-        if checked:
-            self.widgets[key][1].setEnabled(True)
+    def _onItemSelected(self, index, checked):
+        key = self.items[index].text
+        if key in self.widgets:
+            self.widgets[key][1].setEnabled(checked)
 
-            self.selectedItems.append(key)
-            if self.isReadOnly():
-                self._addDeleteButton(index, key)
-                if len(self.selectedItems) == 1:
-                    tmp = self._placeholderText
-                    self.setPlaceholderText('')
-                    self._placeholderText = tmp
 
-        else:
-            self.widgets[key][1].setEnabled(False)
-
-            if self.isReadOnly():
-                delButton = self.findChild(PushButton, "DeleteButton_C_" + str(index))
-                if delButton:
-                    self._removeDelButton(delButton)
-                    self.selectedItems.remove(key)
-                if len(self.selectedItems) == 0:
-                    self.setPlaceholderText(self._placeholderText)
-
-    def _addDeleteButton(self, index, text):
-        delButton = PushButton(FIF.CLOSE, text)
-        delButton.setObjectName("DeleteButton_C_" + str(index))
-        delButton.clicked.connect(lambda check, index=index, text=text: self._onDeleteButtonClicked(index, text))
-
-        insert_position = 0
-        for i, widget in enumerate(self.selectedWidgets):
-            current_index = int(widget.objectName().split('_')[-1])
-            if current_index > index:
-                break
-            insert_position = i + 1
-
-        self.hBoxLayout.insertWidget(insert_position, delButton, 0, Qt.AlignmentFlag.AlignLeft)
-        self.selectedWidgets.insert(insert_position, delButton)
-
-    def _removeDelButton(self, widget):
-        self.selectedWidgets.remove(widget)
-        self.hBoxLayout.removeWidget(widget)
-        widget.deleteLater()
-
-    def _onDeleteButtonClicked(self, index, key):
-        self.widgets[key][1].setEnabled(False)
-
-        delButton = self.findChild(PushButton, "DeleteButton_C_" + str(index))
-        if delButton:
-            self._removeDelButton(delButton)
-            self.selectedItems.remove(key)
-
-        if len(self.selectedWidgets) == 0:
-            self.setPlaceholderText(self._placeholderText)
-
-
-class ComBoxItem:
+class ComBoxItem(CompactComboItem):
     """ Combo box item """
 
+    __slots__ = ("datas", "readOnly")
+
     def __init__(self, text: str, datas: list, icon: Union[str, QIcon, FluentIconBase] = None, userData=None):
         """ add item
 
@@ -997,28 +1787,15 @@ class ComBoxItem:
         text: str
             the text of item
 
+        datas: list
+            the candidate datas of item
+
         icon: str | QIcon | FluentIconBase
             the icon of item
 
         userData: Any
             user data
         """
-        self.text = text
+        super().__init__(text, icon, userData)
         self.datas = datas
-        self.userData = userData
         self.readOnly = False
-        self.icon = icon
-
-    @property
-    def icon(self):
-        if isinstance(self._icon, QIcon):
-            return self._icon
-
-        return self._icon.icon()
-
-    @icon.setter
-    def icon(self, ico: Union[str, QIcon, FluentIconBase]):
-        if ico:
-            self._icon = QIcon(ico) if isinstance(ico, str) else ico
-        else:
-            self._icon = QIcon()
\ No newline at end of file
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from collections import OrderedDict
+from functools import partial
+
+from PySide6.QtCore import QObject, Signal, QThreadPool
+
+from qfluentexpand.common.worker import CancelFlag, WorkerRelay
+
+
+class ItemFilter(QObject):
+    """ Incremental filter over the texts of combo box items
+
+    The scan runs on a worker thread and the matched rows are delivered in batches by
+    `rowsMatched`. A filter text which contains a cached one only scans its matched rows.
+    """
+
+    started = Signal()
+    rowsMatched = Signal(list)
+    finished = Signal(list)
+    cleared = Signal()
+
+    def __init__(self, items: list, batchSize=1000, cacheSize=32, parent=None):
+        """
+        Parameters
+        ----------
+        items: list
+            the item list of combo box, it is shared
+
+        batchSize: int
+            the number of matched rows delivered at a time
+
+        cacheSize: int
+            the maximum number of cached results
+
+        parent: QObject
+            parent object
+        """
+        super().__init__(parent=parent)
+        self.batchSize = batchSize
+        self.cacheSize = cacheSize
+
+        self._items = items
+        self._keys = None           # case folded texts, snapshot of items
+        self._snapshot = 0
+        self._cache = OrderedDict() # key -> matched rows
+        self._key = ""
+        self._scanFlag = None       # cancellation flag of the scan in progress
+
+    def filterText(self):
+        return self._key
+
+    def isActive(self):
+        return bool(self._key)
+
+    def setFilterText(self, text: str):
+        """ filter the items, an empty text clears the filter """
+        key = text.casefold()
+        if key == self._key:
+            return
+
+        self._key = key
+        self._cancelScan()
+        if key:
+            self._start()
+        else:
+            self.cleared.emit()
+
+    def invalidate(self):
+        """ drop the snapshot and cached results, it should be called after the items are changed """
+        self._keys = None
+        self._snapshot += 1
+        self._cache.clear()
+
+        if self._key:
+            self._cancelScan()
+            self._start()
+
+    def _start(self):
+        if self._keys is None:
+            if hasattr(self._items, "foldedTexts"):
+                self._keys = self._items.foldedTexts()     # shared with catalog, read only
+            else:
+                self._keys = [str(item.text).casefold() for item in self._items]
+
+        key = self._key
+        self.started.emit()
+
+        rows = self._cache.get(key)
+        if rows is not None:
+            self._cache.move_to_end(key)
+            self.rowsMatched.emit(rows)
+            self.finished.emit(rows)
+            return
+
+        # scan the narrowest cached result which contains the key
+        candidates = None
+        for k, rows in self._cache.items():
+            if k in key and (candidates is None or len(rows) < len(candidates)):
+                candidates = rows
+
+        # the worker only touches the flag and relay, so the filter can be deleted during the scan
+        flag = self._scanFlag = CancelFlag()
+        relay = WorkerRelay()
+        relay.posted.connect(self._onScanPosted)
+        QThreadPool.globalInstance().start(
+            partial(_scan, flag, relay, self._snapshot, key, self._keys, candidates, self.batchSize))
+
+    def _cancelScan(self):
+        if self._scanFlag is not None:
+            self._scanFlag.cancel()
+            self._scanFlag = None
+
+    def _onScanPosted(self, value):
+        flag, rows, result = value
+        if result is None:
+            if flag is self._scanFlag:
+                self.rowsMatched.emit(rows)
+
+            return
+
+        # the results of an outdated snapshot are not cached
+        snapshot, key = result
+        if snapshot == self._snapshot:
+            self._cache[key] = rows
+            if len(self._cache) > self.cacheSize:
+                self._cache.popitem(last=False)
+
+        if flag is self._scanFlag:
+            self._scanFlag = None
+            self.finished.emit(rows)
+
+
+def _scan(flag: CancelFlag, relay: WorkerRelay, snapshot: int, key: str, keys: list, candidates: list,
+          batchSize: int):
+    """ scan the rows on worker thread, a batch is posted as `(flag, rows, None)` and the
+    result as `(flag, rows, (snapshot, key))` """
+    try:
+        rows = range(len(keys)) if candidates is None else candidates
+        matched = []
+        batch = []
+        for i, row in enumerate(rows):
+            if key in keys[row]:
+                batch.append(row)
+
+            if len(batch) >= batchSize or (i & 0xfff) == 0xfff:
+                if flag.isCancelled():
+                    return
+
+                if len(batch) >= batchSize:
+                    relay.post((flag, batch, None))
+                    matched.extend(batch)
+                    batch = []
+
+        if batch:
+            relay.post((flag, batch, None))
+            matched.extend(batch)
+
+        relay.post((flag, matched, (snapshot, key)))
+    finally:
+        relay.close()
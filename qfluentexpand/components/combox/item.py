@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from typing import Union
+
+from PySide6.QtGui import QIcon
+
+from qfluentwidgets.common.icon import isDarkTheme, FluentIconBase
+
+
+class IconTable:
+    """ Interned icons of combo box items, an item stores the id of its icon """
+
+    def __init__(self):
+        self._icons = [None]    # id -> str | QIcon | FluentIconBase, 0 is the null icon
+        self._ids = {}          # key of icon -> id
+        self._cache = {}        # id or (id, isDark) -> QIcon
+        self._nullIcon = None
+
+    def __len__(self):
+        return len(self._icons)
+
+    def intern(self, icon: Union[str, QIcon, FluentIconBase, None]) -> int:
+        """ Returns the id of icon, the icon is added if it is not interned yet """
+        if not icon or (isinstance(icon, QIcon) and icon.isNull()):
+            return 0
+
+        key = ("qicon", icon.cacheKey()) if isinstance(icon, QIcon) else icon
+        id_ = self._ids.get(key)
+        if id_ is None:
+            id_ = len(self._icons)
+            self._icons.append(icon)
+            self._ids[key] = id_
+
+        return id_
+
+    def source(self, id_: int):
+        """ Returns the interned str, QIcon or FluentIconBase, `None` for the null icon """
+        return self._icons[id_]
+
+    def icon(self, id_: int) -> QIcon:
+        """ Returns the cached QIcon of id """
+        if id_ == 0:
+            if self._nullIcon is None:
+                self._nullIcon = QIcon()
+
+            return self._nullIcon
+
+        source = self._icons[id_]
+        key = (id_, isDarkTheme()) if isinstance(source, FluentIconBase) else id_
+        icon = self._cache.get(key)
+        if icon is None:
+            if isinstance(source, FluentIconBase):
+                icon = source.icon()
+            else:
+                icon = source if isinstance(source, QIcon) else QIcon(source)
+
+            self._cache[key] = icon
+
+        return icon
+
+
+iconTable = IconTable()
+
+
+class CompactComboItem:
+    """ Compact combo box item, it has the same interface as `ComboItem` """
+
+    __slots__ = ("text", "userData", "_iconId")
+
+    def __init__(self, text: str, icon: Union[str, QIcon, FluentIconBase] = None, userData=None):
+        """
+        Parameters
+        ----------
+        text: str
+            the text of item
+
+        icon: str | QIcon | FluentIconBase
+            the icon of item
+
+        userData: Any
+            user data
+        """
+        self.text = text
+        self.userData = userData
+        self._iconId = iconTable.intern(icon)
+
+    @property
+    def icon(self) -> QIcon:
+        return iconTable.icon(self._iconId)
+
+    @icon.setter
+    def icon(self, icon: Union[str, QIcon, FluentIconBase]):
+        self._iconId = iconTable.intern(icon)
+
+    def iconId(self) -> int:
+        return self._iconId
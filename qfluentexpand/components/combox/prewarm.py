@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import time
+from collections import OrderedDict
+
+from shiboken6 import isValid
+from PySide6.QtCore import QObject, QTimer
+
+
+class MenuPrewarmer(QObject):
+    """ Builds the drop down menus of combo boxes in idle time
+
+    The steps are provided by the generator `_prewarmComboMenu()` of combo box, and
+    all combo boxes share the `budget` milliseconds of an idle slice.
+    """
+
+    _instance = None
+
+    def __init__(self, budget=8, parent=None):
+        super().__init__(parent=parent)
+        self.budget = budget
+        self._queue = OrderedDict()     # id(comboBox) -> [comboBox, generator]
+        self._watched = set()           # id of the combo boxes whose destroyed signal is connected
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._onIdle)
+
+    @classmethod
+    def instance(cls):
+        """ Returns the global prewarmer """
+        if cls._instance is None:
+            cls._instance = MenuPrewarmer()
+
+        return cls._instance
+
+    def setBudget(self, budget: int):
+        """ set the milliseconds spent in an idle slice """
+        self.budget = max(1, budget)
+
+    def isPending(self, comboBox):
+        return id(comboBox) in self._queue
+
+    def schedule(self, comboBox):
+        """ schedule a combo box, its generator is created when it is warmed up """
+        key = id(comboBox)
+        if key in self._queue:
+            return
+
+        self._queue[key] = [comboBox, None]
+        if key not in self._watched:
+            self._watched.add(key)
+            comboBox.destroyed.connect(lambda *_, key=key: self._onDestroyed(key))
+
+        self._timer.start()
+
+    def cancel(self, comboBox):
+        entry = self._queue.pop(id(comboBox), None)
+        if entry is not None and entry[1] is not None:
+            entry[1].close()
+
+    def finish(self, comboBox):
+        """ run the remaining steps of a combo box now, e.g. it is popped up before warmed up """
+        entry = self._queue.pop(id(comboBox), None)
+        if entry is None or entry[1] is None:
+            return
+
+        for _ in entry[1]:
+            pass
+
+    def _onIdle(self):
+        deadline = time.perf_counter() + self.budget / 1000
+        while self._queue and time.perf_counter() < deadline:
+            key, entry = next(iter(self._queue.items()))
+            if not isValid(entry[0]):
+                # the C++ object is deleted before its destroyed signal is handled
+                self._onDestroyed(key)
+                continue
+
+            try:
+                if entry[1] is None:
+                    entry[1] = entry[0]._prewarmComboMenu()
+
+                next(entry[1])
+            except StopIteration:
+                self._queue.pop(key, None)
+
+        if not self._queue:
+            self._timer.stop()
+
+    def _onDestroyed(self, key):
+        self._watched.discard(key)
+        self._queue.pop(key, None)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import inspect
+from itertools import islice
+from typing import Iterable, Callable, Union
+
+from PySide6.QtCore import QObject, Signal
+
+from qfluentexpand.common.worker import CoroutineRunner
+
+
+class ItemProvider(QObject):
+    """ Paged item provider of combo box
+
+    The source is an iterable or a coroutine function `fetch(offset, limit)`, a page
+    shorter than `pageSize` ends the source. The pages are delivered in GUI thread.
+    """
+
+    pageFetched = Signal(list)
+    fetchFailed = Signal(str)
+    finished = Signal()
+
+    def __init__(self, source: Union[Iterable, Callable], pageSize=100, prefetchDistance=20, parent=None):
+        """
+        Parameters
+        ----------
+        source: Iterable | Callable
+            an iterable of items, or a coroutine function `fetch(offset, limit) -> list`
+
+        pageSize: int
+            the number of items fetched at a time
+
+        prefetchDistance: int
+            the number of items left below the visible ones when the next page is fetched
+
+        parent: QObject
+            parent object
+        """
+        super().__init__(parent=parent)
+        self.pageSize = pageSize
+        self.prefetchDistance = prefetchDistance
+
+        self._isAsync = inspect.iscoroutinefunction(source)
+        self._source = source if self._isAsync else iter(source)
+        self._offset = 0
+        self._isFinished = False
+        self._isFetching = False
+
+        self._runner = CoroutineRunner(self)
+        self._runner.finished.connect(self._onPageReady)
+        self._runner.failed.connect(self._onPageFailed)
+
+    def isAsync(self):
+        return self._isAsync
+
+    def isFinished(self):
+        return self._isFinished
+
+    def isFetching(self):
+        return self._isFetching
+
+    def canFetchMore(self):
+        return not self._isFinished and not self._isFetching
+
+    def fetchMore(self):
+        """ fetch the next page, an iterable source is consumed synchronously """
+        if not self.canFetchMore():
+            return
+
+        if not self._isAsync:
+            self._deliver(list(islice(self._source, self.pageSize)))
+            return
+
+        self._isFetching = True
+        self._runner.run(self._source(self._offset, self.pageSize))
+
+    def cancel(self):
+        """ cancel the fetch in progress, the page will be fetched again by next `fetchMore()` """
+        self._isFetching = False
+        self._runner.cancel()
+
+    def _onPageReady(self, page):
+        self._isFetching = False
+        self._deliver(list(page or []))
+
+    def _onPageFailed(self, error: str):
+        self._isFetching = False
+        self.fetchFailed.emit(error)
+
+    def _deliver(self, page: list):
+        self._offset += len(page)
+        self._isFinished = len(page) < self.pageSize
+
+        if page:
+            self.pageFetched.emit(page)
+        if self._isFinished:
+            self.finished.emit()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from typing import Iterable, List
+
+from PySide6.QtCore import QObject, Signal
+
+
+class ItemSelection(QObject):
+    """ Selection store of multi selection combo box, the items are keyed by identity """
+
+    selectionChanged = Signal(list, list)   # selected rows, deselected rows
+
+    def __init__(self, items: list, parent=None):
+        super().__init__(parent=parent)
+        self._items = items     # shared with combo box
+        self._selected = {}     # id(item) -> item, in selection order
+        self._rows = {}         # id(item) -> row
+        self._aliases = {}      # id(old item) -> (old item, new item)
+        self._isDirty = True
+
+    def __len__(self):
+        return len(self._selected)
+
+    def __contains__(self, row: int):
+        return self.isSelected(row)
+
+    def invalidate(self):
+        """ mark the `item -> row` map stale, it should be called after the item list is changed """
+        self._isDirty = True
+
+    def row(self, item) -> int:
+        """ Returns the row of item, otherwise returns -1 """
+        self._ensureRows()
+        row = self._rows.get(id(item), -1)
+        if row < 0 and id(item) in self._aliases:
+            return self.row(self._aliases[id(item)][1])
+
+        return row
+
+    def rows(self) -> List[int]:
+        """ Returns the selected rows in selection order """
+        self._ensureRows()
+        return [self._rows[key] for key in self._selected]
+
+    def selectedItems(self) -> list:
+        """ Returns the selected items in selection order """
+        self._ensureRows()
+        return list(self._selected.values())
+
+    def isSelected(self, row: int) -> bool:
+        if not 0 <= row < len(self._items):
+            return False
+
+        return id(self._items[row]) in self._selected
+
+    def select(self, row: int, selected=True) -> bool:
+        """ select or deselect a row, return whether the selection is changed """
+        return self.selectRows([row], selected)
+
+    def selectRows(self, rows: Iterable[int], selected=True) -> bool:
+        """ select or deselect rows and emit `selectionChanged` once, the invalid rows are ignored """
+        self._ensureRows()
+        changed = []
+        for row in rows:
+            if not 0 <= row < len(self._items):
+                continue
+
+            item = self._items[row]
+            key = id(item)
+            if (key in self._selected) == selected:
+                continue
+
+            if selected:
+                self._selected[key] = item
+            else:
+                del self._selected[key]
+
+            changed.append(row)
+
+        if not changed:
+            return False
+
+        if selected:
+            self.selectionChanged.emit(changed, [])
+        else:
+            self.selectionChanged.emit([], changed)
+
+        return True
+
+    def selectRange(self, first: int, last: int, selected=True) -> bool:
+        """ select or deselect the rows in `[first, last]` """
+        first = max(first, 0)
+        last = min(last, len(self._items) - 1)
+        return self.selectRows(range(first, last + 1), selected)
+
+    def selectAll(self) -> bool:
+        return self.selectRange(0, len(self._items) - 1)
+
+    def setSelectedRows(self, rows: Iterable[int]) -> bool:
+        """ replace the selection with rows and emit `selectionChanged` once """
+        self._ensureRows()
+        selected = {}
+        for row in rows:
+            if 0 <= row < len(self._items):
+                item = self._items[row]
+                selected[id(item)] = item
+
+        deselected = [self._rows[key] for key in self._selected if key not in selected]
+        added = [self._rows[key] for key in selected if key not in self._selected]
+        if not deselected and not added:
+            return False
+
+        self._selected = selected
+        self.selectionChanged.emit(added, deselected)
+        return True
+
+    def invertSelection(self) -> bool:
+        """ select the unselected rows and deselect the selected rows """
+        self._ensureRows()
+        deselected = [self._rows[key] for key in self._selected]
+        selected = {}
+        for item in self._items:
+            if id(item) not in self._selected:
+                selected[id(item)] = item
+
+        if not deselected and not selected:
+            return False
+
+        self._selected = selected
+        self.selectionChanged.emit(self.rows(), deselected)
+        return True
+
+    def replaceItem(self, old, new):
+        """ replace the item object of a row, `row(old)` still returns its row """
+        if old is new:
+            return
+
+        key = id(old)
+        if key in self._selected:
+            self._selected = {(id(new) if k == key else k): (new if k == key else v)
+                              for k, v in self._selected.items()}
+
+        # the old item is kept alive, so its id is not reused
+        self._aliases[key] = (old, new)
+        self._isDirty = True
+
+    def clear(self) -> bool:
+        """ deselect all rows """
+        return self.setSelectedRows([])
+
+    def _ensureRows(self):
+        if not self._isDirty:
+            return
+
+        if hasattr(self._items, "rowMap"):
+            self._rows = self._items.rowMap()    # shared with catalog, read only
+        else:
+            self._rows = {id(item): i for i, item in enumerate(self._items)}
+
+        if self._aliases:
+            self._aliases = {k: v for k, v in self._aliases.items() if id(v[1]) in self._rows}
+
+        # drop the items which are removed from the list
+        if any(key not in self._rows for key in self._selected):
+            self._selected = {k: v for k, v in self._selected.items() if k in self._rows}
+
+        self._isDirty = False
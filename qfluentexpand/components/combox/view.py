@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from typing import List
+
+from PySide6.QtCore import Qt, QAbstractListModel, QAbstractTableModel, QModelIndex, QRectF, QSize
+from PySide6.QtGui import QPainter, QColor
+from PySide6.QtWidgets import QTableView, QHeaderView, QStyledItemDelegate, QStyleOptionViewItem, QStyle
+
+from qfluentwidgets.common.icon import isDarkTheme
+from qfluentwidgets.common.style_sheet import themeColor
+from qfluentwidgets.common.font import getFont
+from qfluentwidgets.components.widgets.check_box import CheckBoxIcon
+from qfluentwidgets.components.widgets.scroll_bar import SmoothScrollDelegate
+
+from qfluentexpand.common.text_metrics import textMetrics
+from qfluentexpand.components.combox.selection import ItemSelection
+
+
+class ComboItemModel(QAbstractListModel):
+    """ Checkable list model over the items of a combo box, the check states are kept by its selection """
+
+    def __init__(self, items: list, selection: ItemSelection, parent=None):
+        # the item list is shared with combo box, not copied
+        super().__init__(parent=parent)
+        self._items = items
+        self._selection = selection
+        self._selection.selectionChanged.connect(self._onSelectionChanged)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return len(self._items)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if row >= len(self._items):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._items[row].text
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self._selection.isSelected(row) else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.UserRole:
+            return self._items[row].userData
+
+        return None
+
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+
+        checked = value in (Qt.CheckState.Checked, Qt.CheckState.Checked.value, True)
+        return self.setChecked(index.row(), checked)
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+
+    def isChecked(self, row: int):
+        return self._selection.isSelected(row)
+
+    def setChecked(self, row: int, checked: bool):
+        """ set the check state of row, return whether the state is changed """
+        return self._selection.select(row, checked)
+
+    def toggle(self, row: int):
+        self.setChecked(row, not self.isChecked(row))
+
+    def insertItem(self, index: int, item):
+        """ insert item to the shared item list """
+        index = max(0, min(index, len(self._items)))
+        self.beginInsertRows(QModelIndex(), index, index)
+        self._items.insert(index, item)
+        self._selection.invalidate()
+        self.endInsertRows()
+
+    def appendItems(self, items: list):
+        """ append items to the shared item list with a single `rowsInserted` """
+        if not items:
+            return
+
+        start = len(self._items)
+        self.beginInsertRows(QModelIndex(), start, start + len(items) - 1)
+        self._items.extend(items)
+        self._selection.invalidate()
+        self.endInsertRows()
+
+    def removeItem(self, index: int):
+        """ remove item from the shared item list """
+        if not 0 <= index < len(self._items):
+            return None
+
+        self.beginRemoveRows(QModelIndex(), index, index)
+        item = self._items.pop(index)
+        self._selection.invalidate()
+        self.endRemoveRows()
+        return item
+
+    def resetItems(self, items: list = None):
+        """ reset the model after the item list is changed """
+        self.beginResetModel()
+        if items is not None:
+            self._items = items
+
+        self._selection.invalidate()
+        self.endResetModel()
+
+    def _onSelectionChanged(self, selected: list, deselected: list):
+        rows = selected + deselected
+        if not rows:
+            return
+
+        # one notification for the whole batch
+        first, last = min(rows), max(rows)
+        self.dataChanged.emit(self.index(first), self.index(last), [Qt.ItemDataRole.CheckStateRole])
+
+
+class ComboFilterModel(QAbstractListModel):
+    """ Filtered view of combo item model, the matched rows are appended in batches """
+
+    def __init__(self, source: ComboItemModel, parent=None):
+        super().__init__(parent=parent)
+        self._source = source
+        self._rows = None   # matched source rows, `None` means all rows
+
+        source.dataChanged.connect(self._onSourceDataChanged)
+        source.rowsAboutToBeInserted.connect(self._onSourceAboutToBeInserted)
+        source.rowsInserted.connect(self._onSourceInserted)
+        source.rowsAboutToBeRemoved.connect(self._onSourceAboutToBeRemoved)
+        source.rowsRemoved.connect(self._onSourceRemoved)
+        source.modelAboutToBeReset.connect(self.beginResetModel)
+        source.modelReset.connect(self._onSourceReset)
+
+    def isFiltered(self):
+        return self._rows is not None
+
+    def sourceRow(self, row: int):
+        return row if self._rows is None else self._rows[row]
+
+    def beginFilter(self):
+        """ empty the rows, the matched rows will be appended by `appendRows` """
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
+    def appendRows(self, rows: list):
+        """ append a batch of matched source rows """
+        if not rows or self._rows is None:
+            return
+
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def clearFilter(self):
+        """ pass all rows of source model through """
+        if self._rows is None:
+            return
+
+        self.beginResetModel()
+        self._rows = None
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return self._source.rowCount() if self._rows is None else len(self._rows)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self.rowCount():
+            return None
+
+        return self._source.data(self._source.index(self.sourceRow(index.row())), role)
+
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+
+        return self._source.setData(self._source.index(self.sourceRow(index.row())), value, role)
+
+    def flags(self, index: QModelIndex):
+        return self._source.flags(index)
+
+    def isChecked(self, row: int):
+        return self._source.isChecked(self.sourceRow(row))
+
+    def toggle(self, row: int):
+        self._source.toggle(self.sourceRow(row))
+
+    def _onSourceDataChanged(self, topLeft, bottomRight, roles=()):
+        if self._rows is None:
+            self.dataChanged.emit(self.index(topLeft.row()), self.index(bottomRight.row()), roles)
+        elif self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1), roles)
+
+    def _onSourceAboutToBeInserted(self, parent, first, last):
+        if self._rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+        else:
+            self.beginResetModel()
+
+    def _onSourceInserted(self, parent, first, last):
+        if self._rows is None:
+            self.endInsertRows()
+        else:
+            self._onSourceReset()
+
+    def _onSourceAboutToBeRemoved(self, parent, first, last):
+        if self._rows is None:
+            self.beginRemoveRows(QModelIndex(), first, last)
+        else:
+            self.beginResetModel()
+
+    def _onSourceRemoved(self, parent, first, last):
+        if self._rows is None:
+            self.endRemoveRows()
+        else:
+            self._onSourceReset()
+
+    def _onSourceReset(self):
+        if self._rows is not None:
+            self._rows = []
+
+        self.endResetModel()
+
+
+class ComboGridModel(QAbstractTableModel):
+    """ Grid of a checkable list model, the row `i` is shown in the cell `(i // columns, i % columns)` """
+
+    def __init__(self, source: QAbstractListModel, columns=1, parent=None):
+        super().__init__(parent=parent)
+        self._source = source
+        self._columns = max(1, columns)
+        self._count = source.rowCount()
+
+        source.dataChanged.connect(self._onSourceDataChanged)
+        source.rowsInserted.connect(self._onSourceInserted)
+        source.rowsRemoved.connect(self._onSourceReset)
+        source.modelReset.connect(self._onSourceReset)
+
+    def columns(self):
+        return self._columns
+
+    def setColumns(self, columns: int):
+        self.beginResetModel()
+        self._columns = max(1, columns)
+        self.endResetModel()
+
+    def sourceRow(self, index: QModelIndex) -> int:
+        """ Returns the source row of cell, `-1` if the cell is empty """
+        if not index.isValid():
+            return -1
+
+        row = index.row() * self._columns + index.column()
+        return row if row < self._count else -1
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return (self._count + self._columns - 1) // self._columns
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._columns
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        row = self.sourceRow(index)
+        if row < 0:
+            return None
+
+        return self._source.data(self._source.index(row), role)
+
+    def flags(self, index: QModelIndex):
+        if self.sourceRow(index) < 0:
+            return Qt.ItemFlag.NoItemFlags
+
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def isChecked(self, row: int):
+        return self._source.isChecked(row)
+
+    def toggle(self, row: int):
+        """ toggle the source row """
+        self._source.toggle(row)
+
+    def _onSourceDataChanged(self, topLeft, bottomRight, roles=()):
+        first, last = topLeft.row() // self._columns, bottomRight.row() // self._columns
+        self.dataChanged.emit(self.index(first, 0), self.index(last, self._columns - 1), roles)
+
+    def _onSourceInserted(self, parent, first, last):
+        if first != self._count:
+            return self._onSourceReset()
+
+        # only the appended rows are inserted, the last partial grid row is updated
+        oldRows = self.rowCount()
+        count = self._source.rowCount()
+        newRows = (count + self._columns - 1) // self._columns
+        if newRows > oldRows:
+            self.beginInsertRows(QModelIndex(), oldRows, newRows - 1)
+            self._count = count
+            self.endInsertRows()
+        else:
+            self._count = count
+
+        if oldRows and first % self._columns:
+            self.dataChanged.emit(self.index(oldRows - 1, 0), self.index(oldRows - 1, self._columns - 1))
+
+    def _onSourceReset(self, *args):
+        self.beginResetModel()
+        self._count = self._source.rowCount()
+        self.endResetModel()
+
+
+class CheckableItemDelegate(QStyledItemDelegate):
+    """ Delegate which paints a check box indicator and the item text """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.itemHeight = 33
+        self.hoverRow = -1
+        self.hoverColumn = 0
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.itemHeight)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        # the empty cells of grid are not painted
+        checkState = index.data(Qt.ItemDataRole.CheckStateRole)
+        if checkState is None:
+            return
+
+        painter.save()
+        painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.TextAntialiasing)
+        rect = option.rect
+        isDark = isDarkTheme()
+
+        # draw hover background
+        if index.row() == self.hoverRow and index.column() == self.hoverColumn:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(255, 255, 255, 9) if isDark else QColor(0, 0, 0, 9))
+            painter.drawRoundedRect(rect.adjusted(4, 1, -4, -1), 5, 5)
+
+        # draw the focus frame of keyboard navigation
+        if option.state & QStyle.StateFlag.State_HasFocus:
+            painter.setPen(themeColor())
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(QRectF(rect).adjusted(4.5, 1.5, -4.5, -1.5), 5, 5)
+
+        # draw check box indicator
+        checked = checkState == Qt.CheckState.Checked
+        box = QRectF(rect.x() + 12, rect.y() + (rect.height() - 18) / 2, 18, 18)
+        if checked:
+            painter.setPen(themeColor())
+            painter.setBrush(themeColor())
+        else:
+            painter.setPen(QColor(255, 255, 255, 141) if isDark else QColor(0, 0, 0, 122))
+            painter.setBrush(QColor(0, 0, 0, 26) if isDark else QColor(0, 0, 0, 6))
+
+        painter.drawRoundedRect(box, 4.5, 4.5)
+        if checked:
+            CheckBoxIcon.ACCEPT.render(painter, box)
+
+        # draw text
+        painter.setFont(option.font)
+        painter.setPen(Qt.GlobalColor.white if isDark else Qt.GlobalColor.black)
+        textRect = rect.adjusted(40, 0, -8, 0)
+        text = textMetrics.elidedText(option.font, index.data(Qt.ItemDataRole.DisplayRole) or "", textRect.width())
+        painter.drawText(textRect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+
+        painter.restore()
+
+
+class ComboListView(QTableView):
+    """ Virtualized list view of combo box drop down, only the visible rows are painted """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.delegate = CheckableItemDelegate(self)
+        self.scrollDelegate = SmoothScrollDelegate(self)
+
+        self.setItemDelegate(self.delegate)
+        self.setMouseTracking(True)
+        self.setFont(getFont(14))
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSelectionMode(QTableView.SelectionMode.NoSelection)
+        self.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.setFrameShape(QTableView.Shape.NoFrame)
+        self.setStyleSheet("ComboListView{background: transparent; border: none}")
+
+        self.horizontalHeader().hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        # fixed-size sections are laid out without querying the model row by row
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setMinimumSectionSize(1)
+        self.verticalHeader().setDefaultSectionSize(self.delegate.itemHeight)
+
+        self.entered.connect(self._onEntered)
+
+    def itemHeight(self):
+        return self.delegate.itemHeight
+
+    def setItemHeight(self, height: int):
+        self.delegate.itemHeight = height
+        self.verticalHeader().setDefaultSectionSize(height)
+
+    def heightForRows(self, rows: int):
+        """ Return the height needed to show `rows` rows """
+        return max(rows, 1) * self.itemHeight() + 2
+
+    def _onEntered(self, index: QModelIndex):
+        self.delegate.hoverRow = index.row()
+        self.delegate.hoverColumn = index.column()
+        self.viewport().update()
+
+    def leaveEvent(self, e):
+        super().leaveEvent(e)
+        self.delegate.hoverRow = -1
+        self.viewport().update()
+
+    def mouseReleaseEvent(self, e):
+        index = self.indexAt(e.pos())
+        if e.button() == Qt.MouseButton.LeftButton and index.isValid() and self.model():
+            self._toggleIndex(index)
+
+        super().mouseReleaseEvent(e)
+
+    def keyPressEvent(self, e):
+        index = self.currentIndex()
+        if e.key() in (Qt.Key.Key_Space, Qt.Key.Key_Return, Qt.Key.Key_Enter) and index.isValid():
+            self._toggleIndex(index)
+            return
+
+        super().keyPressEvent(e)
+
+    def _toggleIndex(self, index: QModelIndex):
+        self.model().toggle(index.row())
+
+
+class ComboGridView(ComboListView):
+    """ Virtualized grid view of combo box drop down, only the visible grid rows are painted """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.horizontalHeader().setStretchLastSection(False)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+
+    def _toggleIndex(self, index: QModelIndex):
+        row = self.model().sourceRow(index)
+        if row >= 0:
+            self.model().toggle(row)
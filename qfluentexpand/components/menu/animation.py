@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import time
+from enum import Enum
+
+from PySide6.QtCore import QObject, Signal
+
+
+class AnimationMode(Enum):
+    """ Animation mode of menus """
+
+    ALWAYS = 0      # animate as the menu is asked to
+    NEVER = 1       # never animate, e.g. a remote desktop session
+    ADAPTIVE = 2    # skip the animation of a large menu or when the frames are slow
+
+
+class AnimationDecision:
+    """ Whether a popup is animated and why """
+
+    __slots__ = ('name', 'animate', 'reason', 'height', 'items', 'frameTime')
+
+    def __init__(self, name: str, animate: bool, reason: str, height: int, items: int, frameTime):
+        self.name = name
+        self.animate = animate
+        self.reason = reason        # '', 'disabled', 'never', 'height', 'items' or 'frameTime'
+        self.height = height
+        self.items = items
+        self.frameTime = frameTime  # measured milliseconds per frame, `None` if unknown
+
+    def __repr__(self):
+        return "AnimationDecision({}, animate={}, reason={!r})".format(self.name, self.animate, self.reason)
+
+
+class AnimationPolicy(QObject):
+    """ Global animation policy of menus and drop downs
+
+    In adaptive mode the animation is skipped if the menu is taller than `maxHeight`,
+    has more than `maxItems` items, or the recent frames are slower than `frameBudget`.
+    """
+
+    decided = Signal(object)        # AnimationDecision
+    modeChanged = Signal(object)    # AnimationMode
+
+    _instance = None
+
+    def __init__(self, mode=AnimationMode.ALWAYS, parent=None):
+        super().__init__(parent=parent)
+        self._mode = mode
+        self.maxHeight = 800
+        self.maxItems = 300
+        self.frameBudget = 34   # about 30 fps
+        self.sampleLifetime = 30
+        self._frameTime = None
+        self._frameStamp = 0
+        self._lastDecision = None
+        self._counts = {}       # reason -> count
+
+    @classmethod
+    def instance(cls):
+        """ Returns the global animation policy """
+        if cls._instance is None:
+            cls._instance = AnimationPolicy()
+
+        return cls._instance
+
+    def mode(self):
+        return self._mode
+
+    def setMode(self, mode: AnimationMode):
+        if mode == self._mode:
+            return
+
+        self._mode = mode
+        self.modeChanged.emit(mode)
+
+    def setThresholds(self, maxHeight: int = None, maxItems: int = None, frameBudget: float = None):
+        """ set the thresholds of adaptive mode, the `None` ones are kept """
+        if maxHeight is not None:
+            self.maxHeight = maxHeight
+        if maxItems is not None:
+            self.maxItems = maxItems
+        if frameBudget is not None:
+            self.frameBudget = frameBudget
+
+    def frameTime(self):
+        """ Returns the moving average of milliseconds per frame, `None` if it is unknown or expired """
+        if self._frameTime is not None and time.perf_counter() - self._frameStamp > self.sampleLifetime:
+            self._frameTime = None
+
+        return self._frameTime
+
+    def addFrameTime(self, ms: float):
+        """ add a measured frame interval in milliseconds """
+        if self.frameTime() is None:
+            self._frameTime = ms
+        else:
+            self._frameTime += (ms - self._frameTime) * 0.2
+
+        self._frameStamp = time.perf_counter()
+
+    def lastDecision(self):
+        return self._lastDecision
+
+    def stats(self):
+        """ Returns the number of decisions of each reason, `''` counts the animated popups """
+        return dict(self._counts)
+
+    def resetStats(self):
+        self._counts.clear()
+
+    def shouldAnimate(self, menu, ani=True) -> bool:
+        """ decide whether the popup of a laid out menu is animated, `ani` is what the caller asks for """
+        height, items = menu.height(), menu.view.count()
+        frameTime = self.frameTime()
+
+        if not ani:
+            reason = 'disabled'
+        elif self._mode == AnimationMode.NEVER:
+            reason = 'never'
+        elif self._mode == AnimationMode.ALWAYS:
+            reason = ''
+        elif height > self.maxHeight:
+            reason = 'height'
+        elif items > self.maxItems:
+            reason = 'items'
+        elif frameTime is not None and frameTime > self.frameBudget:
+            reason = 'frameTime'
+        else:
+            reason = ''
+
+        decision = AnimationDecision(type(menu).__name__, not reason, reason, height, items, frameTime)
+        self._lastDecision = decision
+        self._counts[reason] = self._counts.get(reason, 0) + 1
+        self.decided.emit(decision)
+        return decision.animate
+
+    def watchFrames(self, animation):
+        """ measure the frame intervals of a started animation """
+        if self._mode != AnimationMode.ADAPTIVE:
+            return
+
+        last = [None]
+
+        def onFrame():
+            now = time.perf_counter()
+            # the first interval contains the cost of showing the menu
+            if last[0] is not None:
+                self.addFrameTime((now - last[0]) * 1000)
+
+            last[0] = now
+
+        animation.valueChanged.connect(onFrame)
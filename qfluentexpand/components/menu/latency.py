@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import json
+import logging
+import time
+from collections import deque
+
+from PySide6.QtCore import QObject, Signal
+
+
+class PopupTiming:
+    """ Timestamps of a popup in seconds of `time.perf_counter()`, a stage which is not reached is `None` """
+
+    STAGES = ('build', 'layout', 'animation', 'firstPaint')
+
+    __slots__ = ('name', 'start') + STAGES
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = time.perf_counter()
+        self.build = None
+        self.layout = None
+        self.animation = None
+        self.firstPaint = None
+
+    def mark(self, stage: str):
+        """ mark the end of a stage now """
+        setattr(self, stage, time.perf_counter())
+
+    def durations(self):
+        """ Returns the milliseconds spent in each reached stage and the total `latency` """
+        result = {}
+        last = self.start
+        for stage in self.STAGES:
+            t = getattr(self, stage)
+            if t is None:
+                continue
+
+            result[stage] = (t - last) * 1000
+            last = t
+
+        result['latency'] = (last - self.start) * 1000
+        return result
+
+    def toDict(self):
+        return {'name': self.name, **{k: round(v, 3) for k, v in self.durations().items()}}
+
+
+class LogSink:
+    """ Writes the popup timings to a logger """
+
+    def __init__(self, logger: logging.Logger = None, level=logging.DEBUG):
+        self.logger = logger or logging.getLogger("qfluentexpand.popup")
+        self.level = level
+
+    def __call__(self, timing: PopupTiming):
+        if self.logger.isEnabledFor(self.level):
+            durations = ", ".join("{}={:.2f}ms".format(k, v) for k, v in timing.durations().items())
+            self.logger.log(self.level, "popup %s: %s", timing.name, durations)
+
+
+class JsonLinesSink:
+    """ Appends the popup timings to a file, one json object per line """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __call__(self, timing: PopupTiming):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(timing.toDict()) + "\n")
+
+
+class HistogramSink:
+    """ Keeps the last `maxSamples` durations of each stage to report the percentiles """
+
+    def __init__(self, maxSamples=1000):
+        self.maxSamples = maxSamples
+        self._samples = {}  # (name, stage) -> deque of milliseconds
+
+    def __call__(self, timing: PopupTiming):
+        for stage, ms in timing.durations().items():
+            for key in ((None, stage), (timing.name, stage)):
+                samples = self._samples.get(key)
+                if samples is None:
+                    samples = self._samples[key] = deque(maxlen=self.maxSamples)
+
+                samples.append(ms)
+
+    def clear(self):
+        self._samples.clear()
+
+    def count(self, stage='latency', name: str = None):
+        return len(self._samples.get((name, stage), ()))
+
+    def percentile(self, p: float, stage='latency', name: str = None):
+        """ Returns the p-th percentile of a stage in milliseconds, `None` if there is no sample
+
+        Parameters
+        ----------
+        p: float
+            percentile in [0, 100], e.g. 50 or 99
+
+        stage: str
+            `latency` or one of `PopupTiming.STAGES`
+
+        name: str
+            the name of popup, all the popups if it is `None`
+        """
+        samples = self._samples.get((name, stage))
+        if not samples:
+            return None
+
+        samples = sorted(samples)
+        i = min(len(samples) - 1, max(0, round(p / 100 * (len(samples) - 1))))
+        return samples[i]
+
+    def summary(self, name: str = None):
+        """ Returns the count, p50 and p99 of each stage, e.g. `{'latency': (10, 4.2, 9.8)}` """
+        result = {}
+        for (n, stage), samples in self._samples.items():
+            if n == name:
+                result[stage] = (len(samples), self.percentile(50, stage, name), self.percentile(99, stage, name))
+
+        return result
+
+
+class PopupMonitor(QObject):
+    """ Records the latency of popup menus, it is disabled until a sink is added
+
+    A sink is a callable which accepts a `PopupTiming`, e.g. `LogSink` or `HistogramSink`.
+    """
+
+    recorded = Signal(object)   # PopupTiming
+
+    _instance = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._isEnabled = False
+        self._sinks = []
+
+    @classmethod
+    def instance(cls):
+        """ Returns the global popup monitor """
+        if cls._instance is None:
+            cls._instance = PopupMonitor()
+
+        return cls._instance
+
+    def isEnabled(self):
+        return self._isEnabled
+
+    def setEnabled(self, isEnabled: bool):
+        self._isEnabled = isEnabled
+
+    def addSink(self, sink):
+        """ add a sink and enable the monitor, returns the sink """
+        self._sinks.append(sink)
+        self._isEnabled = True
+        return sink
+
+    def removeSink(self, sink):
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+
+    def sinks(self):
+        return list(self._sinks)
+
+    def begin(self, name: str):
+        """ start timing a popup, returns `None` if the monitor is disabled """
+        return PopupTiming(name) if self._isEnabled else None
+
+    def finish(self, timing: PopupTiming):
+        """ publish the timing of a popup """
+        if timing is None:
+            return
+
+        self.recorded.emit(timing)
+        for sink in self._sinks:
+            try:
+                sink(timing)
+            except Exception:
+                # a broken sink should not break the menu
+                logging.getLogger("qfluentexpand.popup").exception("popup sink failed")
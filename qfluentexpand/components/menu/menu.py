@@ -6,12 +6,15 @@ email: nbxlc@hotmail.com
 """
 
 
+import inspect
+from contextlib import contextmanager
 from enum import Enum
+from itertools import repeat
 from typing import List, Union
 
-from PySide6.QtCore import (Qt, QSize, QRectF, Signal, QPoint, QTimer)
+from PySide6.QtCore import (Qt, QSize, QRectF, Signal, QPoint, QTimer, QObject, QEvent)
 from PySide6.QtGui import (QAction, QIcon, QColor, QPainter, QPen, QPixmap,
-                           QFontMetrics, QKeySequence)
+                           QKeySequence)
 from PySide6.QtWidgets import (QApplication, QMenu, QProxyStyle, QStyle, QStyleFactory,
                                QGraphicsDropShadowEffect, QListWidget, QWidget, QHBoxLayout,
                                QListWidgetItem)
@@ -27,12 +30,21 @@ from qfluentwidgets.components.widgets.menu import (
     MenuAnimationType, MenuAnimationManager
 )
 
+from qfluentexpand.common.text_index import TextIndex
+from qfluentexpand.common.text_metrics import textMetrics
+from qfluentexpand.common.worker import CoroutineRunner
+from qfluentexpand.components.menu.animation import AnimationPolicy
+from qfluentexpand.components.menu.latency import PopupMonitor
+from qfluentexpand.components.menu.shadow import ShadowMode, shadowCache
+
 
 
 class RoundMenu(QMenu):
-    """ Round corner menu """
+    """ Round corner menu, typing jumps to the first enabled action starting with the typed text """
 
     closedSignal = Signal()
+    isPoolable = True   # whether the menu can be recycled by `MenuPool`
+    defaultShadowMode = ShadowMode.EFFECT
 
     def __init__(self, title="", parent=None):
         super().__init__(parent=parent)
@@ -40,6 +52,16 @@ class RoundMenu(QMenu):
         self._icon = QIcon()
         self._actions = []  # type: List[QAction]
         self._subMenus = []
+        self._actionItems = {}  # action -> QListWidgetItem
+        self._widgetItems = {}  # custom widget -> QListWidgetItem
+        self._iconOwners = set()    # actions and sub menus which have icon
+        self._shortcutWidth = None  # 缓存的最长快捷键宽度
+        self._updateDepth = 0
+        self._isSizeDirty = False
+        self._hadItemIcon = False
+        self._textIndex = TextIndex()   # 动作文本索引, 与 _actions 同步
+        self._typeAheadText = ""
+        self._popupTiming = None    # 正在计时的弹出
 
         self.isSubMenu = False
         self.parentMenu = None
@@ -47,13 +69,18 @@ class RoundMenu(QMenu):
         self.lastHoverItem = None
         self.lastHoverSubMenuItem = None
         self.isHideBySystem = True
+        self.isTypeAheadEnabled = True
         self.itemHeight = 28
+        self.shadowMode = self.defaultShadowMode
+        self.shadowEffect = None
+        self._shadow = (30, (0, 8), QColor(0, 0, 0, 30))   # blur radius, offset, color
 
         self.hBoxLayout = QHBoxLayout(self)
         self.view = MenuActionListWidget(self)
 
         self.aniManager = None
         self.timer = QTimer(self)
+        self.typeAheadTimer = QTimer(self)
 
         self.__initWidgets()
 
@@ -64,12 +91,20 @@ class RoundMenu(QMenu):
         self.setMouseTracking(True)
 
         # fixes https://github.com/zhiyiYo/PyQt-Fluent-Widgets/issues/848
-        self.setStyle(QStyleFactory.create("fusion"))
+        # the style is deleted with the menu, a widget doesn't own its style
+        style = QStyleFactory.create("fusion")
+        style.setParent(self)
+        self.setStyle(style)
 
         self.timer.setSingleShot(True)
         self.timer.setInterval(400)
         self.timer.timeout.connect(self._onShowMenuTimeOut)
 
+        # the typed characters are dropped after a pause like the type-ahead of item views
+        self.typeAheadTimer.setSingleShot(True)
+        self.typeAheadTimer.setInterval(QApplication.keyboardInputInterval())
+        self.typeAheadTimer.timeout.connect(self.clearTypeAhead)
+
         self.setShadowEffect()
         self.hBoxLayout.addWidget(self.view, 1, Qt.AlignmentFlag.AlignCenter)
 
@@ -78,6 +113,7 @@ class RoundMenu(QMenu):
 
         self.view.itemClicked.connect(self._onItemClicked)
         self.view.itemEntered.connect(self._onItemEntered)
+        self.view.installEventFilter(self)
 
     def setMaxVisibleItems(self, num: int):
         """ set the maximum visible items """
@@ -94,13 +130,35 @@ class RoundMenu(QMenu):
 
     def setShadowEffect(self, blurRadius=30, offset=(0, 8), color=QColor(0, 0, 0, 30)):
         """ add shadow to dialog """
+        self._shadow = (blurRadius, offset, QColor(color))
+        self.view.setGraphicsEffect(None)
+        self.shadowEffect = None
+
+        if self.shadowMode == ShadowMode.CACHED:
+            self.update()
+            return
+
         self.shadowEffect = QGraphicsDropShadowEffect(self.view)
         self.shadowEffect.setBlurRadius(blurRadius)
         self.shadowEffect.setOffset(*offset)
         self.shadowEffect.setColor(color)
-        self.view.setGraphicsEffect(None)
         self.view.setGraphicsEffect(self.shadowEffect)
 
+    def setShadowMode(self, mode: ShadowMode):
+        """ set the shadow mode
+
+        Parameters
+        ----------
+        mode: ShadowMode
+            * `ShadowMode.EFFECT`: a `QGraphicsDropShadowEffect` of view
+            * `ShadowMode.CACHED`: a pre-rendered nine-patch pixmap painted behind the view
+        """
+        if mode == self.shadowMode:
+            return
+
+        self.shadowMode = mode
+        self.setShadowEffect(*self._shadow)
+
     def _setParentMenu(self, parent, item):
         self.parentMenu = parent
         self.menuItem = item
@@ -118,10 +176,122 @@ class RoundMenu(QMenu):
     def title(self):
         return self._title
 
+    def setTitle(self, title: str):
+        self._title = title
+
     def clear(self):
         """ clear all actions """
-        for i in range(len(self._actions)-1, -1, -1):
-            self.removeAction(self._actions[i])
+        with self.updating():
+            for i in range(len(self._actions)-1, -1, -1):
+                self.removeAction(self._actions[i])
+
+    def resetContents(self):
+        """ remove all items and restore the state of a new menu, it is used to recycle the menu
+
+        The item widgets are deleted, the style, shadow and view are kept.
+        """
+        self.timer.stop()
+        self.clearTypeAhead()
+        self._popupTiming = None
+
+        # a batch left open by an interrupted build must not defer the sizes of next user
+        self._updateDepth = 0
+        self._isSizeDirty = False
+        with self.updating():
+            for action in self._actions:
+                action.changed.disconnect(self._onActionChanged)
+                action.setProperty('item', None)
+                super().removeAction(action)
+
+            for menu in self._subMenus:
+                menu._setParentMenu(None, None)
+
+                # the lazy menus are owned by this menu
+                if isinstance(menu, LazyMenu):
+                    menu.invalidate()
+                    if menu.menu() is not None:
+                        menu.menu().deleteLater()
+
+                    menu.deleteLater()
+
+            # the item widgets are deleted by the view
+            self.view.clear()
+            self._actions = []
+            self._textIndex.clear()
+            self._subMenus = []
+            self._actionItems.clear()
+            self._widgetItems.clear()
+            self._iconOwners.clear()
+            self._shortcutWidth = None
+            self._isSizeDirty = True
+
+        self.lastHoverItem = None
+        self.lastHoverSubMenuItem = None
+        self.isHideBySystem = True
+        self.view.setMinimumWidth(0)
+        self.view.setMaxVisibleItems(-1)
+        self.adjustSize()
+
+    def beginUpdate(self):
+        """ begin a batch of changes, the sizes of items and menu are adjusted at `endUpdate()`
+
+        The calls can be nested, the menu is adjusted when the outermost batch ends.
+        """
+        if self._updateDepth == 0:
+            self._hadItemIcon = self._hasItemIcon()
+
+        self._updateDepth += 1
+
+    def endUpdate(self):
+        """ end a batch of changes """
+        if self._updateDepth == 0:
+            return
+
+        self._updateDepth -= 1
+        if self._updateDepth > 0:
+            return
+
+        # the items added before the first icon don't leave space for it
+        if self._hasItemIcon() != self._hadItemIcon:
+            self._refreshItems()
+
+        if self._isSizeDirty:
+            self._isSizeDirty = False
+            self.view.adjustSize()
+            self.adjustSize()
+
+    def isUpdating(self):
+        return self._updateDepth > 0
+
+    @contextmanager
+    def updating(self):
+        """ context manager of `beginUpdate()` and `endUpdate()` """
+        self.beginUpdate()
+        try:
+            yield self
+        finally:
+            self.endUpdate()
+
+    def _adjustMenuSize(self):
+        """ adjust the size of view and menu, it is deferred in a batch of changes """
+        if self._updateDepth > 0:
+            self._isSizeDirty = True
+            return
+
+        self.view.adjustSize()
+        self.adjustSize()
+
+    def _refreshItems(self):
+        """ update the icon and text of all action items """
+        for action in self._actions:
+            item = self._actionItems.get(action)
+            if item is None or self.view.itemWidget(item):
+                continue
+
+            item.setIcon(self._createItemIcon(action))
+            self._adjustItemText(item, action)
+
+        self._isSizeDirty = True
 
     def setIcon(self, icon: Union[QIcon, FluentIconBase]):
         """ set the icon of menu """
@@ -139,8 +309,8 @@ class RoundMenu(QMenu):
             menu action
         """
         item = self._createActionItem(action)
-        self.view.addItem(item)
-        self.adjustSize()
+        QListWidget.addItem(self.view, item)
+        self._adjustMenuSize()
 
     def addWidget(self, widget: QWidget, selectable=True, onClick=None):
         """ add custom widget
@@ -162,8 +332,9 @@ class RoundMenu(QMenu):
         item = self._createActionItem(action)
         item.setSizeHint(widget.size())
 
-        self.view.addItem(item)
+        QListWidget.addItem(self.view, item)
         self.view.setItemWidget(item, widget)
+        self._widgetItems[widget] = item
 
         if not selectable:
             item.setFlags(Qt.ItemFlag.NoItemFlags)
@@ -171,33 +342,126 @@ class RoundMenu(QMenu):
         if onClick:
             action.triggered.connect(onClick)
 
-        self.adjustSize()
+        self._adjustMenuSize()
 
-    def removeWidget(self, widget: QWidget):
-        # 方法 1: 通过查找对应的 item 来删除
-        for i in range(self.view.count()):
-            item = self.view.item(i)
-            if self.view.itemWidget(item) == widget:
-                # 先移除 widget 避免内存泄漏
-                self.view.removeItemWidget(item)
-                # 删除 item
-                self.view.takeItem(i)
+    def insertWidget(self, index: int, widget: QWidget, selectable=True, onClick=None):
+        """ insert custom widget at the row `index`, `index` equal to the number of rows appends it
+
+        It costs O(n), the actions after the row are shifted in `_actions` and the text index.
+        """
+        count = self.view.count()
+        if not 0 <= index <= count:
+            raise IndexError("row {} is out of range [0, {}]".format(index, count))
+
+        # separators and sub menus have no action, the action of widget goes before the next action
+        before = None
+        for row in range(index, count):
+            data = self.view.item(row).data(Qt.ItemDataRole.UserRole)
+            if isinstance(data, QAction) and data in self._actionItems:
+                before = data
                 break
 
-        self.adjustSize()
+        action = QAction()
+        action.setProperty('selectable', selectable)
+
+        item = self._createActionItem(action, before)
+        item.setSizeHint(widget.size())
+
+        QListWidget.insertItem(self.view, index, item)
+        self.view.setItemWidget(item, widget)
+        self._widgetItems[widget] = item
+
+        if not selectable:
+            item.setFlags(Qt.ItemFlag.NoItemFlags)
+
+        if onClick:
+            action.triggered.connect(onClick)
+
+        self._adjustMenuSize()
+
+    def widgetItem(self, widget: QWidget):
+        """ Returns the list widget item of custom widget, `None` if it is not in menu """
+        return self._widgetItems.get(widget)
+
+    def scrollToWidget(self, widget: QWidget, hint=QListWidget.ScrollHint.EnsureVisible):
+        """ scroll the view to make the custom widget visible """
+        item = self._widgetItems.get(widget)
+        if item is not None:
+            self.view.scrollToItem(item, hint)
+
+    def removeWidget(self, widget: QWidget):
+        """ remove custom widget, the widget is deleted later """
+        self.removeWidgets([widget])
+
+    def removeWidgets(self, widgets: List[QWidget]):
+        """ remove custom widgets, the menu is adjusted once
+
+        Parameters
+        ----------
+        widgets: Iterable[QWidget]
+            custom widgets, the ones not in menu are ignored, they are deleted later
+        """
+        items = [item for item in map(self._widgetItems.pop, widgets, repeat(None)) if item is not None]
+        if not items:
+            return
+
+        # take the items from the last row, so the rows of the others are kept
+        actions = set()
+        for row, item in sorted(((self.view.row(item), item) for item in items), reverse=True):
+            # 先移除 widget 避免内存泄漏
+            self.view.removeItemWidget(item)
+            QListWidget.takeItem(self.view, row)
+            action = item.data(Qt.ItemDataRole.UserRole)
+            if isinstance(action, QAction):
+                actions.add(action)
+
+        self._removeActions(actions)
+        self._adjustMenuSize()
+
+    def _removeActions(self, actions: set):
+        """ drop the actions of taken items from the action list and index """
+        if not actions:
+            return
+
+        if len(actions) == 1:
+            action = next(iter(actions))
+            index = len(self._actions) - 1
+            if self._actions[index] is not action:
+                index = self._actions.index(action)
+
+            del self._actions[index]
+            self._textIndex.remove(index)
+        else:
+            self._actions = [a for a in self._actions if a not in actions]
+            self._textIndex.reset(a.text() for a in self._actions)
+
+        for action in actions:
+            self._actionItems.pop(action, None)
+            self._iconOwners.discard(action)
+            action.setProperty('item', None)
+            action.changed.disconnect(self._onActionChanged)
+            super().removeAction(action)
+
+            if not action.shortcut().isEmpty():
+                self._shortcutWidth = None
 
     def _createActionItem(self, action: QAction, before=None):
         """ create menu action item  """
         if not before:
             self._actions.append(action)
+            self._textIndex.append(action.text())
             super().addAction(action)
-        elif before in self._actions:
+        elif before in self._actionItems:
             index = self._actions.index(before)
             self._actions.insert(index, action)
+            self._textIndex.insert(index, action.text())
             super().insertAction(before, action)
         else:
             raise ValueError('`before` is not in the action list')
 
+        self._updateIconOwner(action)
+        self._updateShortcutWidth(action)
+
         item = QListWidgetItem(self._createItemIcon(action), action.text())
         self._adjustItemText(item, action)
 
@@ -207,11 +471,30 @@ class RoundMenu(QMenu):
 
         item.setData(Qt.ItemDataRole.UserRole, action)
         action.setProperty('item', item)
+        self._actionItems[action] = item
         action.changed.connect(self._onActionChanged)
         return item
 
+    def actionItem(self, action: QAction):
+        """ Returns the list widget item of action, `None` if it is not in menu """
+        return self._actionItems.get(action)
+
     def _hasItemIcon(self):
-        return any(not i.icon().isNull() for i in self._actions+self._subMenus)
+        return bool(self._iconOwners)
+
+    def _updateIconOwner(self, owner):
+        """ track whether the action or sub menu has icon """
+        if owner.icon().isNull():
+            self._iconOwners.discard(owner)
+        else:
+            self._iconOwners.add(owner)
+
+    def _updateShortcutWidth(self, action: QAction):
+        if self._shortcutWidth is None or action.shortcut().isEmpty():
+            return
+
+        w = textMetrics.width(getFont(12), action.shortcut().toString())
+        self._shortcutWidth = max(self._shortcutWidth, w)
 
     def _adjustItemText(self, item: QListWidgetItem, action: QAction):
         """ adjust the text of item """
@@ -224,22 +507,27 @@ class RoundMenu(QMenu):
             sw = 0
 
         # adjust the width of item
+        font = self.view.font()
         if not self._hasItemIcon():
             item.setText(action.text())
-            w = 40 + self.view.fontMetrics().boundingRect(action.text()).width() + sw
+            w = 40 + textMetrics.width(font, action.text()) + sw
         else:
             # add a blank character to increase space between icon and text
             item.setText(" " + action.text())
-            space = 4 - self.view.fontMetrics().boundingRect(" ").width()
-            w = 60 + self.view.fontMetrics().boundingRect(item.text()).width() + sw + space
+            space = 4 - textMetrics.width(font, " ")
+            w = 60 + textMetrics.width(font, item.text()) + sw + space
 
         item.setSizeHint(QSize(w, self.itemHeight))
         return w
 
     def _longestShortcutWidth(self):
-        """ longest shortcut key """
-        fm = QFontMetrics(getFont(12))
-        return max(fm.boundingRect(a.shortcut().toString()).width() for a in self.menuActions())
+        """ longest shortcut key, it is cached until an action is changed or removed """
+        if self._shortcutWidth is None:
+            font = getFont(12)
+            self._shortcutWidth = max(
+                (textMetrics.width(font, a.shortcut().toString()) for a in self.menuActions()), default=0)
+
+        return self._shortcutWidth
 
     def _createItemIcon(self, w):
         """ create the icon of menu item """
@@ -257,7 +545,7 @@ class RoundMenu(QMenu):
 
     def insertAction(self, before: Union[QAction, Action], action: Union[QAction, Action]):
         """ inserts action to menu, before the action before """
-        if before not in self._actions:
+        if before not in self._actionItems:
             return
 
         beforeItem = before.property('item')
@@ -266,8 +554,8 @@ class RoundMenu(QMenu):
 
         index = self.view.row(beforeItem)
         item = self._createActionItem(action, before)
-        self.view.insertItem(index, item)
-        self.adjustSize()
+        QListWidget.insertItem(self.view, index, item)
+        self._adjustMenuSize()
 
     def addActions(self, actions: List[Union[QAction, Action]]):
         """ add actions to menu
@@ -277,43 +565,37 @@ class RoundMenu(QMenu):
         actions: Iterable[QAction]
             menu actions
         """
-        for action in actions:
-            self.addAction(action)
+        with self.updating():
+            for action in actions:
+                self.addAction(action)
 
     def insertActions(self, before: Union[QAction, Action], actions: List[Union[QAction, Action]]):
         """ inserts the actions actions to menu, before the action before """
-        for action in actions:
-            self.insertAction(before, action)
+        with self.updating():
+            for action in actions:
+                self.insertAction(before, action)
 
     def removeAction(self, action: Union[QAction, Action]):
         """ remove action from menu """
-        if action not in self._actions:
+        item = self._actionItems.get(action)
+        if item is None:
             return
 
-        # remove action
-        item = action.property("item")
-        self._actions.remove(action)
-        action.setProperty('item', None)
-
-        if not item:
-            return
-
-        # remove item
-        self.view.takeItem(self.view.row(item))
-        item.setData(Qt.ItemDataRole.UserRole, None)
-        super().removeAction(action)
-
         # delete widget
         widget = self.view.itemWidget(item)
         if widget:
+            self._widgetItems.pop(widget, None)
             widget.deleteLater()
 
+        # remove item
+        QListWidget.takeItem(self.view, self.view.row(item))
+        item.setData(Qt.ItemDataRole.UserRole, None)
+        self._removeActions({action})
+        self._adjustMenuSize()
+
     def setDefaultAction(self, action: Union[QAction, Action]):
         """ set the default action """
-        if action not in self._actions:
-            return
-
-        item = action.property("item")
+        item = self._actionItems.get(action)
         if item:
             self.view.setCurrentItem(item)
 
@@ -329,33 +611,62 @@ class RoundMenu(QMenu):
             raise ValueError('`menu` should be an instance of `RoundMenu`.')
 
         item, w = self._createSubMenuItem(menu)
-        self.view.addItem(item)
+        QListWidget.addItem(self.view, item)
         self.view.setItemWidget(item, w)
-        self.adjustSize()
+        self._adjustMenuSize()
+
+    def addLazyMenu(self, title: str, provider, icon: Union[QIcon, FluentIconBase] = None):
+        """ add sub menu which is populated by provider the first time it is hovered
+
+        Parameters
+        ----------
+        title: str
+            the title of sub menu
+
+        provider: Callable
+            a function `provider(menu)` which adds the items to the sub menu, or a
+            coroutine function `provider()` which returns the actions or texts of items,
+            see `LazyMenu`
+
+        icon: QIcon | FluentIconBase
+            the icon of sub menu
+
+        Returns
+        -------
+        lazyMenu: LazyMenu
+            the handle of sub menu, call `invalidate()` to populate it again
+        """
+        menu = LazyMenu(title, provider, icon, parent=self)
+        item, w = self._createSubMenuItem(menu)
+        QListWidget.addItem(self.view, item)
+        self.view.setItemWidget(item, w)
+        self._adjustMenuSize()
+        return menu
 
     def insertMenu(self, before: Union[QAction, Action], menu):
         """ insert menu before action `before` """
         if not isinstance(menu, RoundMenu):
             raise ValueError('`menu` should be an instance of `RoundMenu`.')
 
-        if before not in self._actions:
+        if before not in self._actionItems:
             raise ValueError('`before` should be in menu action list')
 
         item, w = self._createSubMenuItem(menu)
-        self.view.insertItem(self.view.row(before.property('item')), item)
+        QListWidget.insertItem(self.view, self.view.row(before.property('item')), item)
         self.view.setItemWidget(item, w)
-        self.adjustSize()
+        self._adjustMenuSize()
 
     def _createSubMenuItem(self, menu):
         self._subMenus.append(menu)
+        self._updateIconOwner(menu)
 
         item = QListWidgetItem(self._createItemIcon(menu), menu.title())
         if not self._hasItemIcon():
-            w = 60 + self.view.fontMetrics().boundingRect(menu.title()).width()
+            w = 60 + textMetrics.width(self.view.font(), menu.title())
         else:
             # add a blank character to increase space between icon and text
             item.setText(" " + item.text())
-            w = 72 + self.view.fontMetrics().boundingRect(item.text()).width()
+            w = 72 + textMetrics.width(self.view.font(), item.text())
 
         # add submenu item
         menu._setParentMenu(self, item)
@@ -371,6 +682,12 @@ class RoundMenu(QMenu):
         """ show sub menu """
         self.lastHoverItem = item
         self.lastHoverSubMenuItem = item
+
+        # a lazy sub menu starts loading while the popup is delayed
+        menu = item.data(Qt.ItemDataRole.UserRole)
+        if isinstance(menu, LazyMenu):
+            menu.load()
+
         # delay 400 ms to anti-shake
         self.timer.stop()
         self.timer.start()
@@ -396,13 +713,13 @@ class RoundMenu(QMenu):
         item = QListWidgetItem()
         item.setFlags(Qt.ItemFlag.NoItemFlags)
         item.setSizeHint(QSize(w, 9))
-        self.view.addItem(item)
+        QListWidget.addItem(self.view, item)
         item.setData(Qt.ItemDataRole.DecorationRole, "seperator")
-        self.adjustSize()
+        self._adjustMenuSize()
 
     def _onItemClicked(self, item):
         action = item.data(Qt.ItemDataRole.UserRole)  # type: QAction
-        if action not in self._actions or not action.isEnabled():
+        if action not in self._actionItems or not action.isEnabled():
             return
 
         if self.view.itemWidget(item) and not action.property('selectable'):
@@ -426,7 +743,7 @@ class RoundMenu(QMenu):
 
     def _onItemEntered(self, item):
         self.lastHoverItem = item
-        if not isinstance(item.data(Qt.ItemDataRole.UserRole), RoundMenu):
+        if not isinstance(item.data(Qt.ItemDataRole.UserRole), (RoundMenu, LazyMenu)):
             return
 
         self._showSubMenu(item)
@@ -440,6 +757,10 @@ class RoundMenu(QMenu):
             self.close()
 
     def hideEvent(self, e):
+        # the menu is hidden before it is painted
+        if self._popupTiming and self._popupTiming.animation:
+            self._finishPopupTiming()
+
         if self.isHideBySystem and self.isSubMenu:
             self._closeParentMenu()
 
@@ -448,9 +769,120 @@ class RoundMenu(QMenu):
 
     def closeEvent(self, e):
         e.accept()
+        self.clearTypeAhead()
         self.closedSignal.emit()
         self.view.clearSelection()
 
+    def findActions(self, prefix: str, limit: int = -1) -> List[QAction]:
+        """ Returns the actions whose text starts with `prefix`, see `TextIndex.prefixRows()` """
+        return [self._actions[row] for row in self._textIndex.prefixRows(prefix, limit)]
+
+    def typeAheadText(self):
+        """ Returns the characters typed since the last pause """
+        return self._typeAheadText
+
+    def clearTypeAhead(self):
+        self._typeAheadText = ""
+        self.typeAheadTimer.stop()
+
+    def keyboardSearch(self, text: str):
+        """ append text to the typed characters and jump to the matched action, returns it or `None` """
+        self._typeAheadText += text
+        self.typeAheadTimer.start()
+
+        action = self._matchAction(self._typeAheadText)
+
+        # typing the same character again cycles through the actions starting with it
+        if action is None and len(set(self._typeAheadText.casefold())) == 1:
+            action = self._matchAction(text, self._currentAction())
+
+        if action is None:
+            return None
+
+        item = self._actionItems[action]
+        self.view.setCurrentItem(item)
+        self.view.scrollToItem(item)
+        return action
+
+    def _currentAction(self):
+        item = self.view.currentItem()
+        if item is None or not item.isSelected():
+            return None
+
+        action = item.data(Qt.ItemDataRole.UserRole)
+        return action if action in self._actionItems else None
+
+    def _matchAction(self, prefix: str, after: QAction = None):
+        """ Returns the first enabled action starting with prefix, or the one next
+        to `after` in the order of index
+        """
+        first, isAfter = None, after is None
+        for row in self._textIndex.iterPrefixRows(prefix):
+            action = self._actions[row]
+            if not action.isEnabled() or not action.isVisible():
+                continue
+
+            if isAfter:
+                return action
+
+            first = first or action
+            isAfter = action is after
+
+        return first
+
+    def _handleTypeAhead(self, e):
+        """ handle the key press of type-ahead, returns whether the event is consumed """
+        if not self.isTypeAheadEnabled:
+            return False
+
+        # the keys ignored by an editor of custom widget are propagated to the view
+        focusWidget = QApplication.focusWidget()
+        if focusWidget is not None and focusWidget is not self.view and self.view.isAncestorOf(focusWidget):
+            return False
+
+        key = e.key()
+        if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            item = self.view.currentItem()
+            if item is None or not item.isSelected():
+                return False
+
+            self._onItemClicked(item)
+            return True
+
+        if key == Qt.Key.Key_Backspace and self._typeAheadText:
+            text = self._typeAheadText[:-1]
+            self.clearTypeAhead()
+            if text:
+                self.keyboardSearch(text)
+
+            return True
+
+        if key == Qt.Key.Key_Escape and self._typeAheadText:
+            self.clearTypeAhead()
+            return True
+
+        text = e.text()
+        modifiers = e.modifiers() & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.AltModifier |
+                                     Qt.KeyboardModifier.MetaModifier)
+        if not text or modifiers or not text.isprintable() or (text.isspace() and not self._typeAheadText):
+            return False
+
+        self.keyboardSearch(text)
+        return True
+
+    def keyPressEvent(self, e):
+        if self._handleTypeAhead(e):
+            e.accept()
+        else:
+            super().keyPressEvent(e)
+
+    def eventFilter(self, obj, e):
+        # the view may own the focus, its own keyboard search scans the items
+        if obj is self.view and e.type() == QEvent.Type.KeyPress and self._handleTypeAhead(e):
+            return True
+
+        return super().eventFilter(obj, e)
+
     def menuActions(self):
         return self._actions
 
@@ -479,7 +911,13 @@ class RoundMenu(QMenu):
     def _onActionChanged(self):
         """ action changed slot """
         action = self.sender()  # type: QAction
-        item = action.property('item')  # type: QListWidgetItem
+        item = self._actionItems.get(action)  # type: QListWidgetItem
+        if item is None:
+            return
+
+        self._updateIconOwner(action)
+        self._shortcutWidth = None
+        self._textIndex.setText(self._actions.index(action), action.text())
         item.setIcon(self._createItemIcon(action))
 
         self._adjustItemText(item, action)
@@ -489,8 +927,7 @@ class RoundMenu(QMenu):
         else:
             item.setFlags(Qt.ItemFlag.NoItemFlags)
 
-        self.view.adjustSize()
-        self.adjustSize()
+        self._adjustMenuSize()
 
     def exec(self, pos, ani=True, aniType=MenuAnimationType.DROP_DOWN):
         """ show menu
@@ -509,10 +946,23 @@ class RoundMenu(QMenu):
         #if self.isVisible():
         #    aniType = MenuAnimationType.NONE
 
+        timing = self._beginPopupTiming()
+        if timing:
+            timing.mark('layout')
+
+        # the manager of aniType places the menu even if the animation is skipped
         self.aniManager = MenuAnimationManager.make(self, aniType)
-        self.aniManager.exec(pos)
+        policy = AnimationPolicy.instance()
+        if policy.shouldAnimate(self, ani and aniType != MenuAnimationType.NONE):
+            self.aniManager.exec(pos)
+            policy.watchFrames(self.aniManager.ani)
+        else:
+            self.clearMask()
+            self.move(self.aniManager._endPosition(pos))
 
         self.show()
+        if timing:
+            timing.mark('animation')
 
         if self.isSubMenu:
             self.menuItem.setSelected(True)
@@ -545,5 +995,153 @@ class RoundMenu(QMenu):
 
         self.move(x, y)
 
+    def _beginPopupTiming(self):
+        """ start timing the popup unless a combo box has started it, `None` if the monitor is disabled """
+        if self._popupTiming is None:
+            self._popupTiming = PopupMonitor.instance().begin(type(self).__name__)
+
+        return self._popupTiming
+
+    def _finishPopupTiming(self):
+        timing, self._popupTiming = self._popupTiming, None
+        PopupMonitor.instance().finish(timing)
+
     def paintEvent(self, e):
-        pass
\ No newline at end of file
+        if self._popupTiming and self._popupTiming.animation:
+            self._popupTiming.mark('firstPaint')
+            self._finishPopupTiming()
+
+        if self.shadowMode != ShadowMode.CACHED:
+            return
+
+        blurRadius, offset, color = self._shadow
+        painter = QPainter(self)
+        rect = QRectF(self.view.geometry()).translated(*offset)
+
+        # 9 is the border radius of view in menu.qss
+        shadowCache.paint(painter, rect, blurRadius, 9, color, self.devicePixelRatioF())
+
+
+class LazyMenu(QObject):
+    """ Sub menu which is populated the first time it is shown, and cached until `invalidate()`
+
+    The provider is a function `provider(menu)` which adds the items, or a coroutine
+    function `provider()` which returns the actions or texts of items.
+    """
+
+    loaded = Signal()
+    loadFailed = Signal(str)
+
+    def __init__(self, title: str, provider, icon: Union[QIcon, FluentIconBase] = None,
+                 placeholderText="加载中...", parent=None):
+        super().__init__(parent=parent)
+        self._title = title
+        self._icon = QIcon()
+        self.provider = provider
+        self.placeholderText = placeholderText
+        self.parentMenu = None
+        self.menuItem = None
+
+        self._menu = None
+        self._placeholder = None
+        self._isAsync = inspect.iscoroutinefunction(provider)
+        self._isLoaded = False
+        self._isLoading = False
+
+        self._runner = CoroutineRunner(self)
+        self._runner.finished.connect(self._onEntriesReady)
+        self._runner.failed.connect(self._onEntriesFailed)
+
+        if icon:
+            self.setIcon(icon)
+
+    def title(self):
+        return self._title
+
+    def icon(self):
+        return self._icon
+
+    def setIcon(self, icon: Union[QIcon, FluentIconBase]):
+        if isinstance(icon, FluentIconBase):
+            icon = Icon(icon)
+
+        self._icon = icon
+
+    def menu(self):
+        """ Returns the sub menu, `None` if it is not created yet """
+        return self._menu
+
+    def isLoaded(self):
+        return self._isLoaded
+
+    def isLoading(self):
+        return self._isLoading
+
+    def _setParentMenu(self, parent, item):
+        self.parentMenu = parent
+        self.menuItem = item
+        if self._menu is not None:
+            self._menu._setParentMenu(parent, item)
+
+    def _ensureMenu(self):
+        if self._menu is None:
+            self._menu = RoundMenu(self._title, self.parentMenu)
+            self._menu._setParentMenu(self.parentMenu, self.menuItem)
+
+        return self._menu
+
+    def load(self):
+        """ populate the sub menu if it is not loaded or loading """
+        if self._isLoaded or self._isLoading:
+            return
+
+        menu = self._ensureMenu()
+        if not self._isAsync:
+            # resetting the contents ends the open batches, so it is done before the batch
+            menu.resetContents()
+            with menu.updating():
+                self.provider(menu)
+
+            self._isLoaded = True
+            self.loaded.emit()
+            return
+
+        # show the placeholder while the coroutine runs
+        menu.resetContents()
+        self._placeholder = QAction(self.placeholderText)
+        self._placeholder.setEnabled(False)
+        menu.addAction(self._placeholder)
+
+        self._isLoading = True
+        self._runner.run(self.provider())
+
+    def invalidate(self):
+        """ drop the cached items, the provider runs again at next show """
+        self._isLoaded = False
+        self._isLoading = False
+        self._runner.cancel()
+
+        if self._menu is not None:
+            self._menu.resetContents()
+
+    def exec(self, pos, ani=True, aniType=MenuAnimationType.DROP_DOWN):
+        self.load()
+        self._menu.exec(pos, ani, aniType)
+
+    def _onEntriesReady(self, entries):
+        self._isLoading = False
+        self._isLoaded = True
+
+        menu = self._menu
+        menu.resetContents()
+        with menu.updating():
+            for entry in entries or []:
+                menu.addAction(entry if isinstance(entry, QAction) else QAction(str(entry)))
+
+        self.loaded.emit()
+
+    def _onEntriesFailed(self, error: str):
+        # the provider runs again at next show
+        self._isLoading = False
+        self._placeholder.setText(error)
+        self.loadFailed.emit(error)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import logging
+
+from shiboken6 import isValid
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QApplication
+
+from qfluentexpand.components.menu.menu import RoundMenu
+
+
+logger = logging.getLogger(__name__)
+
+
+class MenuPool(QObject):
+    """ Pool of recycled menus, a released menu keeps its style sheet and shadow but not its items
+
+    A menu whose class sets `isPoolable` to `False` is deleted on release.
+    """
+
+    _instance = None
+
+    def __init__(self, capacity=4, parent=None):
+        super().__init__(parent=parent)
+        self.capacity = capacity    # 每个类最多缓存的菜单数
+        self._menus = {}    # class -> List[RoundMenu]
+        self._releaseSlots = {}     # menu -> slot of pool connected to its closed signal
+
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.clear)
+
+    @classmethod
+    def instance(cls):
+        """ Returns the global menu pool """
+        if cls._instance is None:
+            cls._instance = MenuPool()
+
+        return cls._instance
+
+    def setCapacity(self, capacity: int):
+        """ set the maximum number of pooled menus per class, the extra ones are deleted """
+        self.capacity = max(0, capacity)
+        for menus in self._menus.values():
+            while len(menus) > self.capacity:
+                menus.pop().deleteLater()
+
+    def count(self, cls=None):
+        """ Returns the number of pooled menus of class, or of all classes """
+        if cls is not None:
+            return len(self._menus.get(cls, ()))
+
+        return sum(len(menus) for menus in self._menus.values())
+
+    def acquire(self, cls=RoundMenu, parent=None, title="", releaseOnClose=False):
+        """ Returns a recycled menu of class, a new one is created if the pool is empty
+
+        Parameters
+        ----------
+        cls: Type[RoundMenu]
+            the class of menu, its `__init__` accepts the `parent` keyword argument
+
+        parent: QWidget
+            parent widget of menu
+
+        title: str
+            the title of menu
+
+        releaseOnClose: bool
+            whether to release the menu after it is closed, e.g. a context menu
+        """
+        menus = self._menus.get(cls)
+        if menus:
+            menu = menus.pop()
+            menu.setParent(parent, menu.windowFlags())
+        else:
+            menu = cls(parent=parent)
+
+        menu.setTitle(title)
+        if releaseOnClose and menu not in self._releaseSlots:
+            slot = self._releaseSlots[menu] = lambda: self.release(menu)
+            menu.closedSignal.connect(slot)
+
+        return menu
+
+    def release(self, menu: RoundMenu):
+        """ give the menu back to the pool, the caller disconnects the slots it has connected """
+        if menu.isVisible():
+            menu.close()
+
+        # the menu may be released in its closed signal, so it is reset later
+        QTimer.singleShot(0, self, lambda: self._recycle(menu))
+
+    def clear(self):
+        """ delete the pooled menus """
+        for menus in self._menus.values():
+            for menu in menus:
+                menu.deleteLater()
+
+        self._menus.clear()
+
+    def _recycle(self, menu: RoundMenu):
+        slot = self._releaseSlots.pop(menu, None)
+        if not isValid(menu):
+            logger.debug("%s is deleted with its parent before it is recycled", type(menu).__name__)
+            return
+
+        if slot is not None:
+            menu.closedSignal.disconnect(slot)
+
+        menus = self._menus.setdefault(type(menu), [])
+        if any(m is menu for m in menus):
+            return
+
+        if not menu.isPoolable or len(menus) >= self.capacity:
+            menu.deleteLater()
+            return
+
+        menu.resetContents()
+        menu.setParent(None, menu.windowFlags())
+        menus.append(menu)
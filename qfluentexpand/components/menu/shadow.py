@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from collections import OrderedDict
+from enum import Enum
+
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QColor, QImage, QPainter, QPainterPath, QPixmap
+from PySide6.QtWidgets import QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
+
+
+class ShadowMode(Enum):
+    """ Shadow mode of menu """
+
+    EFFECT = 0      # QGraphicsDropShadowEffect, the view is blurred at every repaint
+    CACHED = 1      # pre-rendered nine-patch pixmap painted behind the view
+
+
+class ShadowCache:
+    """ Cache of nine-patch shadow pixmaps, the edges are stretched to fit a shadow of any size """
+
+    def __init__(self, maxSize=16):
+        self.maxSize = maxSize
+        self._pixmaps = OrderedDict()   # key -> QPixmap
+
+    def __len__(self):
+        return len(self._pixmaps)
+
+    def clear(self):
+        self._pixmaps.clear()
+
+    def pixmap(self, blurRadius: int, radius: int, color: QColor, dpr: float) -> QPixmap:
+        """ Returns the nine-patch pixmap, its logical size is `2 * (2 * blurRadius + radius + 2)` """
+        key = (blurRadius, radius, color.rgba(), dpr)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        pixmap = self._render(blurRadius, radius, color, dpr)
+        self._pixmaps[key] = pixmap
+        if len(self._pixmaps) > self.maxSize:
+            self._pixmaps.popitem(last=False)
+
+        return pixmap
+
+    def paint(self, painter: QPainter, rect: QRectF, blurRadius: int, radius: int, color: QColor, dpr: float):
+        """ paint the shadow of a rounded rect
+
+        Parameters
+        ----------
+        painter: QPainter
+            painter
+
+        rect: QRectF
+            the rect which casts the shadow, the blur is painted outside it
+
+        blurRadius: int
+            blur radius of shadow
+
+        radius: int
+            corner radius of rect
+
+        color: QColor
+            color of shadow
+        """
+        pixmap = self.pixmap(blurRadius, radius, color, dpr)
+        target = QRectF(rect).adjusted(-blurRadius, -blurRadius, blurRadius, blurRadius)
+        size = pixmap.width() / dpr
+
+        # the corners are shrunk if the rect is smaller than them
+        corner = min(size / 2 - 2, target.width() / 2, target.height() / 2)
+        s, c = size * dpr, corner * dpr
+        sx = (0, c, s - c, s)
+        tx = (target.left(), target.left() + corner, target.right() - corner, target.right())
+        ty = (target.top(), target.top() + corner, target.bottom() - corner, target.bottom())
+
+        for i in range(3):
+            for j in range(3):
+                t = QRectF(tx[j], ty[i], tx[j + 1] - tx[j], ty[i + 1] - ty[i])
+                if t.width() <= 0 or t.height() <= 0:
+                    continue
+
+                painter.drawPixmap(t, pixmap, QRectF(sx[j], sx[i], sx[j + 1] - sx[j], sx[i + 1] - sx[i]))
+
+    @staticmethod
+    def _render(blurRadius: int, radius: int, color: QColor, dpr: float) -> QPixmap:
+        # the rect is wider than the blur, so its edges fade like the edges of a large
+        # rect, the 4px center is stretched
+        size = 2 * (2 * blurRadius + radius + 2)
+        w = round(size * dpr)
+
+        source = QImage(w, w, QImage.Format.Format_ARGB32_Premultiplied)
+        source.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(source)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        path = QPainterPath()
+        m = blurRadius * dpr
+        path.addRoundedRect(QRectF(m, m, w - 2 * m, w - 2 * m), radius * dpr, radius * dpr)
+        painter.fillPath(path, color)
+        painter.end()
+
+        # the blur filter spreads twice as far as the one of QGraphicsDropShadowEffect
+        # for the same radius, so half of the radius gives the same falloff
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(QPixmap.fromImage(source))
+        effect = QGraphicsBlurEffect()
+        effect.setBlurRadius(blurRadius * dpr * 0.5)
+        effect.setBlurHints(QGraphicsBlurEffect.BlurHint.PerformanceHint)
+        item.setGraphicsEffect(effect)
+        scene.addItem(item)
+
+        image = QImage(w, w, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        scene.render(painter, QRectF(0, 0, w, w), QRectF(0, 0, w, w))
+        painter.end()
+
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+
+
+shadowCache = ShadowCache()
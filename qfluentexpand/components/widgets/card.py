@@ -21,7 +21,6 @@ from qfluentwidgets import (
     RoundMenu
 )
 from qfluentwidgets.components.settings.setting_card import SettingIconWidget
-from qfluentwidgets.components.widgets.combo_box import ComboBox
 from qfluentwidgets.components.widgets.switch_button import SwitchButton, IndicatorPosition
 from qfluentwidgets.components.widgets.slider import Slider
 from qfluentwidgets.components.widgets.button import HyperlinkButton
@@ -29,7 +28,8 @@ from qfluentwidgets.common.style_sheet import FluentStyleSheet
 from qfluentwidgets.common.config import qconfig, isDarkTheme, ConfigItem, OptionsConfigItem
 from qfluentwidgets.common.icon import FluentIconBase
 
-from qfluentexpand.components.combox.combo_box import MSComboBox, MSEComboBox, MSECComboBox
+from qfluentexpand.components.combox.combo_box import CatalogComboBox, MSComboBox, MSEComboBox, MSECComboBox
+from qfluentexpand.components.combox.catalog import ItemCatalog
 from qfluentexpand.components.line.editor import Line
 from qfluentexpand.components.line.selector import FilePathSelector, FolderPathSelector
 
@@ -336,7 +336,7 @@ class ComboBoxSettingCardWidget(SettingCardWidget):
 
     def __init__(self, icon: Union[str, QIcon, FluentIconBase], title, content=None, parent=None):
         super().__init__(icon, title, content, parent)
-        self.comboBox = ComboBox(self)
+        self.comboBox = CatalogComboBox(self)
         self.comboBox.currentTextChanged.connect(self.on_comboBox_currentTextChanged)
         self.comboBox.currentIndexChanged.connect(self.on_comboBox_currentIndexChanged)
         self.addWidget(self.comboBox)
@@ -344,6 +344,9 @@ class ComboBoxSettingCardWidget(SettingCardWidget):
     def addItems(self, items):
         self.comboBox.addItems(items)
 
+    def setItemCatalog(self, catalog: ItemCatalog):
+        self.comboBox.setItemCatalog(catalog)
+
     def currentIndex(self):
         return self.comboBox.currentIndex()
 
@@ -379,6 +382,9 @@ class MSComboBoxSettingCardWidget(SettingCardWidget):
     def addItems(self, items):
         self.comboBox.addItems(items)
 
+    def setItemCatalog(self, catalog: ItemCatalog):
+        self.comboBox.setItemCatalog(catalog)
+
     def currentIndex(self):
         return self.comboBox.currentIndex()
 
@@ -411,6 +417,9 @@ class MSEComboBoxSettingCardWidget(SettingCardWidget):
     def addItems(self, items):
         self.comboBox.addItems(items)
 
+    def setItemCatalog(self, catalog: ItemCatalog):
+        self.comboBox.setItemCatalog(catalog)
+
     def currentIndex(self):
         return self.comboBox.currentIndex()
 
@@ -443,6 +452,9 @@ class MSECComboBoxSettingCardWidget(SettingCardWidget):
     def addItems(self, items):
         self.comboBox.addItems(items)
 
+    def setItemCatalog(self, catalog: ItemCatalog):
+        self.comboBox.setItemCatalog(catalog)
+
     def currentIndex(self):
         return self.comboBox.currentIndex()
 
@@ -13,44 +13,133 @@ from PySide6.QtGui import QAction, QIcon
 from qfluentwidgets import RoundMenu, Action
 from qfluentwidgets.common.icon import FluentIcon, FluentIconBase
 
+from qfluentexpand.common.mru import MRUStore
+
 import os
 
 
 class ListSubMenu(RoundMenu):
+    """ Menu of recent files
+
+    The files are kept in a `MRUStore`, adding a file moves or inserts its action
+    and removes the evicted ones instead of rebuilding the menu. If `store_path` is
+    given, the files are loaded from it and saved to it after changes.
+    """
+
     fileSelected = Signal(str)  # 当选择一个文件时发出信号
 
-    def __init__(self, icon: Union[FluentIconBase, QIcon], text, recent_files=[], max_count=10, parent=None):
+    def __init__(self, icon: Union[FluentIconBase, QIcon], text, recent_files=None, max_count=10, parent=None,
+                 store_path=None):
         super().__init__(text, parent)
         self.setIcon(icon)
-        self.max_count = max_count
-        self.recent_files = recent_files
+        self.store = MRUStore(max_count, store_path, parent=self)
+        self._fileActions = {}  # filepath -> Action
+        self._emptyAction = None
+
+        if recent_files is None and store_path:
+            self.store.load()
+        else:
+            self.store.setItems(recent_files or [])
+
         self.updateMenu()
 
+    @property
+    def recent_files(self):
+        return self.store.items()
+
+    @recent_files.setter
+    def recent_files(self, files):
+        self.setRecentFiles(files)
+
+    @property
+    def max_count(self):
+        return self.store.maxCount
+
+    @max_count.setter
+    def max_count(self, count):
+        self.setMaxCount(count)
+
+    def setMaxCount(self, count: int):
+        for path in self.store.setMaxCount(count):
+            self._removeFileAction(path)
+
+        self._setEmptyActionVisible(not self._fileActions)
+
     def addFile(self, filepath):
-        if filepath in self.recent_files:
-            self.recent_files.remove(filepath)
-        self.recent_files.insert(0, filepath)
-        if len(self.recent_files) > self.max_count:
-            self.recent_files.pop()
-        self.updateMenu()
+        isFirst = self.store.first() == filepath
+        for path in self.store.touch(filepath):
+            self._removeFileAction(path)
+
+        # the file is evicted at once if `max_count` is 0
+        if isFirst or filepath not in self.store:
+            return
+
+        action = self._fileActions.get(filepath)
+        if action is not None:
+            self._moveToFront(action)
+            return
+
+        self._setEmptyActionVisible(False)
+        action = self._createFileAction(filepath)
+        actions = self.menuActions()
+        if actions:
+            self.insertAction(actions[0], action)
+        else:
+            self.addAction(action)
+
+    def removeFile(self, filepath):
+        self.store.remove(filepath)
+        self._removeFileAction(filepath)
+        self._setEmptyActionVisible(not self._fileActions)
 
     def updateMenu(self):
+        """ rebuild the actions of all files """
         self.clear()
-        for filepath in self.recent_files:
-            if os.path.basename(filepath):
-                action = Action(FluentIcon.BASKETBALL, os.path.basename(filepath))
-            else:
-                action = Action(FluentIcon.BASKETBALL, filepath)
-            action.setStatusTip(filepath)
-            action.triggered.connect(lambda checked, path=filepath: self.fileSelected.emit(path))
-            self.addAction(action)
+        self._fileActions.clear()
+        self._emptyAction = None
+
+        for filepath in self.store.items():
+            self.addAction(self._createFileAction(filepath))
 
-        if not self.recent_files:
-            self.addAction(Action(FluentIcon.BASKETBALL, "None"))
+        self._setEmptyActionVisible(not self._fileActions)
 
     def getRecentFiles(self):
-        return self.recent_files
+        return self.store.items()
 
     def setRecentFiles(self, files):
-        self.recent_files = files[:self.max_count]
-        self.updateMenu()
\ No newline at end of file
+        self.store.setItems(files)
+        self.updateMenu()
+
+    def _createFileAction(self, filepath):
+        if os.path.basename(filepath):
+            action = Action(FluentIcon.BASKETBALL, os.path.basename(filepath))
+        else:
+            action = Action(FluentIcon.BASKETBALL, filepath)
+        action.setStatusTip(filepath)
+        action.triggered.connect(lambda checked, path=filepath: self.fileSelected.emit(path))
+        self._fileActions[filepath] = action
+        return action
+
+    def _moveToFront(self, action):
+        """ move the action to the top of menu """
+        actions = self.menuActions()
+        if actions[0] is action:
+            return
+
+        # the slots of menu are disconnected by `removeAction()` and connected again by `insertAction()`
+        self.removeAction(action)
+        self.insertAction(actions[0], action)
+
+    def _removeFileAction(self, filepath):
+        action = self._fileActions.pop(filepath, None)
+        if action is not None:
+            self.removeAction(action)
+
+    def _setEmptyActionVisible(self, isVisible: bool):
+        """ show the `None` action when there is no file """
+        if isVisible and self._emptyAction is None:
+            self._emptyAction = Action(FluentIcon.BASKETBALL, "None")
+            self.addAction(self._emptyAction)
+        elif not isVisible and self._emptyAction is not None:
+            self.removeAction(self._emptyAction)
+            self._emptyAction = None
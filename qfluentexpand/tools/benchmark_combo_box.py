@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+
+Benchmarks of the combo boxes under the offscreen Qt platform
+
+    python -m qfluentexpand.tools.benchmark_combo_box --output result.json
+    python -m qfluentexpand.tools.benchmark_combo_box --baseline result.json --threshold 0.2
+
+Every case measures the time to populate, memory per loaded item, time to open the drop down
+menu, latency of toggling the selection and cost of closing and tearing down the
+widget. The `[prewarm]` case also measures the idle time spent building its menu
+before it is opened. The times are the minimum of `--repeat` runs, in milliseconds.
+With `--baseline`, the process exits with 1 if a metric regresses beyond the
+threshold. A case which raises is reported and skipped, the process exits with 2.
+"""
+
+
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import platform
+import statistics
+import traceback
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import __version__ as PYSIDE_VERSION
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtWidgets import QApplication
+
+
+SIZES = (10, 1000, 10000, 100000)
+TIME_METRICS = ("populate_ms", "prewarm_ms", "open_ms", "toggle_ms", "close_ms", "teardown_ms")
+
+
+def createCases():
+    """ Returns `{name: (factory, values, populate, isWidgetMenu)}`, the values create `n` items,
+    and `populate(comboBox, values)` adds them
+    """
+    from qfluentexpand.components.combox.base import DropDownMode
+    from qfluentexpand.components.combox.combo_box import (
+        EditableComboBox, MSComboBox, MSEComboBox, MSECComboBox
+    )
+    from qfluentexpand.components.combox.provider import ItemProvider
+
+    def msMode(mode):
+        def factory():
+            comboBox = MSComboBox()
+            comboBox.setDropDownMode(mode)
+            return comboBox
+
+        return factory
+
+    def msPrewarm():
+        comboBox = MSComboBox()
+        comboBox.setPrewarmEnabled(True)
+        return comboBox
+
+    texts = lambda n: ["item {}".format(i) for i in range(n)]
+    pairs = lambda n: {"item {}".format(i): ["a", "b", "c"] for i in range(n)}
+    setItems = lambda comboBox, data: comboBox.setItems(data)
+    setProvider = lambda comboBox, data: comboBox.setItemProvider(ItemProvider(data))
+    return {
+        "EditableComboBox": (EditableComboBox, texts, setItems, True),
+        "MSComboBox": (MSComboBox, texts, setItems, True),
+        "MSComboBox[view]": (msMode(DropDownMode.VIEW), texts, setItems, False),
+        "MSComboBox[grid]": (msMode(DropDownMode.GRID), texts, setItems, False),
+        "MSComboBox[prewarm]": (msPrewarm, texts, setItems, True),
+        "MSComboBox[provider]": (MSComboBox, texts, setProvider, False),
+        "MSEComboBox": (MSEComboBox, texts, setItems, True),
+        "MSECComboBox": (MSECComboBox, pairs, setItems, True),
+    }
+
+
+def processEvents(app):
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+
+
+def measureToggle(comboBox, n: int, count=50):
+    """ Returns the median latency of selecting or deselecting an item """
+    samples = []
+    n = min(n, len(comboBox.items))     # a provider only fetches the visible pages
+    rows = [i * max(n // count, 1) % n for i in range(count)]
+    for row in rows:
+        for selected in (True, False):
+            t = time.perf_counter()
+            if hasattr(comboBox, "selection"):
+                comboBox.selection.select(row, selected)
+            else:
+                comboBox.setCurrentIndex(row if selected else -1)
+
+            samples.append(time.perf_counter() - t)
+
+    return statistics.median(samples) * 1000
+
+
+def waitPrewarm(app, comboBox):
+    """ Returns the milliseconds to build the menu in idle time, `None` if it is not prewarmed """
+    from qfluentexpand.components.combox.prewarm import MenuPrewarmer
+
+    prewarmer = MenuPrewarmer.instance()
+    if not prewarmer.isPending(comboBox):
+        return None
+
+    t = time.perf_counter()
+    while prewarmer.isPending(comboBox):
+        app.processEvents()
+
+    return (time.perf_counter() - t) * 1000
+
+
+def runCase(app, factory, values, populate, n: int, canOpen: bool):
+    """ run a case once, returns the metrics """
+    result = {}
+    data = values(n)
+    gc.collect()
+
+    comboBox = factory()
+    comboBox.resize(300, 33)
+    comboBox.show()
+    processEvents(app)
+
+    tracemalloc.start()
+    t = time.perf_counter()
+    populate(comboBox, data)
+    result["populate_ms"] = (time.perf_counter() - t) * 1000
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # a provider only fetches the visible pages, the items are not loaded yet
+    loaded = len(comboBox.items)
+    result["bytes_per_item"] = memory / loaded if loaded else None
+    result["prewarm_ms"] = waitPrewarm(app, comboBox) if canOpen else None
+
+    if canOpen:
+        t = time.perf_counter()
+        comboBox._showComboMenu()
+        processEvents(app)
+        result["open_ms"] = (time.perf_counter() - t) * 1000
+    else:
+        result["open_ms"] = None
+
+    result["toggle_ms"] = measureToggle(comboBox, n)
+
+    t = time.perf_counter()
+    comboBox._closeComboMenu()
+    processEvents(app)
+    result["close_ms"] = (time.perf_counter() - t) * 1000
+
+    t = time.perf_counter()
+    comboBox.deleteLater()
+    processEvents(app)
+    del comboBox
+    gc.collect()
+    result["teardown_ms"] = (time.perf_counter() - t) * 1000
+    return result
+
+
+def runBenchmarks(names=None, sizes=SIZES, repeat=3, widgetLimit=1000, log=print):
+    """ run the benchmarks
+
+    Parameters
+    ----------
+    names: List[str]
+        the names of cases to run, all cases if it is `None`
+
+    sizes: Iterable[int]
+        the numbers of items
+
+    repeat: int
+        the number of runs, the minimum of each metric is reported
+
+    widgetLimit: int
+        the drop down menu which creates a widget per item is not opened above this size
+    """
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    results = {}
+    for name, (factory, values, populate, isWidgetMenu) in createCases().items():
+        if names and name not in names:
+            continue
+
+        for i, n in enumerate(sizes):
+            canOpen = not isWidgetMenu or n <= widgetLimit
+            try:
+                # warm up the style sheets and caches, the first run is not measured
+                if i == 0:
+                    runCase(app, factory, values, populate, 10, True)
+
+                runs = [runCase(app, factory, values, populate, n, canOpen) for _ in range(repeat)]
+            except Exception:
+                error = traceback.format_exc()
+                results["{}/{}".format(name, n)] = {"error": error.strip().splitlines()[-1]}
+                log("{:<24}{:>8}  FAILED\n{}".format(name, n, error))
+                continue
+
+            metrics = {}
+            for key in runs[0]:
+                samples = [run[key] for run in runs if run[key] is not None]
+                metrics[key] = round(min(samples), 4) if samples else None
+
+            results["{}/{}".format(name, n)] = metrics
+            log("{:<24}{:>8}  {}".format(name, n, "  ".join(
+                "{}={}".format(k, "-" if v is None else "{:.3f}".format(v)) for k, v in metrics.items())))
+
+    return results
+
+
+def compareResults(results: dict, baseline: dict, threshold: float, minDelta=1.0):
+    """ Returns the regressions as `[(case, metric, baseline, value)]`
+
+    A time regresses if it is slower than `baseline * (1 + threshold)` by at least
+    `minDelta` milliseconds, so the noise of tiny times is ignored. The memory per
+    item regresses if it is larger than `baseline * (1 + threshold)`.
+    """
+    regressions = []
+    for case, metrics in results.items():
+        old = baseline.get(case)
+        if not old or "error" in metrics or "error" in old:
+            continue
+
+        for key, value in metrics.items():
+            base = old.get(key)
+            if value is None or base is None:
+                continue
+
+            floor = minDelta if key in TIME_METRICS else 0
+            if value > base * (1 + threshold) and value - base >= floor:
+                regressions.append((case, key, base, value))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="benchmark the combo boxes under the offscreen Qt platform")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with the results of this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed regression ratio, default 0.2")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="numbers of items")
+    parser.add_argument("--cases", nargs="+", help="names of cases, default all")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, default 3")
+    parser.add_argument("--widget-limit", type=int, default=1000,
+                        help="don't open the menus of widget per item above this size, default 1000")
+    args = parser.parse_args(argv)
+
+    results = runBenchmarks(args.cases, args.sizes, args.repeat, args.widget_limit)
+    document = {
+        "meta": {
+            "python": platform.python_version(),
+            "pyside": PYSIDE_VERSION,
+            "platform": os.environ.get("QT_QPA_PLATFORM"),
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+
+    failures = [case for case, metrics in results.items() if "error" in metrics]
+    if not args.baseline:
+        return 2 if failures else 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f).get("results", {})
+
+    regressions = compareResults(results, baseline, args.threshold)
+    for case, key, base, value in regressions:
+        print("REGRESSION {} {}: {:.3f} -> {:.3f}".format(case, key, base, value))
+
+    return 2 if failures else 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import pytest
+
+from qfluentexpand.components.combox.combo_box import EditableComboBox, MSComboBox, MSEComboBox
+
+
+@pytest.mark.parametrize("cls", [MSComboBox, MSEComboBox, EditableComboBox])
+def test_bulk_load_emits_once(app, cls):
+    comboBox = cls()
+    signals = []
+    comboBox.itemsReset.connect(lambda: signals.append("reset"))
+    comboBox.itemsInserted.connect(lambda first, last: signals.append((first, last)))
+
+    comboBox.setItems(str(i) for i in range(100))
+    assert signals == ["reset"]
+
+    comboBox.extendItems(str(i) for i in range(100, 150))
+    comboBox.extendItems([])
+    assert signals == ["reset", (100, 149)]
+    assert comboBox.count() == 150 and comboBox.itemText(149) == "149"
+
+
+def test_bulk_load_patches_open_menu(app):
+    comboBox = MSComboBox()
+    comboBox.setItems(["a", "b"])
+    comboBox.show()
+    comboBox._showComboMenu()
+    menu = comboBox.comboMenu
+
+    comboBox.extendItems(iter(["c", "d"]))
+    assert comboBox.comboMenu is menu
+    assert menu.view.count() == 4
+    assert not menu.isUpdating()
+
+    comboBox.setItems(["x"])
+    assert comboBox.comboMenu is None    # rebuilt at next popup
+
+    comboBox._closeComboMenu()
+    comboBox.close()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import pytest
+from qfluentwidgets import FluentIcon as FIF
+
+from qfluentexpand.components.combox.catalog import ItemCatalog
+from qfluentexpand.components.combox.combo_box import CatalogComboBox, EditableComboBox, MSComboBox
+from qfluentexpand.components.widgets.card import ComboBoxSettingCardWidget
+
+
+@pytest.mark.parametrize("cls", [CatalogComboBox, EditableComboBox, MSComboBox])
+def test_shared_items_are_copied_on_write(app, cls):
+    catalog = ItemCatalog(["a", "b", "c"])
+    first, second = cls(), cls()
+    first.setItemCatalog(catalog)
+    second.setItemCatalog(catalog)
+    assert first.items[1] is second.items[1]
+
+    first.setItemText(1, "x")
+    first.setItemData(2, 42)
+    assert first.itemText(1) == "x" and first.itemData(2) == 42
+    assert second.itemText(1) == "b" and second.itemData(2) is None
+    assert catalog.texts() == ["a", "b", "c"]
+
+    first.addItem("d")
+    assert first.count() == 4 and second.count() == 3 and len(catalog) == 3
+
+
+def test_card_items_are_copied_on_write(app):
+    catalog = ItemCatalog(["a", "b"])
+    first = ComboBoxSettingCardWidget(FIF.SETTING, "first")
+    second = ComboBoxSettingCardWidget(FIF.SETTING, "second")
+    first.setItemCatalog(catalog)
+    second.setItemCatalog(catalog)
+    assert first.currentText() == "a"
+
+    first.comboBox.setItemText(0, "x")
+    first.comboBox.setItemIcon(1, None)
+    assert first.comboBox.itemText(0) == "x"
+    assert second.comboBox.itemText(0) == "a"
+    assert catalog.texts() == ["a", "b"]
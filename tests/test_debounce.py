@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import time
+
+from qfluentexpand.common.debounce import TextDebouncer
+from qfluentexpand.components.combox.combo_box import EditableComboBox
+
+from conftest import flushEvents
+
+
+def wait(app, ms):
+    deadline = time.time() + ms / 1000
+    while time.time() < deadline:
+        flushEvents(app)
+        time.sleep(0.005)
+
+
+def createDebouncer(delay, maxWait):
+    debouncer = TextDebouncer(delay, maxWait)
+    settled = []
+    debouncer.settled.connect(lambda text, token: settled.append((text, token)))
+    return debouncer, settled
+
+
+def test_settled_once_per_pause(app):
+    debouncer, settled = createDebouncer(50, 0)
+    for text in ["a", "ab", "abc"]:
+        debouncer.push(text)
+        wait(app, 10)
+
+    assert settled == []
+    wait(app, 100)
+    assert [text for text, _ in settled] == ["abc"]
+
+
+def test_max_wait_while_typing(app):
+    debouncer, settled = createDebouncer(50, 100)
+    deadline = time.time() + 0.25
+    while time.time() < deadline:
+        debouncer.push(str(time.time()))
+        wait(app, 10)
+
+    # the delay never passes, only the maximum wait settles the text
+    assert 1 <= len(settled) <= 3
+
+
+def test_token_is_cancelled_by_new_text(app):
+    debouncer, settled = createDebouncer(10, 0)
+    debouncer.push("a")
+    debouncer.flush()
+    token = settled[-1][1]
+
+    debouncer.push("a")
+    debouncer.flush()
+    assert not token.isCancelled() and len(settled) == 1
+
+    debouncer.push("b")
+    assert token.isCancelled()
+    debouncer.cancel()
+    wait(app, 30)
+    assert len(settled) == 1
+
+
+def test_combo_box_text_settled(app):
+    comboBox = EditableComboBox()
+    comboBox.setTextSettleDelay(30, 0)
+    settled = []
+    comboBox.textSettled.connect(lambda text, token: settled.append(text))
+
+    for text in ["r", "re", "rei"]:
+        comboBox.setText(text)
+
+    assert settled == []
+    wait(app, 80)
+    assert settled == ["rei"]
+
+    comboBox.setText("reiner")
+    comboBox.flushSettledText()
+    assert settled == ["rei", "reiner"]
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from qfluentwidgets import FluentIcon as FIF
+
+from qfluentexpand.components.combox.combo_box import EditableComboBox
+from qfluentexpand.components.combox.item import CompactComboItem
+
+
+def test_items_are_compact(app):
+    comboBox = EditableComboBox()
+    comboBox.addItem("b", FIF.SETTING)
+    comboBox.insertItem(0, "a")
+    comboBox.insertItems(1, ["x", "y"])
+    comboBox.addItems(["c"])
+
+    assert [item.text for item in comboBox.items] == ["a", "x", "y", "b", "c"]
+    assert all(type(item) is CompactComboItem for item in comboBox.items)
+    assert comboBox.items[3].iconId() != 0
+    assert comboBox.findText("y") == 2
+    assert comboBox.currentIndex() == 3 and comboBox.currentText() == "b"
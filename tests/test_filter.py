@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import time
+
+from qfluentexpand.components.combox.filter import ItemFilter
+from qfluentexpand.components.combox.item import CompactComboItem
+
+from conftest import flushEvents
+
+
+def createFilter(texts, **kwargs):
+    itemFilter = ItemFilter([CompactComboItem(text) for text in texts], **kwargs)
+    batches, results = [], []
+    itemFilter.rowsMatched.connect(batches.append)
+    itemFilter.finished.connect(results.append)
+    return itemFilter, batches, results
+
+
+def waitFor(app, condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        flushEvents(app)
+        time.sleep(0.01)
+
+
+def test_matched_rows_in_batches(app):
+    itemFilter, batches, results = createFilter(["Item {}".format(i) for i in range(100)], batchSize=4)
+    itemFilter.setFilterText("ITEM 1")
+    waitFor(app, lambda: results)
+
+    expected = [1] + list(range(10, 20))
+    assert results == [expected]
+    assert [row for batch in batches for row in batch] == expected
+    assert max(len(batch) for batch in batches) <= 4
+
+
+def test_narrowed_text_scans_cached_rows(app):
+    itemFilter, batches, results = createFilter(["apple", "apricot", "banana", "grape"])
+    itemFilter.setFilterText("ap")
+    waitFor(app, lambda: results)
+    assert results[-1] == [0, 1, 3]
+
+    itemFilter.setFilterText("apr")
+    waitFor(app, lambda: len(results) == 2)
+    assert results[-1] == [1]
+
+    # a cached text is answered synchronously
+    itemFilter.setFilterText("ap")
+    assert results[-1] == [0, 1, 3]
+
+
+def test_replaced_scan_is_dropped(app):
+    itemFilter, batches, results = createFilter(["a{}".format(i) for i in range(200000)] + ["b"])
+    itemFilter.setFilterText("a")
+    itemFilter.setFilterText("b")
+    waitFor(app, lambda: results and results[-1] == [200000])
+
+    time.sleep(0.1)
+    flushEvents(app)
+    assert results == [[200000]]
+
+
+def test_filter_deleted_during_scan(app):
+    itemFilter, batches, results = createFilter(["a{}".format(i) for i in range(200000)])
+    itemFilter.setFilterText("a")
+    itemFilter.deleteLater()
+    flushEvents(app)
+
+    time.sleep(0.3)
+    flushEvents(app)
+    assert results == []
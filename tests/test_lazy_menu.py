@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import asyncio
+import time
+
+from PySide6.QtGui import QAction
+
+from qfluentexpand.components.menu.menu import RoundMenu, LazyMenu
+
+from conftest import flushEvents
+
+
+def countAdjusts(menu):
+    """ count the size adjustments of menu after its contents are reset """
+    counts = [0]
+    adjustSize, resetContents = menu.adjustSize, menu.resetContents
+
+    def adjust():
+        counts[0] += 1
+        adjustSize()
+
+    def reset():
+        resetContents()
+        counts[0] = 0
+
+    menu.adjustSize = adjust
+    menu.resetContents = reset
+    return counts
+
+
+def waitLoaded(app, lazyMenu, timeout=5):
+    deadline = time.time() + timeout
+    while lazyMenu.isLoading() and time.time() < deadline:
+        flushEvents(app)
+        time.sleep(0.01)
+
+
+def test_sync_provider_is_called_once(app):
+    calls = []
+
+    def provider(menu):
+        calls.append(menu)
+        menu.addActions([QAction(str(i), menu) for i in range(5)])
+
+    parent = RoundMenu()
+    lazyMenu = parent.addLazyMenu("Files", provider)
+    lazyMenu.load()
+    lazyMenu.load()
+
+    assert len(calls) == 1
+    assert lazyMenu.isLoaded()
+    assert len(lazyMenu.menu().menuActions()) == 5
+
+    lazyMenu.invalidate()
+    lazyMenu.load()
+    assert len(calls) == 2
+    assert len(lazyMenu.menu().menuActions()) == 5
+
+
+def test_sync_load_adjusts_size_once(app):
+    parent = RoundMenu()
+    lazyMenu = parent.addLazyMenu("Files", lambda menu: menu.addActions([QAction(str(i), menu) for i in range(20)]))
+    lazyMenu._ensureMenu()
+    counts = countAdjusts(lazyMenu.menu())
+
+    lazyMenu.load()
+    assert counts[0] == 1
+
+
+def test_async_load_adjusts_size_once(app):
+    async def provider():
+        return ["item {}".format(i) for i in range(20)]
+
+    parent = RoundMenu()
+    lazyMenu = parent.addLazyMenu("Files", provider)
+    loaded = []
+    lazyMenu.loaded.connect(lambda: loaded.append(True))
+
+    lazyMenu.load()
+    menu = lazyMenu.menu()
+    assert [a.text() for a in menu.menuActions()] == [lazyMenu.placeholderText]
+
+    counts = countAdjusts(menu)
+    waitLoaded(app, lazyMenu)
+
+    assert loaded == [True]
+    assert len(menu.menuActions()) == 20
+    assert not menu.isUpdating()
+    assert counts[0] == 1
+
+
+def test_async_load_failure(app):
+    async def provider():
+        raise ValueError("broken")
+
+    parent = RoundMenu()
+    lazyMenu = parent.addLazyMenu("Files", provider)
+    errors = []
+    lazyMenu.loadFailed.connect(errors.append)
+
+    lazyMenu.load()
+    waitLoaded(app, lazyMenu)
+
+    assert errors == ["broken"]
+    assert not lazyMenu.isLoaded()
+    assert lazyMenu.menu().menuActions()[0].text() == "broken"
+
+
+def test_invalidated_load_is_dropped(app):
+    calls = []
+
+    async def provider():
+        calls.append(True)
+        call = len(calls)
+        await asyncio.sleep(0.05)
+        return ["item {}".format(call)]
+
+    parent = RoundMenu()
+    lazyMenu = parent.addLazyMenu("Files", provider)
+    lazyMenu.load()
+    time.sleep(0.02)
+    lazyMenu.invalidate()
+    lazyMenu.load()
+    waitLoaded(app, lazyMenu)
+
+    time.sleep(0.1)
+    flushEvents(app)
+    assert [a.text() for a in lazyMenu.menu().menuActions()] == ["item 2"]
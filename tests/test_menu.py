@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QAction
+from PySide6.QtWidgets import QWidget
+from qfluentwidgets import FluentIcon as FIF
+
+from qfluentexpand.components.menu.menu import RoundMenu
+
+
+def createMenu():
+    menu = RoundMenu()
+    menu.addAction(QAction("Open", menu))
+    menu.addSeparator()
+    menu.addMenu(RoundMenu("Recent", menu))
+    menu.addAction(QAction("Save", menu))
+    return menu
+
+
+def test_insert_widget_before_separator(app):
+    menu = createMenu()
+    widget = QWidget()
+    menu.insertWidget(1, widget)
+
+    assert menu.view.row(menu.widgetItem(widget)) == 1
+    assert menu.view.count() == 5
+    texts = [a.text() for a in menu.menuActions()]
+    assert texts[0] == "Open" and texts[-1] == "Save"
+    assert menu.menuActions()[1] is menu.view.item(1).data(Qt.ItemDataRole.UserRole)
+
+
+def test_insert_widget_at_end(app):
+    menu = createMenu()
+    widget = QWidget()
+    menu.insertWidget(menu.view.count(), widget)
+    assert menu.view.row(menu.widgetItem(widget)) == 4
+
+
+def test_insert_widget_out_of_range(app):
+    menu = createMenu()
+    with pytest.raises(IndexError):
+        menu.insertWidget(9, QWidget())
+
+    with pytest.raises(IndexError):
+        menu.insertWidget(-1, QWidget())
+
+
+def createActionMenu(texts):
+    menu = RoundMenu()
+    for text in texts:
+        menu.addAction(QAction(text, menu))
+
+    return menu
+
+
+def test_find_actions_by_prefix(app):
+    menu = createActionMenu(["Save", "open", "Save As", "Close"])
+    assert [a.text() for a in menu.findActions("s")] == ["Save", "Save As"]
+    assert [a.text() for a in menu.findActions("O", 1)] == ["open"]
+    assert menu.findActions("x") == []
+
+
+def test_keyboard_search(app):
+    menu = createActionMenu(["Open", "Save", "Save As", "Close"])
+    menu.menuActions()[1].setEnabled(False)
+
+    action = menu.keyboardSearch("s")
+    assert action.text() == "Save As"
+    assert menu.view.currentItem() is menu.actionItem(action)
+
+    menu.clearTypeAhead()
+    assert menu.keyboardSearch("c").text() == "Close"
+    assert menu.keyboardSearch("x") is None
+
+
+def test_keyboard_search_cycles_same_character(app):
+    menu = createActionMenu(["Copy", "Cut", "Paste"])
+    menu.view.setCurrentItem(menu.actionItem(menu.keyboardSearch("c")))
+    assert menu.keyboardSearch("c").text() == "Cut"
+
+
+def test_type_ahead_follows_renamed_action(app):
+    menu = createActionMenu(["Open", "Save"])
+    menu.menuActions()[0].setText("Export")
+    assert menu.keyboardSearch("e").text() == "Export"
+    menu.clearTypeAhead()
+    assert menu.keyboardSearch("o") is None
+
+
+def countAdjusts(menu):
+    counts = [0]
+    adjustSize = menu.adjustSize
+
+    def adjust():
+        counts[0] += 1
+        adjustSize()
+
+    menu.adjustSize = adjust
+    return counts
+
+
+def test_batch_adjusts_size_once(app):
+    menu = RoundMenu()
+    counts = countAdjusts(menu)
+    menu.addActions([QAction(str(i), menu) for i in range(200)])
+    assert counts[0] == 1
+
+    with menu.updating():
+        with menu.updating():
+            menu.addAction(QAction("Open", menu))
+            menu.addSeparator()
+
+        assert menu.isUpdating() and counts[0] == 1
+
+    assert not menu.isUpdating() and counts[0] == 2
+
+    menu.clear()
+    assert counts[0] == 3 and not menu.menuActions()
+
+
+def test_batch_matches_unbatched_layout(app):
+    texts = ["Open", "Save as a very long file name", "Close"]
+    menu = RoundMenu()
+    for text in texts:
+        menu.addAction(QAction(text, menu))
+
+    batched = RoundMenu()
+    with batched.updating():
+        batched.addActions([QAction(text, batched) for text in texts])
+
+    assert batched.size() == menu.size()
+    assert [batched.view.item(i).sizeHint() for i in range(3)] == [menu.view.item(i).sizeHint() for i in range(3)]
+
+
+def test_batch_leaves_space_for_later_icon(app):
+    texts = ["Open", "Save as a very long file name", "Close"]
+    menu = RoundMenu()
+    menu.addAction(QAction(FIF.SAVE.icon(), "Save", menu))
+    for text in texts:
+        menu.addAction(QAction(text, menu))
+
+    # the items added before the first icon are refreshed when the batch ends
+    batched = RoundMenu()
+    with batched.updating():
+        batched.addActions([QAction(text, batched) for text in texts])
+        batched.addAction(QAction(FIF.SAVE.icon(), "Save", batched))
+
+    assert batched.size() == menu.size()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from shiboken6 import delete
+from PySide6.QtGui import QAction
+from PySide6.QtWidgets import QWidget
+
+from qfluentexpand.components.menu.menu import RoundMenu
+from qfluentexpand.components.menu.pool import MenuPool
+
+from conftest import flushEvents
+
+
+def test_menu_after_parent_menu_is_destroyed(app):
+    parent = QWidget()
+    RoundMenu(parent=parent)
+    parent.deleteLater()
+    flushEvents(app)
+
+    menu = RoundMenu()
+    assert menu.style() is not None
+
+
+def test_released_menu_is_recycled(app):
+    pool = MenuPool(capacity=2)
+    parent = QWidget()
+    menu = pool.acquire(parent=parent)
+    menu.addAction(QAction("a"))
+    pool.release(menu)
+    flushEvents(app)
+
+    assert pool.count(RoundMenu) == 1
+    assert pool.acquire(title="b") is menu
+    assert menu.menuActions() == [] and menu.title() == "b"
+
+
+def test_release_keeps_slots_of_caller(app):
+    pool = MenuPool()
+    menu = pool.acquire(releaseOnClose=True)
+    calls = []
+    menu.closedSignal.connect(lambda: calls.append(1))
+
+    menu.close()
+    flushEvents(app)
+    assert pool.count() == 1
+
+    # the slot of pool is disconnected, the menu isn't released again
+    menu = pool.acquire()
+    menu.close()
+    flushEvents(app)
+    assert calls == [1, 1]
+    assert pool.count() == 0
+
+
+def test_menu_deleted_before_recycled(app):
+    pool = MenuPool()
+    parent = QWidget()
+    menu = pool.acquire(parent=parent)
+    pool.release(menu)
+    delete(parent)
+    flushEvents(app)
+
+    assert pool.count() == 0
+    assert isinstance(pool.acquire(), RoundMenu)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import json
+import os
+
+from PySide6.QtCore import SIGNAL
+from qfluentwidgets import FluentIcon
+
+from qfluentexpand.common.mru import MRUStore
+from qfluentexpand.components.widgets.menu import ListSubMenu
+
+
+def test_touch_evicts_least_recent(app):
+    store = MRUStore(2)
+    store.touch("a")
+    store.touch("b")
+    assert store.touch("a") == []
+    assert store.touch("c") == ["b"]
+    assert store.items() == ["c", "a"]
+
+
+def test_save_is_debounced(app, tmp_path):
+    path = tmp_path / "recent.json"
+    store = MRUStore(3, str(path), saveDelay=60000)
+    store.touch("a")
+    store.touch("b")
+    assert store.isSavePending()
+    assert not path.exists()
+
+    store.flush()
+    assert not store.isSavePending()
+    assert json.loads(path.read_text(encoding="utf-8")) == ["b", "a"]
+    assert os.listdir(tmp_path) == ["recent.json"]
+
+
+def test_load_saved_items(app, tmp_path):
+    path = tmp_path / "recent.json"
+    path.write_text(json.dumps(["c", "b", "a"]), encoding="utf-8")
+
+    store = MRUStore(2, str(path))
+    store.load()
+    assert store.items() == ["c", "b"]
+
+    path.write_text("not json", encoding="utf-8")
+    store.load()
+    assert store.items() == []
+
+
+def test_list_sub_menu_order(app):
+    menu = ListSubMenu(FluentIcon.HISTORY, "Recent", ["a", "b", "c"], max_count=3)
+    menu.addFile("c")
+    menu.addFile("d")
+
+    assert menu.recent_files == ["d", "c", "a"]
+    assert [a.statusTip() for a in menu.menuActions()] == menu.recent_files
+    assert [a.statusTip() for a in menu.actions()] == menu.recent_files
+
+
+def test_list_sub_menu_max_count(app):
+    menu = ListSubMenu(FluentIcon.HISTORY, "Recent", ["a", "b"], max_count=2)
+    menu.max_count = 1
+    assert menu.store.maxCount == 1
+    assert menu.recent_files == ["a"]
+
+    menu.max_count = 0
+    menu.addFile("b")
+    assert menu.recent_files == []
+    assert [a.text() for a in menu.menuActions()] == ["None"]
+
+
+def test_moved_action_is_connected_once(app):
+    menu = ListSubMenu(FluentIcon.HISTORY, "Recent", ["a", "b"], max_count=2)
+    action = menu._fileActions["b"]
+    menu.addFile("b")
+    assert action.receivers(SIGNAL("changed()")) == 1
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import pytest
+
+from qfluentexpand.components.combox.combo_box import MSComboBox, MSEComboBox
+
+from conftest import flushEvents
+
+
+def openComboBox(app, cls, texts):
+    comboBox = cls()
+    comboBox.setItems(texts)
+    comboBox.show()
+    flushEvents(app)
+    comboBox._showComboMenu()
+    flushEvents(app)
+    return comboBox
+
+
+def closeComboBox(app, comboBox):
+    comboBox._closeComboMenu()
+    flushEvents(app)
+    comboBox.close()
+
+
+@pytest.mark.parametrize("cls", [MSComboBox, MSEComboBox])
+def test_menu_is_patched(app, cls):
+    comboBox = openComboBox(app, cls, ["a", "b", "c"])
+    menu = comboBox.comboMenu
+    comboBox._closeComboMenu()
+    flushEvents(app)
+
+    comboBox.addItem("d")
+    comboBox.insertItem(0, "z")
+    comboBox.removeItem(2)
+    assert comboBox.comboMenu is menu
+    assert menu.view.count() == 4
+    if cls is MSComboBox:
+        assert [comboBox._itemCheckBox(i).text() for i in range(4)] == ["z", "a", "c", "d"]
+
+    comboBox.setSelectedIndexes([1])
+    assert comboBox._itemCheckBox(1).isChecked()
+    assert not comboBox._itemCheckBox(0).isChecked()
+
+    comboBox._showComboMenu()
+    flushEvents(app)
+    assert comboBox.comboMenu is menu
+    closeComboBox(app, comboBox)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import pytest
+from shiboken6 import delete
+from PySide6.QtCore import SIGNAL
+from PySide6.QtGui import QAction
+
+from qfluentexpand.components.combox.combo_box import MSComboBox, ComboBoxMenu
+from qfluentexpand.components.combox.prewarm import MenuPrewarmer
+from qfluentexpand.components.menu.pool import MenuPool
+
+from conftest import flushEvents
+
+
+def startPrewarm(comboBox, steps):
+    """ schedule the combo box and run some steps of its generator """
+    prewarmer = MenuPrewarmer.instance()
+    prewarmer.schedule(comboBox)
+    entry = prewarmer._queue[id(comboBox)]
+    entry[1] = comboBox._prewarmComboMenu()
+    for _ in range(steps):
+        next(entry[1])
+
+
+def test_cancelled_prewarm_ends_update(app):
+    comboBox = MSComboBox()
+    comboBox.addItems([str(i) for i in range(20)])
+    comboBox.show()
+
+    startPrewarm(comboBox, 3)
+    menu = comboBox._prewarmMenu
+    assert menu._updateDepth == 1
+
+    comboBox._cancelPrewarm()
+    assert menu._updateDepth == 0
+    assert not MenuPrewarmer.instance().isPending(comboBox)
+    comboBox.close()
+
+
+def test_recycled_menu_is_not_updating(app):
+    menu = MenuPool.instance().acquire(ComboBoxMenu)
+    menu.beginUpdate()
+    MenuPool.instance().release(menu)
+    flushEvents(app)
+
+    menu = MenuPool.instance().acquire(ComboBoxMenu)
+    assert menu._updateDepth == 0
+    menu.addAction(QAction("item"))
+    assert not menu._isSizeDirty
+    MenuPool.instance().release(menu)
+    flushEvents(app)
+
+
+def test_reschedule_connects_destroyed_once(app):
+    comboBox = MSComboBox()
+    prewarmer = MenuPrewarmer.instance()
+    signal = SIGNAL("destroyed(QObject*)")
+    count = comboBox.receivers(signal)
+
+    for _ in range(3):
+        prewarmer.schedule(comboBox)
+        prewarmer.cancel(comboBox)
+
+    assert comboBox.receivers(signal) == count + 1
+
+
+def test_deleted_combo_box_is_dropped(app):
+    comboBox = MSComboBox()
+    comboBox.addItems([str(i) for i in range(20)])
+    comboBox.show()
+    startPrewarm(comboBox, 3)
+
+    delete(comboBox)
+    MenuPrewarmer.instance()._onIdle()
+    assert not MenuPrewarmer.instance()._queue
+
+
+def test_prewarm_error_is_raised(app, monkeypatch):
+    comboBox = MSComboBox()
+
+    def brokenPrewarm():
+        raise RuntimeError("broken")
+        yield
+
+    monkeypatch.setattr(comboBox, "_prewarmComboMenu", brokenPrewarm)
+    prewarmer = MenuPrewarmer.instance()
+    prewarmer.schedule(comboBox)
+    with pytest.raises(RuntimeError):
+        prewarmer._onIdle()
+
+    prewarmer.cancel(comboBox)
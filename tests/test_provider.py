@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import asyncio
+import time
+
+import pytest
+
+from qfluentexpand.components.combox.base import DropDownMode
+from qfluentexpand.components.combox.combo_box import MSComboBox
+from qfluentexpand.components.combox.provider import ItemProvider
+
+from conftest import flushEvents
+
+
+def texts(n):
+    return ["item {}".format(i) for i in range(n)]
+
+
+def test_iterable_pages(app):
+    provider = ItemProvider(texts(25), pageSize=10)
+    pages = []
+    provider.pageFetched.connect(pages.append)
+
+    while provider.canFetchMore():
+        provider.fetchMore()
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert provider.isFinished()
+
+
+@pytest.mark.parametrize("mode", [DropDownMode.WIDGET, DropDownMode.VIEW, DropDownMode.GRID])
+def test_scroll_fetches_next_page(app, mode):
+    comboBox = MSComboBox()
+    comboBox.setDropDownMode(mode)
+    comboBox.setItemProvider(ItemProvider(texts(1000), pageSize=50, prefetchDistance=10))
+    comboBox.show()
+    flushEvents(app)
+
+    comboBox._showComboMenu()
+    flushEvents(app)
+    assert len(comboBox.items) == 50
+
+    menu = comboBox.comboMenu
+    view = menu.view if mode == DropDownMode.WIDGET else menu.listView
+    scrollBar = view.verticalScrollBar()
+    scrollBar.setValue(scrollBar.maximum())
+    flushEvents(app)
+    assert len(comboBox.items) > 50
+
+    comboBox._closeComboMenu()
+    flushEvents(app)
+    comboBox.close()
+
+
+def test_async_pages(app):
+    async def fetch(offset, limit):
+        return texts(25)[offset:offset + limit]
+
+    provider = ItemProvider(fetch, pageSize=10)
+    pages = []
+    provider.pageFetched.connect(pages.append)
+
+    deadline = time.time() + 5
+    while not provider.isFinished() and time.time() < deadline:
+        provider.fetchMore()
+        flushEvents(app)
+        time.sleep(0.01)
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+
+
+def test_cancelled_page_is_fetched_again(app):
+    async def fetch(offset, limit):
+        await asyncio.sleep(0.05)
+        return texts(25)[offset:offset + limit]
+
+    provider = ItemProvider(fetch, pageSize=10)
+    pages = []
+    provider.pageFetched.connect(pages.append)
+
+    provider.fetchMore()
+    provider.cancel()
+    assert provider.canFetchMore()
+
+    provider.fetchMore()
+    time.sleep(0.2)
+    flushEvents(app)
+    assert pages == [texts(10)]
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+from qfluentexpand.components.combox.selection import ItemSelection
+
+
+class Item:
+
+    def __init__(self, text):
+        self.text = text
+
+
+def createSelection(n=5):
+    items = [Item(str(i)) for i in range(n)]
+    selection = ItemSelection(items)
+    changes = []
+    selection.selectionChanged.connect(lambda added, removed: changes.append((added, removed)))
+    return items, selection, changes
+
+
+def test_batch_emits_once(app):
+    items, selection, changes = createSelection()
+    assert selection.selectRows([3, 1, 1, 9])
+    assert changes == [([3, 1], [])]
+    assert selection.rows() == [3, 1]
+
+    assert not selection.selectRows([1, 3])
+    assert len(changes) == 1
+
+    selection.setSelectedRows([1, 4])
+    assert changes[-1] == ([4], [3])
+
+
+def test_selection_follows_items(app):
+    items, selection, changes = createSelection()
+    selection.selectRows([1, 3])
+
+    items.insert(0, Item("new"))
+    del items[3]
+    selection.invalidate()
+    assert selection.rows() == [2, 3]
+    assert selection.isSelected(3)
+    assert not selection.isSelected(1)
+
+
+def test_replace_item(app):
+    items, selection, changes = createSelection()
+    selection.select(2)
+
+    old = items[2]
+    items[2] = new = Item(old.text)
+    selection.replaceItem(old, new)
+    assert selection.selectedItems() == [new]
+    assert selection.row(old) == 2
+
+
+def test_invert_selection(app):
+    items, selection, changes = createSelection(4)
+    selection.select(1)
+    selection.invertSelection()
+    assert sorted(selection.rows()) == [0, 2, 3]
+    assert changes[-1][1] == [1]
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import random
+
+from qfluentexpand.common.text_index import TextIndex
+
+
+WORDS = ["Apple", "apricot", "Banana", "band", "b", "café", "Cafe", "zeta", "Zed", ""]
+
+
+def expectedPrefixRows(texts, prefix):
+    prefix = prefix.casefold()
+    return [row for _, row in sorted((t.casefold(), row) for row, t in enumerate(texts) if t.casefold().startswith(prefix))]
+
+
+def test_prefix_rows_are_ordered_by_text():
+    index = TextIndex(["band", "Apple", "Banana", "apricot"])
+    assert index.prefixRows("a") == [1, 3]
+    assert index.prefixTexts("BAN") == ["Banana", "band"]
+    assert index.prefixRows("b", limit=1) == [2]
+    assert index.find("band") == 0
+    assert index.find("missing") == -1
+
+
+def test_random_changes_match_list():
+    rand = random.Random(1)
+    index, texts = TextIndex(), []
+    for _ in range(2000):
+        op = rand.random()
+        if op < 0.4 or not texts:
+            row, text = rand.randint(0, len(texts)), rand.choice(WORDS)
+            index.insert(row, text)
+            texts.insert(row, text)
+        elif op < 0.7:
+            row = rand.randrange(len(texts))
+            index.remove(row)
+            texts.pop(row)
+        elif op < 0.9:
+            row, text = rand.randrange(len(texts)), rand.choice(WORDS)
+            index.setText(row, text)
+            texts[row] = text
+        else:
+            words = [rand.choice(WORDS) for _ in range(3)]
+            index.extend(words)
+            texts.extend(words)
+
+        prefix = rand.choice(["a", "b", "ca", "z", "", "ban"])
+        assert index.prefixRows(prefix) == expectedPrefixRows(texts, prefix)
+
+        text = rand.choice(WORDS)
+        assert index.find(text) == (texts.index(text) if text in texts else -1)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+author: Reiner
+email: nbxlc@hotmail.com
+"""
+
+
+import asyncio
+import time
+
+from qfluentexpand.common.worker import CoroutineRunner, runningLoop
+
+from conftest import flushEvents
+
+
+def waitFor(app, condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        flushEvents(app)
+        time.sleep(0.01)
+
+
+def createRunner():
+    runner = CoroutineRunner()
+    results, errors = [], []
+    runner.finished.connect(results.append)
+    runner.failed.connect(errors.append)
+    return runner, results, errors
+
+
+async def double(value, delay=0):
+    await asyncio.sleep(delay)
+    return value * 2
+
+
+async def fail():
+    raise ValueError("broken")
+
+
+def test_running_loop():
+    assert runningLoop() is None
+
+    async def main():
+        return runningLoop()
+
+    assert asyncio.run(main()) is not None
+
+
+def test_run_in_thread(app):
+    runner, results, errors = createRunner()
+    runner.run(double(21))
+    assert runner.isRunning()
+
+    waitFor(app, lambda: not runner.isRunning())
+    assert results == [42] and errors == []
+
+    runner.run(fail())
+    waitFor(app, lambda: not runner.isRunning())
+    assert errors == ["broken"]
+
+
+def test_run_on_running_loop(app):
+    runner, results, errors = createRunner()
+
+    async def main():
+        runner.run(double(21))
+        while runner.isRunning():
+            await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+    assert results == [42]
+
+
+def test_cancelled_result_is_dropped(app):
+    runner, results, errors = createRunner()
+    runner.run(double(1, 0.05))
+    runner.run(double(2))
+    waitFor(app, lambda: not runner.isRunning())
+
+    runner.run(double(3, 0.05))
+    runner.cancel()
+    time.sleep(0.1)
+    flushEvents(app)
+    assert results == [4] and errors == []
+
+
+def test_runner_deleted_while_running(app):
+    runner, results, errors = createRunner()
+    runner.run(double(1, 0.05))
+    runner.deleteLater()
+    flushEvents(app)
+
+    time.sleep(0.1)
+    flushEvents(app)
+    assert results == []